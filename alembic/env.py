@@ -21,7 +21,7 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here for 'autogenerate' support
 from app.db.base import Base
-from app.db.models import owner_model, car_model, claim_model, policy_model, user_model
+from app.db.models import owner_model, car_model, claim_model, policy_model, user_model, revoked_token_model, api_key_model, refresh_token_model, row_count_model, tombstone_model
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
@@ -61,6 +61,14 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Tests hand in their own connection through config.attributes
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
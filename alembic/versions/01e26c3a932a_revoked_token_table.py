@@ -0,0 +1,35 @@
+"""revoked token table
+
+Revision ID: 01e26c3a932a
+Revises: c40fdee08f23
+Create Date: 2026-10-18 09:17:57.545968
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '01e26c3a932a'
+down_revision: Union[str, Sequence[str], None] = 'c40fdee08f23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('revoked_token',
+    sa.Column('jti', sa.String(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('jti')
+    )
+    op.create_index('ix_revoked_token_expires_at', 'revoked_token', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_revoked_token_expires_at', table_name='revoked_token')
+    op.drop_table('revoked_token')
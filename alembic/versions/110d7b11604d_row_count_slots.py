@@ -0,0 +1,51 @@
+"""row count slots
+
+Revision ID: 110d7b11604d
+Revises: 773eadf2121e
+Create Date: 2026-10-18 10:30:29.239073
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '110d7b11604d'
+down_revision: Union[str, Sequence[str], None] = '773eadf2121e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTED_TABLES = ("car", "owner", "claim", "insurance_policy")
+# Must match app.db.row_counts.ROW_COUNT_SLOTS
+ROW_COUNT_SLOTS = 8
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Counters are derived data: rebuild the table with (table_name, slot) rows and reseed it
+    op.drop_table('row_count')
+    op.create_table('row_count',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('slot', sa.SmallInteger(), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name', 'slot')
+    )
+    for table in COUNTED_TABLES:
+        op.execute(f"INSERT INTO row_count (table_name, slot, count) SELECT '{table}', 0, count(*) FROM {table}")
+        for slot in range(1, ROW_COUNT_SLOTS):
+            op.execute(f"INSERT INTO row_count (table_name, slot, count) VALUES ('{table}', {slot}, 0)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('row_count')
+    op.create_table('row_count',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+    for table in COUNTED_TABLES:
+        op.execute(f"INSERT INTO row_count (table_name, count) SELECT '{table}', count(*) FROM {table}")
@@ -0,0 +1,32 @@
+"""car vin trigram index
+
+Revision ID: 2b8122f73486
+Revises: bbbb3b032ef1
+Create Date: 2026-10-18 09:50:13.390186
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b8122f73486'
+down_revision: Union[str, Sequence[str], None] = 'bbbb3b032ef1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Substring VIN search (/api/cars/search). SQLite uses the prefix range scan on ix_car_vin instead.
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_car_vin_trgm ON car USING gin (vin gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_car_vin_trgm")
@@ -0,0 +1,42 @@
+"""api key table
+
+Revision ID: 39984abf5429
+Revises: 01e26c3a932a
+Create Date: 2026-10-18 09:20:45.800852
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '39984abf5429'
+down_revision: Union[str, Sequence[str], None] = '01e26c3a932a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('api_key',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key_hash', sa.String(length=64), nullable=False),
+    sa.Column('prefix', sa.String(length=12), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_api_key_key_hash', 'api_key', ['key_hash'], unique=True)
+    op.create_index('ix_api_key_user_id', 'api_key', ['user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_api_key_user_id', table_name='api_key')
+    op.drop_index('ix_api_key_key_hash', table_name='api_key')
+    op.drop_table('api_key')
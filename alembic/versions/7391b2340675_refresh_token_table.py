@@ -0,0 +1,42 @@
+"""refresh token table
+
+Revision ID: 7391b2340675
+Revises: 39984abf5429
+Create Date: 2026-10-18 09:26:56.260649
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7391b2340675'
+down_revision: Union[str, Sequence[str], None] = '39984abf5429'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('refresh_token',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('token_hash', sa.String(length=64), nullable=False),
+    sa.Column('family_id', sa.String(length=32), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_refresh_token_token_hash', 'refresh_token', ['token_hash'], unique=True)
+    op.create_index('ix_refresh_token_family_id', 'refresh_token', ['family_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_refresh_token_family_id', table_name='refresh_token')
+    op.drop_index('ix_refresh_token_token_hash', table_name='refresh_token')
+    op.drop_table('refresh_token')
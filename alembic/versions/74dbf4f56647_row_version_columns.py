@@ -0,0 +1,35 @@
+"""row version columns
+
+Revision ID: 74dbf4f56647
+Revises: 14bbf5526c43
+Create Date: 2026-10-18 09:55:50.964191
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '74dbf4f56647'
+down_revision: Union[str, Sequence[str], None] = '14bbf5526c43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+VERSIONED_TABLES = ("car", "owner", "insurance_policy", "claim")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows start at '0'; the ORM writes a new random version on every insert and update
+    for table in VERSIONED_TABLES:
+        op.add_column(table, sa.Column('version', sa.String(length=32), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Plain DROP COLUMN (SQLite >= 3.35): a batch table copy would lose the owner expression indexes
+    for table in VERSIONED_TABLES:
+        op.drop_column(table, 'version')
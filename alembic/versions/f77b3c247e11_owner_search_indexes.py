@@ -0,0 +1,35 @@
+"""owner search indexes
+
+Revision ID: f77b3c247e11
+Revises: 2b8122f73486
+Create Date: 2026-10-18 09:51:25.229144
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f77b3c247e11'
+down_revision: Union[str, Sequence[str], None] = '2b8122f73486'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        # text_pattern_ops lets LIKE 'prefix%' use the index under any collation
+        op.execute("CREATE INDEX ix_owner_lower_name ON owner (lower(name) text_pattern_ops)")
+        op.execute("CREATE INDEX ix_owner_lower_email ON owner (lower(email) text_pattern_ops)")
+    else:
+        op.create_index('ix_owner_lower_name', 'owner', [sa.text('lower(name)')], unique=False)
+        op.create_index('ix_owner_lower_email', 'owner', [sa.text('lower(email)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_owner_lower_email', table_name='owner')
+    op.drop_index('ix_owner_lower_name', table_name='owner')
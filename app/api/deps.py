@@ -1,7 +1,12 @@
-from typing import AsyncGenerator
+from datetime import datetime, timedelta
+from typing import AsyncGenerator, Literal, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import AsyncSessionLocal
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Query, status
+from app.core.config import get_settings
+from app.db.pagination import PageRequest
+from app.utils.dates import to_utc_naive, utcnow_naive
+from app.schemas.car_schema import CarFilter
 from app.service.validity_service import ValidityService
 from app.db.repositories.car_repository import CarRepository
 from app.service.car_service import CarService
@@ -13,6 +18,70 @@ from app.db.repositories.owner_repository import OwnerRepository
 from app.service.owner_service import OwnerService
 from app.db.repositories.user_repository import UserRepository
 from app.service.user_service import UserService
+from app.db.repositories.api_key_repository import ApiKeyRepository
+from app.service.api_key_service import ApiKeyService
+from app.db.repositories.refresh_token_repository import RefreshTokenRepository
+from app.service.token_service import TokenService
+from app.db.repositories.tombstone_repository import TombstoneRepository
+from app.service.tombstone_service import TombstoneService
+
+settings = get_settings()
+
+def get_page_request(
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.PAGE_SIZE_MAX, description="Page size; enables keyset pagination"),
+    cursor: Optional[str] = Query(default=None, description="Opaque token from the X-Next-Cursor header of the previous page"),
+) -> Optional[PageRequest]:
+    # Pagination is opt-in: without limit or cursor list endpoints return everything, as before
+    if limit is None and cursor is None:
+        return None
+    return PageRequest(limit=limit or settings.PAGE_SIZE_DEFAULT, cursor=cursor)
+
+def sync_horizon() -> datetime:
+    """
+    updated_at / deleted_at come from the app clock at flush time, not at commit, so a slow
+    transaction can commit rows stamped before what a mirror has already read. Delta listings
+    only return rows older than this horizon; newer ones show up on the next poll, and the
+    newest timestamp a client has seen is always a safe value for its next updatedSince.
+    """
+    return utcnow_naive() - timedelta(seconds=settings.SYNC_SAFETY_LAG_SECONDS)
+
+def get_sync_page_request(
+    updated_since: Optional[datetime] = Query(
+        default=None,
+        alias="updatedSince",
+        description=(
+            "Only rows changed at or after this time, oldest first; repeat it with ?cursor= for later pages. "
+            "Changes from the last SYNC_SAFETY_LAG_SECONDS are held back until the next poll"
+        ),
+    ),
+    page: Optional[PageRequest] = Depends(get_page_request),
+) -> Optional[PageRequest]:
+    if updated_since is None:
+        return page
+    page = page or PageRequest(limit=settings.PAGE_SIZE_DEFAULT)
+    page.sort = "updatedAt"
+    page.since = to_utc_naive(updated_since)
+    page.until = sync_horizon()
+    return page
+
+def get_count_mode(
+    count: Optional[Literal["exact", "estimate"]] = Query(
+        default=None,
+        description="Adds X-Total-Count: exact from maintained counters, or a planner estimate on Postgres",
+    ),
+) -> Optional[str]:
+    return count
+
+def get_car_filter(
+    make: Optional[str] = Query(default=None),
+    model: Optional[str] = Query(default=None),
+    year_from: Optional[int] = Query(default=None, alias="yearFrom", description="Minimum yearOfManufacture, inclusive"),
+    year_to: Optional[int] = Query(default=None, alias="yearTo", description="Maximum yearOfManufacture, inclusive"),
+    owner_id: Optional[int] = Query(default=None, alias="ownerId"),
+) -> CarFilter:
+    if year_from is not None and year_to is not None and year_from > year_to:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="yearFrom must not be greater than yearTo")
+    return CarFilter(make=make, model=model, year_from=year_from, year_to=year_to, owner_id=owner_id)
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as s:
@@ -58,4 +127,22 @@ async def get_user_service(
     session: AsyncSession = Depends(get_async_session),
 ):
     user_repository = UserRepository(session)
-    return UserService(user_repository)
\ No newline at end of file
+    return UserService(user_repository)
+
+async def get_api_key_service(
+    session: AsyncSession = Depends(get_async_session),
+):
+    api_key_repository = ApiKeyRepository(session)
+    return ApiKeyService(api_key_repository)
+
+async def get_token_service(
+    session: AsyncSession = Depends(get_async_session),
+):
+    refresh_token_repository = RefreshTokenRepository(session)
+    return TokenService(refresh_token_repository)
+
+async def get_tombstone_service(
+    session: AsyncSession = Depends(get_async_session),
+):
+    tombstone_repository = TombstoneRepository(session)
+    return TombstoneService(tombstone_repository)
@@ -0,0 +1,25 @@
+# app/api/errors.py
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm.exc import StaleDataError
+from app.core.deadline import DeadlineExceeded
+from app.utils.logging_utils import log
+
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+    log.warning("request_deadline_exceeded", path=request.url.path)
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "Request deadline exceeded"},
+    )
+
+async def stale_data_handler(request: Request, exc: StaleDataError):
+    # Row version changed between our read and our write
+    log.warning("concurrent_update_conflict", path=request.url.path)
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": "Resource was modified concurrently, retry the request"},
+    )
+
+def register_exception_handlers(app: FastAPI) -> None:
+    app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+    app.add_exception_handler(StaleDataError, stale_data_handler)
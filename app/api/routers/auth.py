@@ -1,36 +1,141 @@
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi import APIRouter, Depends, HTTPException, Request
 from app.schemas.user_schema import User, UserCreate
+from app.schemas.api_key_schema import ApiKeyCreate, ApiKeyCreated, ApiKeyResponse
 from app.service import user_service
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.auth.jwt import create_access_token
-from app.core.security import verify_password
+from app.auth.jwt import verify_token
+from app.auth.oauth2 import oauth2_scheme, get_current_user, TokenRequestForm
+from app.auth.revocation import revocation_list
+from app.core.security import verify_password_async
+from app.core.rate_limit import login_throttle
 from app.api.deps import get_async_session
 from app.db.repositories.user_repository import UserRepository
 from app.service.user_service import UserService
 from fastapi import status
 from app.utils.logging_utils import log_event
-from app.api.deps import get_user_service
+from app.api.deps import get_user_service, get_api_key_service, get_token_service
+from app.service.api_key_service import ApiKeyService
+from app.service.token_service import TokenService
+from typing import List
+from app.core.config import get_settings
 
 router = APIRouter(tags=["auth"])
+settings = get_settings()
 
 @router.post("/token")
 @log_event("user_login_attempt")
 async def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(),
-    user_service: user_service.UserService = Depends(get_user_service)
+    request: Request,
+    form_data: TokenRequestForm = Depends(),
+    user_service: user_service.UserService = Depends(get_user_service),
+    token_service: TokenService = Depends(get_token_service),
 ):
+    if form_data.grant_type == "refresh_token":
+        if not form_data.refresh_token:
+            raise HTTPException(status_code=400, detail="refresh_token is required")
+        try:
+            return await token_service.refresh_tokens(form_data.refresh_token)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=str(e),
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+    # Throttle before the user lookup and bcrypt, so a login flood costs almost nothing
+    client_ip = request.client.host if request.client else None
+    retry_after = await login_throttle.check(form_data.username, client_ip)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(retry_after)},
+        )
     user = await user_service.get_user_by_username(form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=400,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token = create_access_token(data={"sub": user.username})
-    return {"access_token": access_token, "token_type": "bearer"}
+    return await token_service.issue_tokens(user)
 
 @router.post("/users/", response_model=User, status_code=status.HTTP_201_CREATED)
 @log_event("user_creation")
 async def create_user(user: UserCreate, user_service: user_service.UserService = Depends(get_user_service)):
-    return await user_service.create_user(user)
+    try:
+        return await user_service.create_user(user)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/users/bulk", response_model=dict, status_code=status.HTTP_201_CREATED)
+@log_event("user_bulk_creation")
+async def create_users_bulk(
+    users: List[UserCreate],
+    current_user = Depends(get_current_user),
+    user_service: user_service.UserService = Depends(get_user_service),
+):
+    if not getattr(current_user, "is_superuser", False):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only administrators can create users in bulk")
+    if len(users) > settings.BULK_USER_MAX:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BULK_USER_MAX} users can be created per request",
+        )
+    try:
+        created = await user_service.create_users(users)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"created": created}
+
+@router.post("/token/revoke", status_code=status.HTTP_204_NO_CONTENT)
+@log_event("token_revoke")
+async def revoke_token(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_async_session),
+):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    token_data = verify_token(token, credentials_exception)
+    if not token_data.jti or not token_data.expires_at:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Token cannot be revoked")
+    await revocation_list.revoke(session, token_data.jti, token_data.expires_at)
+
+@router.post("/api-keys/", response_model=ApiKeyCreated, status_code=status.HTTP_201_CREATED)
+@log_event("api_key_creation")
+async def create_api_key(
+    api_key_create: ApiKeyCreate,
+    current_user = Depends(get_current_user),
+    api_key_service: ApiKeyService = Depends(get_api_key_service),
+):
+    api_key, raw_key = await api_key_service.create_api_key(current_user.id, api_key_create.name)
+    return ApiKeyCreated(
+        id=api_key.id,
+        name=api_key.name,
+        prefix=api_key.prefix,
+        is_active=api_key.is_active,
+        created_at=api_key.created_at,
+        api_key=raw_key,
+    )
+
+@router.get("/api-keys/", response_model=List[ApiKeyResponse])
+@log_event("list_api_keys")
+async def list_api_keys(
+    current_user = Depends(get_current_user),
+    api_key_service: ApiKeyService = Depends(get_api_key_service),
+):
+    return await api_key_service.list_api_keys(current_user.id)
+
+@router.delete("/api-keys/{api_key_id}", status_code=status.HTTP_204_NO_CONTENT)
+@log_event("api_key_revoke")
+async def revoke_api_key(
+    api_key_id: int,
+    current_user = Depends(get_current_user),
+    api_key_service: ApiKeyService = Depends(get_api_key_service),
+):
+    try:
+        await api_key_service.revoke_api_key(current_user.id, api_key_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,30 +1,106 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Optional, Literal
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.api.deps import get_car_service, get_validity_service # trebuie să returneze AsyncSession
+from app.api.deps import get_car_service, get_validity_service, get_sync_page_request, get_car_filter, get_count_mode # trebuie să returneze AsyncSession
 from app.db.models.car_model import Car
 from app.service.car_service import CarService
-from app.schemas.car_schema import CarWithOwnerResponse, CarCreate, CarUpdate, CarResponse
+from app.schemas.car_schema import CarWithOwnerResponse, CarCreate, CarUpdate, CarResponse, CarFilter
 from app.auth.oauth2 import get_current_user
 from fastapi import Response
 from app.service.validity_service import ValidityService
 from datetime import date
 from app.utils.logging_utils import log_event
+from app.utils.serialization import orm_json_response, json_response, accepts_ndjson, ndjson_response
+from app.core.config import get_settings
+from app.db.pagination import PageRequest, NEXT_CURSOR_HEADER
+from app.utils.etag import entity_etag, matching_etag, not_modified
 
 router = APIRouter(prefix="/api/cars", tags=["cars"], dependencies=[Depends(get_current_user)])
+settings = get_settings()
 
 @router.get("/", response_model=List[CarWithOwnerResponse])
 @log_event("list_cars")
-async def list_cars(service: CarService = Depends(get_car_service)):
-    cars = await service.list_cars_with_owner()
-    return cars
+async def list_cars(
+    request: Request,
+    response: Response,
+    service: CarService = Depends(get_car_service),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return, e.g. id,vin,owner.name"),
+    page: Optional[PageRequest] = Depends(get_sync_page_request),
+    filters: CarFilter = Depends(get_car_filter),
+    sort: Literal["id", "vin", "yearOfManufacture"] = Query(default="id", description="Sort key (ties broken by id)"),
+    count: Optional[str] = Depends(get_count_mode),
+):
+    if count:
+        total = await service.count_cars(count == "estimate", filters)
+        response.headers.update(total.headers())
+    if page:
+        if page.since is None:
+            page.sort = sort
+        try:
+            if fields:
+                rows, next_cursor = await service.list_cars_projected_page(fields, page, filters)
+            else:
+                rows, next_cursor = await service.list_cars_page(page, filters)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        if fields:
+            return json_response(rows, headers=response.headers)
+        return orm_json_response(CarWithOwnerResponse, rows, response=response)
+    if fields:
+        try:
+            return json_response(await service.list_cars_projected(fields, filters, sort), headers=response.headers)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if accepts_ndjson(request):
+        return ndjson_response(
+            CarWithOwnerResponse,
+            service.stream_cars_with_owner(settings.STREAM_BATCH_SIZE, filters, sort),
+            headers=response.headers,
+        )
+    cars = await service.list_cars_with_owner(filters, sort)
+    return orm_json_response(CarWithOwnerResponse, cars, response=response)
+
+@router.get("/search", response_model=List[CarResponse])
+@log_event("search_cars_by_vin")
+async def search_cars_by_vin(
+    vin: str = Query(description="VIN prefix or fragment; prefix matches are listed first"),
+    limit: int = Query(default=settings.SEARCH_LIMIT_DEFAULT, ge=1, le=settings.SEARCH_LIMIT_MAX),
+    service: CarService = Depends(get_car_service),
+):
+    try:
+        cars = await service.search_cars_by_vin(vin, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return orm_json_response(CarResponse, cars)
 
 @router.get("/{car_id}", response_model=CarResponse)
 @log_event("get_car")
-async def get_car(car_id: int, service: CarService = Depends(get_car_service)):
+async def get_car(
+    car_id: int,
+    request: Request,
+    response: Response,
+    service: CarService = Depends(get_car_service),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return, e.g. id,vin,owner.name"),
+):
+    if fields:
+        try:
+            car = await service.get_car_projected(car_id, fields)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if not car:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Car not found")
+        return json_response(car)
+    if "if-none-match" in request.headers:
+        version = await service.get_car_version(car_id)
+        matched = matching_etag(request, entity_etag(version) if version else None)
+        if matched:
+            return not_modified(matched)
     car = await service.get_car(car_id)
     if not car:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Car not found")
+    response.headers["ETag"] = entity_etag(car.version)
     return car
 
 @router.get("/{car_id}/insurance-valid", response_model=dict)
@@ -32,16 +108,14 @@ async def get_car(car_id: int, service: CarService = Depends(get_car_service)):
 async def insurance_valid(
     car_id: int,
     date: date,
-    car_service: CarService = Depends(get_car_service),
     validity_service: ValidityService = Depends(get_validity_service)
 ):
-    car = await car_service.get_car(car_id)
-    if not car:
+    # The same query tells whether the car exists, so a missing car is still a 404 before the date check
+    valid = await validity_service.is_valid(car_id, date)
+    if valid is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Car not found")
-    #
     if date.year < 1900 or date.year > 2100:
         raise HTTPException(status_code=400, detail="Invalid date format or out of range (1900-2100)")
-    valid = await validity_service.is_valid(car_id, date)
     return {"carId": car_id, "date": date, "valid": valid}
 
 @router.get("/by-vin/{vin}", response_model=CarResponse)
@@ -1,10 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from app.auth.oauth2 import get_current_user
 from app.utils.events import claim_created
 from app.utils.logging_utils import log_event
+from app.utils.serialization import orm_json_response, accepts_ndjson, ndjson_response
+from app.core.config import get_settings
+from app.db.pagination import PageRequest, NEXT_CURSOR_HEADER
 from fastapi import Response
-from app.api.deps import get_car_service, get_claim_service
+from app.api.deps import get_car_service, get_claim_service, get_sync_page_request, get_count_mode
 from app.service.car_service import CarService
 from app.db.models.claim_model import Claim
 from app.schemas.claim_schema import ClaimResponse
@@ -12,6 +15,7 @@ from app.service.claim_service import ClaimService
 from app.schemas.claim_schema import ClaimCreate
 
 router = APIRouter(prefix="/api/cars", tags=["claims"], dependencies=[Depends(get_current_user)])
+settings = get_settings()
 
 @router.post("/{car_id}/claims/", status_code=status.HTTP_201_CREATED)
 @log_event("create_claim_for_car")
@@ -50,8 +54,27 @@ async def get_claim_for_car(car_id: int, claim_id: int, claim_service: ClaimServ
 
 @router.get("/claims/", response_model=List[ClaimResponse])
 @log_event("get_claims")
-async def get_claims(claim_service: ClaimService = Depends(get_claim_service)):
-    return await claim_service.list_claims()
+async def get_claims(
+    request: Request,
+    response: Response,
+    claim_service: ClaimService = Depends(get_claim_service),
+    page: Optional[PageRequest] = Depends(get_sync_page_request),
+    count: Optional[str] = Depends(get_count_mode),
+):
+    if count:
+        total = await claim_service.count_claims(count == "estimate")
+        response.headers.update(total.headers())
+    if page:
+        try:
+            rows, next_cursor = await claim_service.list_claims_page(page)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return orm_json_response(ClaimResponse, rows, response=response)
+    if accepts_ndjson(request):
+        return ndjson_response(ClaimResponse, claim_service.stream_claims(settings.STREAM_BATCH_SIZE), headers=response.headers)
+    return orm_json_response(ClaimResponse, await claim_service.list_claims(), response=response)
 
 @router.get("/{car_id}/claims", response_model=List[ClaimResponse])
 @log_event("list_claims_for_car")
@@ -60,7 +83,7 @@ async def list_claims_for_car(
     claim_service: ClaimService = Depends(get_claim_service)
 ):
     claims = await claim_service.get_claims_by_car_id(car_id)
-    return claims
+    return orm_json_response(ClaimResponse, claims)
 
 @router.delete("/{car_id}/claims/{claim_id}", status_code=status.HTTP_204_NO_CONTENT)
 @log_event("delete_claim_for_car")
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, status
 from app.utils.logging_utils import log_event
+from app.core import metrics
 
 router = APIRouter(tags=["health"])
 
@@ -7,3 +8,7 @@ router = APIRouter(tags=["health"])
 
 async def health_status():
     return {"status": "ok"}
+
+@router.get("/metrics", response_model=dict, status_code=status.HTTP_200_OK)
+async def metrics_snapshot():
+    return metrics.snapshot()
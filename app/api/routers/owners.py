@@ -1,27 +1,96 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from app.auth.oauth2 import get_current_user
 from fastapi import Response
-from app.api.deps import get_owner_service 
+from app.api.deps import get_owner_service, get_sync_page_request, get_count_mode
 from app.db.models.owner_model import Owner
 from app.service.owner_service import OwnerService
 from app.schemas.owner_schema import OwnerCreate, OwnerUpdate, OwnerResponse
 from app.utils.logging_utils import log_event
+from app.utils.serialization import orm_json_response, json_response, accepts_ndjson, ndjson_response
+from app.core.config import get_settings
+from app.db.pagination import PageRequest, NEXT_CURSOR_HEADER
+from app.utils.etag import entity_etag, matching_etag, not_modified
 
 router = APIRouter(prefix="/api/owners", tags=["owners"], dependencies=[Depends(get_current_user)])
+settings = get_settings()
 
 @router.get("/", response_model=List[OwnerResponse])
 @log_event("list_owners")
-async def list_owners(service: OwnerService = Depends(get_owner_service)):
+async def list_owners(
+    request: Request,
+    response: Response,
+    service: OwnerService = Depends(get_owner_service),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return, e.g. id,name"),
+    page: Optional[PageRequest] = Depends(get_sync_page_request),
+    count: Optional[str] = Depends(get_count_mode),
+):
+    if count:
+        total = await service.count_owners(count == "estimate")
+        response.headers.update(total.headers())
+    if page:
+        try:
+            if fields:
+                rows, next_cursor = await service.list_owners_projected_page(fields, page)
+            else:
+                rows, next_cursor = await service.list_owners_page(page)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        if fields:
+            return json_response(rows, headers=response.headers)
+        return orm_json_response(OwnerResponse, rows, response=response)
+    if fields:
+        try:
+            return json_response(await service.list_owners_projected(fields), headers=response.headers)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if accepts_ndjson(request):
+        return ndjson_response(OwnerResponse, service.stream_owners(settings.STREAM_BATCH_SIZE), headers=response.headers)
     owners = await service.list_owners()
-    return owners
+    return orm_json_response(OwnerResponse, owners, response=response)
+
+@router.get("/search", response_model=List[OwnerResponse])
+@log_event("search_owners")
+async def search_owners(
+    name: Optional[str] = Query(default=None, description="Case-insensitive name prefix"),
+    email: Optional[str] = Query(default=None, description="Case-insensitive email or email prefix; exact matches first"),
+    limit: int = Query(default=settings.SEARCH_LIMIT_DEFAULT, ge=1, le=settings.SEARCH_LIMIT_MAX),
+    service: OwnerService = Depends(get_owner_service),
+):
+    try:
+        owners = await service.search_owners(name, email, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return orm_json_response(OwnerResponse, owners)
 
 @router.get("/{owner_id}", response_model=OwnerResponse)
 @log_event("get_owner")
-async def get_owner(owner_id: int, service: OwnerService = Depends(get_owner_service)):
+async def get_owner(
+    owner_id: int,
+    request: Request,
+    response: Response,
+    service: OwnerService = Depends(get_owner_service),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return, e.g. id,name"),
+):
+    if fields:
+        try:
+            owner = await service.get_owner_projected(owner_id, fields)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if not owner:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Owner not found")
+        return json_response(owner)
+    if "if-none-match" in request.headers:
+        version = await service.get_owner_version(owner_id)
+        matched = matching_etag(request, entity_etag(version) if version else None)
+        if matched:
+            return not_modified(matched)
     owner = await service.get_owner(owner_id)
     if not owner:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Owner not found")
+    response.headers["ETag"] = entity_etag(owner.version)
     return owner
 
 @router.post("/", response_model=OwnerResponse, status_code=status.HTTP_201_CREATED)
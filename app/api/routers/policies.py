@@ -1,17 +1,21 @@
-from datetime import date
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from app.auth.oauth2 import get_current_user
-from app.api.deps import get_car_service, get_policy_service, get_validity_service
+from app.api.deps import get_car_service, get_policy_service, get_sync_page_request, get_count_mode
 from app.db.models.policy_model import InsurancePolicy
 from app.service.policy_service import PolicyService
 from app.schemas.policy_schema import InsurancePolicyCreate, InsurancePolicyResponse
 from app.service.car_service import CarService
 from app.utils.events import policy_created
 from app.utils.logging_utils import log_event
+from app.utils.serialization import orm_json_response, accepts_ndjson, ndjson_response
+from app.utils.etag import collection_etag, matching_etag, not_modified
+from app.core.config import get_settings
+from app.db.pagination import PageRequest, NEXT_CURSOR_HEADER
 
 
 router = APIRouter(prefix="/api/cars", tags=["policies"], dependencies=[Depends(get_current_user)])
+settings = get_settings()
 
 @router.post("/{car_id}/policies/", status_code=status.HTTP_201_CREATED)
 @log_event("create_policy_for_car")
@@ -49,15 +53,43 @@ async def get_policy_for_car(car_id: int, policy_id: int, policy_service: Policy
 @log_event("list_policies_for_car")
 async def list_policies_for_car(
     car_id: int,
+    request: Request,
+    response: Response,
     policy_service: PolicyService = Depends(get_policy_service)
 ):
+    if "if-none-match" in request.headers:
+        matched = matching_etag(request, collection_etag(await policy_service.get_policy_versions_by_car_id(car_id)))
+        if matched:
+            return not_modified(matched)
     policies = await policy_service.get_policies_by_car_id(car_id)
-    return policies
+    response.headers["ETag"] = collection_etag((policy.id, policy.version) for policy in policies)
+    return orm_json_response(InsurancePolicyResponse, policies, response=response)
 
 @router.get("/policies/", response_model=List[InsurancePolicyResponse])
 @log_event("get_policies")
-async def get_policies(policy_service: PolicyService = Depends(get_policy_service)):
-    return await policy_service.list_policies()
+async def get_policies(
+    request: Request,
+    response: Response,
+    policy_service: PolicyService = Depends(get_policy_service),
+    page: Optional[PageRequest] = Depends(get_sync_page_request),
+    count: Optional[str] = Depends(get_count_mode),
+):
+    if count:
+        total = await policy_service.count_policies(count == "estimate")
+        response.headers.update(total.headers())
+    if page:
+        try:
+            rows, next_cursor = await policy_service.list_policies_page(page)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return orm_json_response(InsurancePolicyResponse, rows, response=response)
+    if accepts_ndjson(request):
+        return ndjson_response(
+            InsurancePolicyResponse, policy_service.stream_policies(settings.STREAM_BATCH_SIZE), headers=response.headers
+        )
+    return orm_json_response(InsurancePolicyResponse, await policy_service.list_policies(), response=response)
 
 @router.delete("/{car_id}/policies/{policy_id}", status_code=status.HTTP_204_NO_CONTENT)
 @log_event("delete_policy_for_car")
@@ -70,24 +102,3 @@ async def delete_policy_for_car(
     if not policy or policy.car_id != car_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Policy not found for this car")
     await policy_service.delete_policy(policy_id)
-
-
-@router.get("/{car_id}/insurance-valid")
-@log_event("check_insurance_validity_for_car")
-async def check_insurance_validity_for_car(
-    car_id: int,
-    date: date,
-    policy_service: PolicyService = Depends(get_policy_service),
-    car_service: CarService = Depends(get_car_service)
-):
-    car = await car_service.get_car(car_id)
-    if not car:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Car not found")
-    # Accept only dates between 1900-01-01 and 2100-12-31
-    if not (date(1900, 1, 1) <= date <= date(2100, 12, 31)):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Date must be between 1900-01-01 and 2100-12-31"
-        )
-    is_valid = await policy_service.is_active_policy_exists_for_car(car_id, date)
-    return {"car_id": car_id, "date": date.isoformat(), "valid": is_valid}
\ No newline at end of file
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from app.auth.oauth2 import get_current_user
+from app.api.deps import get_tombstone_service, get_page_request, sync_horizon
+from app.service.tombstone_service import TombstoneService
+from app.schemas.tombstone_schema import TombstoneResponse
+from app.utils.dates import to_utc_naive
+from app.utils.logging_utils import log_event
+from app.utils.serialization import orm_json_response
+from app.core.config import get_settings
+from app.db.pagination import PageRequest, NEXT_CURSOR_HEADER
+
+router = APIRouter(prefix="/api/tombstones", tags=["sync"], dependencies=[Depends(get_current_user)])
+settings = get_settings()
+
+@router.get("/", response_model=List[TombstoneResponse])
+@log_event("list_tombstones")
+async def list_tombstones(
+    response: Response,
+    service: TombstoneService = Depends(get_tombstone_service),
+    entity: Optional[Literal["car", "owner", "insurance_policy", "claim"]] = Query(default=None),
+    deleted_since: Optional[datetime] = Query(default=None, alias="deletedSince", description="Only deletes at or after this time"),
+    page: Optional[PageRequest] = Depends(get_page_request),
+):
+    # Always paginated, oldest first, so mirrors can resume from the last cursor
+    page = page or PageRequest(limit=settings.PAGE_SIZE_DEFAULT)
+    page.sort = "deletedAt"
+    page.since = to_utc_naive(deleted_since) if deleted_since else None
+    page.until = sync_horizon()
+    try:
+        rows, next_cursor = await service.list_tombstones_page(page, entity)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return orm_json_response(TombstoneResponse, rows, response=response)
@@ -0,0 +1,61 @@
+import hashlib
+import hmac
+import secrets
+from typing import Optional
+from fastapi import HTTPException, Security, status
+from fastapi.security import APIKeyHeader
+from app.core.config import get_settings
+from app.core import metrics
+from app.db.session import AsyncSessionLocal
+from app.db.repositories.api_key_repository import ApiKeyRepository
+from app.utils.cache import TTLCache
+
+settings = get_settings()
+API_KEY_HEADER = "X-API-Key"
+api_key_header = APIKeyHeader(name=API_KEY_HEADER, auto_error=False)
+
+_PEPPER = (settings.API_KEY_PEPPER or settings.SECRET_KEY).encode()
+_NOT_FOUND = False
+
+# key hash -> User (or _NOT_FOUND for unknown / revoked keys)
+api_key_cache = TTLCache(
+    maxsize=settings.API_KEY_CACHE_MAX_SIZE,
+    ttl=settings.API_KEY_CACHE_TTL_SECONDS,
+)
+metrics.register("api_key_cache", api_key_cache.stats)
+
+def hash_api_key(raw_key: str) -> str:
+    # Keyed fast hash: keys are 256-bit random, so bcrypt-style stretching adds nothing
+    return hmac.new(_PEPPER, raw_key.encode(), hashlib.sha256).hexdigest()
+
+def generate_api_key() -> str:
+    return "ci_" + secrets.token_urlsafe(32)
+
+def invalidate_api_key(key_hash: str) -> None:
+    api_key_cache.invalidate(key_hash)
+
+def invalidate_user_api_keys(user_id: int) -> None:
+    # Call wherever the user's principal is invalidated (update, deactivation); process-local like it
+    api_key_cache.invalidate_where(lambda _, user: getattr(user, "id", None) == user_id)
+
+async def authenticate_api_key(raw_key: str):
+    key_hash = hash_api_key(raw_key)
+    cached = api_key_cache.get(key_hash)
+    if cached is not None:
+        return cached or None
+    async with AsyncSessionLocal() as session:
+        user = await ApiKeyRepository(session).get_active_user_by_hash(key_hash)
+    if user is not None and not user.is_active:
+        user = None
+    api_key_cache.set(key_hash, user if user is not None else _NOT_FOUND)
+    return user
+
+async def get_api_key_user(api_key: Optional[str] = Security(api_key_header)):
+    user = await authenticate_api_key(api_key) if api_key else None
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key",
+            headers={"WWW-Authenticate": API_KEY_HEADER},
+        )
+    return user
@@ -1,7 +1,12 @@
 from jose import JWTError, jwt
 from app.schemas.user_schema import TokenData
 from app.core.config import get_settings
+from app.core import metrics
+from app.utils.cache import TTLCache
 import datetime
+import hashlib
+import time
+import uuid
 from datetime import timedelta
 
 settings = get_settings()
@@ -9,20 +14,50 @@ SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+# sha256(token) -> TokenData; each entry expires at the token's own `exp`
+verified_token_cache = TTLCache(
+    maxsize=max(settings.TOKEN_CACHE_MAX_SIZE, 1),
+    ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+metrics.register("verified_token_cache", verified_token_cache.stats)
+
+def build_token_claims(user) -> dict:
+    claims = {"sub": user.username}
+    if settings.STATELESS_TOKENS:
+        # Self-contained token: enough to authenticate without loading the user
+        claims.update({"uid": user.id, "active": bool(user.is_active), "su": bool(user.is_superuser)})
+    return claims
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.datetime.now(datetime.timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str, credentials_exception):
+    cache_key = hashlib.sha256(token.encode()).digest()
+    if settings.TOKEN_CACHE_MAX_SIZE > 0:
+        cached = verified_token_cache.get(cache_key)
+        if cached is not None:
+            return cached
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
-        token_data = TokenData(username=username)
+        exp = payload.get("exp")
+        token_data = TokenData(
+            username=username,
+            user_id=payload.get("uid"),
+            is_active=payload.get("active"),
+            is_superuser=payload.get("su"),
+            jti=payload.get("jti"),
+            expires_at=datetime.datetime.fromtimestamp(exp, datetime.timezone.utc) if exp else None,
+        )
     except JWTError:
         raise credentials_exception
+    if settings.TOKEN_CACHE_MAX_SIZE > 0 and exp:
+        verified_token_cache.set(cache_key, token_data, ttl=exp - time.time())
     return token_data
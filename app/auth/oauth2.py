@@ -1,26 +1,84 @@
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+from fastapi import Depends, Form, HTTPException, Security, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
+from app.core import timing
 from app.auth.jwt import verify_token
-from app.api.deps import get_async_session
+from app.auth.principal_cache import get_cached_principal, cache_principal
+from app.auth.revocation import revocation_list
+from app.auth.api_keys import api_key_header, authenticate_api_key
+from app.db.session import AsyncSessionLocal
 from app.db.models.user_model import User
 from app.service.user_service import UserService
 from app.db.repositories.user_repository import UserRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+# get_current_user also accepts an API key, so a missing bearer token is not an error by itself
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 settings = get_settings()
 
-async def get_current_user(session: AsyncSession = Depends(get_async_session), token: str = Depends(oauth2_scheme)):
+class TokenRequestForm:
+    """
+    Like OAuth2PasswordRequestForm, but also accepts grant_type=refresh_token
+    (username/password are then not required).
+    """
+    def __init__(
+        self,
+        grant_type: str = Form(default="password", pattern="^(password|refresh_token)$"),
+        username: str = Form(default=""),
+        password: str = Form(default=""),
+        refresh_token: Optional[str] = Form(default=None),
+        scope: str = Form(default=""),
+    ):
+        self.grant_type = grant_type
+        self.username = username
+        self.password = password
+        self.refresh_token = refresh_token
+        self.scopes = scope.split()
+
+async def get_current_user(
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    api_key: Optional[str] = Security(api_key_header),
+):
+    with timing.measure("auth"):
+        return await _authenticate(token, api_key)
+
+async def _authenticate(token: Optional[str], api_key: Optional[str]):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    if api_key:
+        user = await authenticate_api_key(api_key)
+        if user is None:
+            raise credentials_exception
+        return user
+    if not token:
+        raise credentials_exception
     token_data = verify_token(token, credentials_exception)
-    userService = UserService(UserRepository(session))
-    user = await userService.get_user_by_username(token_data.username)
+    if token_data.jti:
+        await revocation_list.ensure_fresh()
+        if revocation_list.is_revoked(token_data.jti):
+            raise credentials_exception
+    if settings.STATELESS_TOKENS and token_data.user_id is not None:
+        # Self-contained token: no database I/O at all
+        if not token_data.is_active:
+            raise credentials_exception
+        return User(
+            id=token_data.user_id,
+            username=token_data.username,
+            is_active=True,
+            is_superuser=bool(token_data.is_superuser),
+        )
+    user = get_cached_principal(token_data.username)
     if user is None:
-        raise credentials_exception
+        # Session is opened only on a cache miss, so cached requests never check out a connection
+        async with AsyncSessionLocal() as session:
+            userService = UserService(UserRepository(session))
+            user = await userService.get_user_by_username(token_data.username)
+        if user is None:
+            raise credentials_exception
+        cache_principal(token_data.username, user)
     return user
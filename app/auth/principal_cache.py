@@ -0,0 +1,31 @@
+from app.core.config import get_settings
+from app.core import metrics
+from app.utils.cache import TTLCache
+
+settings = get_settings()
+
+# token subject (username) -> User detached from its session
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+metrics.register("principal_cache", principal_cache.stats)
+
+def get_cached_principal(username: str):
+    if settings.PRINCIPAL_CACHE_TTL_SECONDS <= 0:
+        return None
+    return principal_cache.get(username)
+
+def cache_principal(username: str, user) -> None:
+    if settings.PRINCIPAL_CACHE_TTL_SECONDS <= 0:
+        return
+    principal_cache.set(username, user)
+
+def invalidate_principal(username: str) -> None:
+    # Call on every change / deactivation of the user. Invalidation is process-local;
+    # other workers see the change after at most PRINCIPAL_CACHE_TTL_SECONDS.
+    principal_cache.invalidate(username)
+
+def invalidate_principal_id(user_id: int) -> None:
+    # Covers username changes, where the old subject is no longer known to the caller.
+    principal_cache.invalidate_where(lambda _, user: getattr(user, "id", None) == user_id)
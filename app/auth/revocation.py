@@ -0,0 +1,77 @@
+import asyncio
+import datetime
+import time
+from typing import Callable, Optional
+from app.core.config import get_settings
+from app.core import metrics
+from app.db.session import AsyncSessionLocal
+from app.db.repositories.revoked_token_repository import RevokedTokenRepository
+from app.utils.logging_utils import log
+from app.utils.dates import utcnow_naive
+
+settings = get_settings()
+
+class RevocationList:
+    """
+    In-memory set of revoked token ids (jti), reloaded from the revoked_token table
+    every `refresh_seconds`. Lookups never touch the database; reloads run in the background.
+    """
+    def __init__(self, refresh_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._jtis: set[str] = set()
+        self._loaded_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._jtis
+
+    @property
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or self._clock() - self._loaded_at >= self.refresh_seconds
+
+    async def refresh(self) -> None:
+        async with AsyncSessionLocal() as session:
+            jtis = await RevokedTokenRepository(session).list_active_jtis(utcnow_naive())
+        self._jtis = set(jtis)
+        self._loaded_at = self._clock()
+        self.refreshes += 1
+
+    async def _refresh_quietly(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as exc:
+            self.refresh_failures += 1
+            # keep serving the previous set; retry on the next request
+            self._loaded_at = self._clock()
+            log.error("token_revocation_refresh_failed", error=str(exc))
+
+    async def ensure_fresh(self) -> None:
+        if self._loaded_at is None:
+            # The first load is awaited so a revoked token cannot slip through at startup
+            await self.refresh()
+        elif self.is_stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh_quietly())
+
+    async def revoke(self, session, jti: str, expires_at: datetime.datetime) -> None:
+        if expires_at.tzinfo is not None:
+            expires_at = expires_at.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        await RevokedTokenRepository(session).add(jti, expires_at)
+        self._jtis.add(jti)
+
+    def clear(self) -> None:
+        self._jtis = set()
+        self._loaded_at = None
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._jtis),
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+        }
+
+
+revocation_list = RevocationList(refresh_seconds=settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+metrics.register("token_revocation", revocation_list.stats)
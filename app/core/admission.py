@@ -0,0 +1,182 @@
+# app/core/admission.py
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.config import get_settings
+from app.core import metrics
+
+settings = get_settings()
+
+class AdmissionLimiter:
+    """
+    Caps concurrent requests of one route group. Requests over the limit wait in a
+    bounded FIFO queue for at most queue_timeout seconds; a full queue rejects at once.
+
+    With adaptive=True the limit follows AIMD on observed latency: +1/limit per fast
+    response, *backoff (at most once per target_latency) when responses get slower than
+    target_latency, never below min_limit nor above max_in_flight.
+    """
+    def __init__(
+        self,
+        name: str,
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout: float,
+        adaptive: bool = False,
+        target_latency: float = 0.5,
+        min_limit: int = 1,
+        backoff: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.adaptive = adaptive
+        self.target_latency = target_latency
+        self.min_limit = min(min_limit, max_in_flight)
+        self.backoff = backoff
+        self._clock = clock
+        self._limit = float(max_in_flight)
+        self._last_decrease = float("-inf")
+        self._waiters: "deque[asyncio.Future]" = deque()
+        self.in_flight = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.max_queue_depth = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            self.timeouts += 1
+            return False
+        except asyncio.CancelledError:
+            # Client went away while queued; hand a slot we may already own to the next waiter
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._discard(waiter)
+            raise
+        self.admitted += 1
+        return True
+
+    def release(self, latency: Optional[float] = None) -> None:
+        self.in_flight -= 1
+        if self.adaptive and latency is not None:
+            self._adapt(latency)
+        self._wake()
+
+    def _adapt(self, latency: float) -> None:
+        if latency > self.target_latency:
+            now = self._clock()
+            if now - self._last_decrease >= self.target_latency:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                self._last_decrease = now
+        else:
+            self._limit = min(float(self.max_in_flight), self._limit + 1 / self._limit)
+
+    def _wake(self) -> None:
+        # The slot is passed straight to the waiter (in_flight is counted here, not by the waiter)
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(True)
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
+
+class AdmissionControlMiddleware:
+    """
+    Routes each HTTP request to the limiter of its group (longest matching path prefix).
+    Paths outside every group (/health, /metrics) bypass admission control, so probes keep
+    answering under overload. Rejected requests get a fast 503 with Retry-After.
+    """
+    def __init__(self, app: ASGIApp, limiters: Dict[str, AdmissionLimiter], retry_after: int = 1):
+        self.app = app
+        self.retry_after = retry_after
+        self._prefixes = sorted(limiters.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def limiter_for(self, path: str) -> Optional[AdmissionLimiter]:
+        for prefix, limiter in self._prefixes:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return limiter
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limiter = self.limiter_for(scope["path"]) if scope["type"] == "http" else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+        if not await limiter.acquire():
+            response = JSONResponse(
+                {"detail": "Service overloaded, retry later"},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(time.perf_counter() - start)
+
+def build_limiters() -> Dict[str, AdmissionLimiter]:
+    limiters = {
+        prefix: AdmissionLimiter(
+            name=prefix,
+            max_in_flight=max_in_flight,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+            adaptive=settings.ADMISSION_ADAPTIVE,
+            target_latency=settings.ADMISSION_TARGET_LATENCY_MS / 1000,
+            min_limit=settings.ADMISSION_MIN_LIMIT,
+        )
+        for prefix, max_in_flight in settings.ADMISSION_GROUPS.items()
+    }
+    metrics.register("admission", lambda: {prefix: l.stats() for prefix, l in limiters.items()})
+    return limiters
@@ -0,0 +1,204 @@
+# app/core/compression.py
+import time
+import zlib
+from typing import Optional
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core import metrics, timing
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/", "application/javascript")
+
+def choose_encoding(accept_encoding: str, brotli_available: bool = brotli is not None) -> Optional[str]:
+    """Picks br or gzip from an Accept-Encoding header, honouring q-values (q=0 refuses)."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli_available else []) + ["gzip"]
+    best, best_q = None, 0.0
+    for encoding in candidates:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31 -> gzip container
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        # Flushed per chunk so streamed rows reach the client without waiting for the buffer
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gz.flush(zlib.Z_FINISH)
+
+    def whole(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.finish()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_FINISH)
+
+class CompressionStats:
+    def __init__(self):
+        self.responses = 0
+        self.streamed = 0
+        self.offloaded = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def stats(self) -> dict:
+        return {
+            "responses": self.responses,
+            "streamed": self.streamed,
+            "offloaded": self.offloaded,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else 0.0,
+        }
+
+compression_stats = CompressionStats()
+metrics.register("compression", compression_stats.stats)
+
+class CompressionMiddleware:
+    """
+    Negotiated br/gzip compression for text-like responses.
+    - single-body responses below minimum_size are sent as-is;
+    - bodies of at least thread_threshold bytes are compressed in a worker thread,
+      so a multi-megabyte list does not stall the event loop;
+    - streaming responses are compressed chunk by chunk (no Content-Length).
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        thread_threshold: int = 256 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.thread_threshold = thread_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+class _CompressionResponder:
+    def __init__(self, config: CompressionMiddleware, encoding: Optional[str], send: Send):
+        self.config = config
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            eligible = (
+                message["status"] not in (204, 304)
+                and "content-encoding" not in headers
+                and content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            if not eligible:
+                self.passthrough = True
+                await self.downstream(message)
+                return
+            # The response depends on Accept-Encoding whether or not this client gets it compressed
+            MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+            if self.encoding is None:
+                self.passthrough = True
+                await self.downstream(message)
+                return
+            self.start_message = message  # held until we know the body size
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None and not more_body:
+            await self._send_single(body)
+            return
+
+        if self.start_message is not None:
+            # First chunk of a streaming response
+            self.compressor = _Compressor(self.encoding, self.config.gzip_level, self.config.brotli_quality)
+            headers = self._start(self.start_message)
+            del headers["content-length"]
+            await self.downstream(self.start_message)
+            self.start_message = None
+            compression_stats.responses += 1
+            compression_stats.streamed += 1
+
+        data = self.compressor.chunk(body) if body else b""
+        if not more_body:
+            data += self.compressor.finish()
+        compression_stats.bytes_in += len(body)
+        compression_stats.bytes_out += len(data)
+        await self.downstream({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _start(self, start_message: Message) -> MutableHeaders:
+        headers = MutableHeaders(scope=start_message)
+        headers["content-encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # A strong ETag names exact bytes, so the compressed variant gets its own
+            headers["etag"] = f'{etag[:-1]}-{self.encoding}"'
+        return headers
+
+    async def _send_single(self, body: bytes) -> None:
+        start_message, self.start_message = self.start_message, None
+        if len(body) < self.config.minimum_size:
+            await self.downstream(start_message)
+            await self.downstream({"type": "http.response.body", "body": body})
+            return
+        compressor = _Compressor(self.encoding, self.config.gzip_level, self.config.brotli_quality)
+        started = time.perf_counter()
+        if len(body) >= self.config.thread_threshold:
+            compressed = await anyio.to_thread.run_sync(compressor.whole, body)
+            compression_stats.offloaded += 1
+        else:
+            compressed = compressor.whole(body)
+        timing.record("compress", time.perf_counter() - started)
+        compression_stats.responses += 1
+        compression_stats.bytes_in += len(body)
+        compression_stats.bytes_out += len(compressed)
+        headers = self._start(start_message)
+        headers["content-length"] = str(len(compressed))
+        await self.downstream(start_message)
+        await self.downstream({"type": "http.response.body", "body": compressed})
@@ -21,6 +21,46 @@ class Settings(BaseSettings):
     CORS_ALLOW_ORIGINS: list[str] = ["*"]
 
     LOG_FILE_PATH: str = "logs/app.log"
+    SERVER_TIMING_ENABLED: Optional[bool] = None   # default: on in development, off in production
+
+    PAGE_SIZE_DEFAULT: int = 100                   # page size when only ?cursor= is given
+    PAGE_SIZE_MAX: int = 500                       # upper bound for ?limit= on list endpoints
+    SYNC_SAFETY_LAG_SECONDS: float = 5             # delta listings hold back rows changed this recently (commit lag)
+    STREAM_BATCH_SIZE: int = 500                   # rows fetched per round trip for application/x-ndjson lists
+    SEARCH_LIMIT_DEFAULT: int = 20                 # results returned by search endpoints without ?limit=
+    SEARCH_LIMIT_MAX: int = 100                    # upper bound for ?limit= on search endpoints
+    VIN_SEARCH_MIN_LENGTH: int = 3                 # shortest VIN fragment; trigram indexes need 3 characters
+    FAST_JSON_ENABLED: bool = True                 # list endpoints serialize ORM rows with orjson, skipping response_model validation
+
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024               # bytes; smaller bodies are sent uncompressed
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4            # used when the brotli package is installed
+    COMPRESSION_THREAD_THRESHOLD: int = 262_144    # bodies at least this big are compressed off the event loop
+
+    REQUEST_TIMEOUT_SECONDS: float = 30            # request deadline, also bounds DB statements; 0 disables
+    REQUEST_TIMEOUT_MAX_SECONDS: float = 120       # cap for the client-supplied timeout header
+    REQUEST_TIMEOUT_HEADER: str = "x-request-timeout"
+
+    SINGLE_FLIGHT_ENABLED: bool = True             # coalesce concurrent identical GETs
+    SINGLE_FLIGHT_PATH_PREFIXES: list[str] = ["/api/"]
+    SINGLE_FLIGHT_MAX_WAITERS: int = 100           # per key; extra requests run on their own
+    SINGLE_FLIGHT_MAX_BODY_BYTES: int = 8_388_608  # larger responses are not shared
+
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_GROUPS: dict[str, int] = {           # path prefix -> max in-flight requests
+        "/api/cars": 32,
+        "/api/owners": 16,
+        "/token": 8,
+        "/users": 8,
+        "/api-keys": 8,
+    }
+    ADMISSION_MAX_QUEUE: int = 64                  # waiting requests per group before shedding with 503
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    ADMISSION_ADAPTIVE: bool = False               # AIMD on latency, bounded by the group's max in-flight
+    ADMISSION_TARGET_LATENCY_MS: float = 500
+    ADMISSION_MIN_LIMIT: int = 2
 
     DATABASE_URL: Optional[str] = None
     DATABASE_URL_SYNC: Optional[str] = None
@@ -28,6 +68,32 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    STATELESS_TOKENS: bool = False                 # tokens carry uid/active/su; auth needs no DB lookup
+    TOKEN_REVOCATION_REFRESH_SECONDS: int = 30
+    TOKEN_REVOCATION_PURGE_MINUTES: int = 60       # worker job deleting revocations of already expired tokens
+    TOKEN_CACHE_MAX_SIZE: int = 10_000             # verified-token cache; 0 disables it
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    REFRESH_TOKEN_PURGE_MINUTES: int = 60          # worker job deleting expired refresh tokens
+
+    API_KEY_PEPPER: Optional[str] = None           # HMAC key for API key hashes; defaults to SECRET_KEY
+    API_KEY_CACHE_TTL_SECONDS: int = 60
+    API_KEY_CACHE_MAX_SIZE: int = 10_000
+
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_IP_CAPACITY: int = 30         # burst size per client IP
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 30     # sustained attempts per client IP
+    LOGIN_RATE_LIMIT_USER_CAPACITY: int = 5
+    LOGIN_RATE_LIMIT_USER_PER_MINUTE: float = 5
+    RATE_LIMIT_MAX_KEYS: int = 100_000             # buckets kept in memory per limiter
+    RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"
+    REDIS_URL: Optional[str] = None
+
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60          # 0 disables the cache
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+
+    PASSWORD_HASH_WORKERS: int = 4                 # max concurrent bcrypt operations per worker
+    BULK_USER_MAX: int = 5_000                     # users accepted by one /users/bulk call
+    BULK_PASSWORD_HASH_WORKERS: int = 1            # separate bcrypt pool for /users/bulk, so logins never queue behind it
 
     model_config = SettingsConfigDict(
         env_file=".env.development",               # util local; în producție folosește env vars / secrets
@@ -75,6 +141,12 @@ class Settings(BaseSettings):
         if v: return v
         return "DEBUG" if info.data.get("ENV", Env.development) is Env.development else "INFO"
 
+    @field_validator("SERVER_TIMING_ENABLED", mode="before")
+    @classmethod
+    def default_server_timing(cls, v, info):
+        if v is not None and v != "": return v
+        return info.data.get("ENV", Env.development) is Env.development
+
 @lru_cache
 def get_settings() -> Settings:
     return Settings()
@@ -0,0 +1,120 @@
+# app/core/deadline.py
+import time
+from contextvars import ContextVar
+from typing import Optional
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Progress handler granularity: SQLite VM instructions between deadline checks
+SQLITE_PROGRESS_STEPS = 1000
+
+class DeadlineExceeded(Exception):
+    """The request ran out of time budget; mapped to 504 in app.api.errors."""
+
+# Absolute time.monotonic() deadline of the current request, None when unbounded
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+def set_deadline(timeout: Optional[float]):
+    return _deadline.set(None if not timeout or timeout <= 0 else time.monotonic() + timeout)
+
+def reset_deadline(token) -> None:
+    _deadline.reset(token)
+
+def get_deadline() -> Optional[float]:
+    return _deadline.get()
+
+def remaining() -> Optional[float]:
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+def check() -> None:
+    if expired():
+        raise DeadlineExceeded("Request deadline exceeded")
+
+class DeadlineMiddleware:
+    """
+    Gives each HTTP request a deadline: default_timeout seconds, or what the client asks
+    for in the timeout header (seconds), capped at max_timeout.
+    """
+    def __init__(self, app: ASGIApp, default_timeout: float, max_timeout: float, header: str = "x-request-timeout"):
+        self.app = app
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+        self.header = header
+
+    def timeout_for(self, scope: Scope) -> float:
+        requested = Headers(scope=scope).get(self.header)
+        if requested:
+            try:
+                value = float(requested)
+            except ValueError:
+                value = 0
+            if value > 0:
+                return min(value, self.max_timeout) if self.max_timeout > 0 else value
+        return self.default_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = set_deadline(self.timeout_for(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_deadline(token)
+
+def instrument_engine(sync_engine) -> None:
+    """
+    Turns the remaining request budget into a per-statement timeout:
+    SET LOCAL statement_timeout on Postgres, a progress-handler interrupt on SQLite.
+    Statements issued after the deadline fail before reaching the database, and
+    timeouts surface as DeadlineExceeded.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.util import await_only
+
+    dialect = sync_engine.dialect.name
+
+    if dialect == "sqlite":
+        @event.listens_for(sync_engine, "connect")
+        def _install_progress_handler(dbapi_connection, connection_record):
+            state = connection_record.info["deadline"] = {"at": None}
+
+            def handler():
+                at = state["at"]
+                # Runs in the driver's thread, so it reads the deadline from state, not the contextvar
+                return 1 if at is not None and time.monotonic() >= at else 0
+
+            driver_connection = getattr(dbapi_connection, "driver_connection", dbapi_connection)
+            result = driver_connection.set_progress_handler(handler, SQLITE_PROGRESS_STEPS)
+            if result is not None:  # aiosqlite: coroutine executed on its own thread
+                await_only(result)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _apply_deadline(conn, cursor, statement, parameters, context, executemany):
+        deadline = _deadline.get()
+        if dialect == "sqlite":
+            state = conn.info.get("deadline")
+            if state is not None:
+                state["at"] = deadline
+        if deadline is None:
+            return
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise DeadlineExceeded("Request deadline exceeded")
+        if dialect == "postgresql":
+            cursor.execute(f"SET LOCAL statement_timeout = {max(1, int(left * 1000))}")
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _translate_timeout(exception_context):
+        if isinstance(exception_context.original_exception, DeadlineExceeded):
+            raise exception_context.original_exception
+        if _deadline.get() is None:
+            return
+        message = str(exception_context.original_exception).lower()
+        if expired() or "statement timeout" in message or "interrupted" in message:
+            raise DeadlineExceeded("Request deadline exceeded") from exception_context.original_exception
@@ -0,0 +1,11 @@
+# app/core/metrics.py
+from typing import Callable, Dict
+
+# Simple registry of in-process counters, exposed by /metrics (per worker).
+_providers: Dict[str, Callable[[], dict]] = {}
+
+def register(name: str, provider: Callable[[], dict]) -> None:
+    _providers[name] = provider
+
+def snapshot() -> dict:
+    return {name: provider() for name, provider in _providers.items()}
@@ -1,18 +1,36 @@
 # middleware.py
 import uuid
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
 REQUEST_ID_HEADER = "x-request-id"
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        rid = request.headers.get(REQUEST_ID_HEADER, str(uuid.uuid4()))
-        bind_contextvars(request_id=rid, path=str(request.url.path), method=request.method)
+class RequestIdMiddleware:
+    """
+    Pure ASGI middleware: reads or generates x-request-id, binds it to the structlog
+    context and echoes it on the response. Unlike BaseHTTPMiddleware it runs in the
+    request's own task and leaves the response body (including streams) untouched.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rid = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if rid is None:
+            rid = str(uuid.uuid4())
+        bind_contextvars(request_id=rid, path=scope["path"], method=scope["method"])
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = rid
+            await send(message)
+
         try:
-            response = await call_next(request)
-            response.headers[REQUEST_ID_HEADER] = rid
-            return response
+            await self.app(scope, receive, send_with_request_id)
         finally:
             clear_contextvars()
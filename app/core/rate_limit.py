@@ -0,0 +1,156 @@
+# app/core/rate_limit.py
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+from app.core.config import get_settings
+from app.core import metrics
+from app.utils.logging_utils import log
+
+class TokenBucketLimiter:
+    """
+    In-memory token buckets, one per key. Buckets live in an LRU map capped at `max_keys`,
+    so a flood of distinct keys costs bounded memory (an evicted key simply starts full again).
+    """
+    def __init__(self, capacity: float, refill_per_second: float, max_keys: int,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def acquire_nowait(self, key: str, tokens: float = 1) -> float:
+        """Takes `tokens` from the bucket; returns 0 if allowed, else seconds until it would be."""
+        now = self._clock()
+        available, updated_at = self._buckets.get(key, (self.capacity, now))
+        available = min(self.capacity, available + (now - updated_at) * self.refill_per_second)
+        if available >= tokens:
+            available -= tokens
+            retry_after = 0.0
+            self.allowed += 1
+        else:
+            retry_after = (tokens - available) / self.refill_per_second
+            self.rejected += 1
+        self._buckets[key] = (available, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+            self.evictions += 1
+        return retry_after
+
+    async def acquire(self, key: str, tokens: float = 1) -> float:
+        return self.acquire_nowait(key, tokens)
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._buckets),
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "evictions": self.evictions,
+        }
+
+
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local retry = 0
+if tokens >= requested then
+  tokens = tokens - requested
+else
+  retry = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(retry)
+"""
+
+class RedisTokenBucketLimiter:
+    """
+    Same token-bucket semantics shared across workers through redis (one atomic script call).
+    Falls back to a local limiter when redis is unreachable, so login keeps working.
+    """
+    def __init__(self, redis_url: str, namespace: str, capacity: float, refill_per_second: float,
+                 fallback: TokenBucketLimiter):
+        import redis.asyncio as redis
+        self._redis = redis.from_url(redis_url)
+        self._script = self._redis.register_script(_REDIS_TOKEN_BUCKET)
+        self.namespace = namespace
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._fallback = fallback
+        self.allowed = 0
+        self.rejected = 0
+        self.backend_errors = 0
+
+    async def acquire(self, key: str, tokens: float = 1) -> float:
+        try:
+            retry_after = float(await self._script(
+                keys=[f"{self.namespace}:{key}"],
+                args=[self.capacity, self.refill_per_second, tokens],
+            ))
+        except Exception as exc:
+            self.backend_errors += 1
+            log.warning("rate_limit_backend_unavailable", error=str(exc))
+            return await self._fallback.acquire(key, tokens)
+        if retry_after > 0:
+            self.rejected += 1
+        else:
+            self.allowed += 1
+        return retry_after
+
+    def stats(self) -> dict:
+        return {
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "backend_errors": self.backend_errors,
+            "fallback": self._fallback.stats(),
+        }
+
+
+def build_limiter(namespace: str, capacity: float, refill_per_minute: float):
+    settings = get_settings()
+    refill_per_second = refill_per_minute / 60
+    local = TokenBucketLimiter(capacity, refill_per_second, settings.RATE_LIMIT_MAX_KEYS)
+    if settings.RATE_LIMIT_BACKEND == "redis" and settings.REDIS_URL:
+        return RedisTokenBucketLimiter(settings.REDIS_URL, namespace, capacity, refill_per_second, local)
+    return local
+
+
+class LoginThrottle:
+    """Per-client-IP and per-username buckets, checked before any password work is done."""
+    def __init__(self, ip_limiter, user_limiter):
+        self.ip_limiter = ip_limiter
+        self.user_limiter = user_limiter
+
+    async def check(self, username: str, client_ip: Optional[str]) -> int:
+        """Returns 0 if the attempt may proceed, else the Retry-After value in seconds."""
+        if not get_settings().LOGIN_RATE_LIMIT_ENABLED:
+            return 0
+        retry_after = await self.ip_limiter.acquire(client_ip or "unknown")
+        if not retry_after:
+            retry_after = await self.user_limiter.acquire((username or "").strip().lower())
+        return math.ceil(retry_after) if retry_after else 0
+
+    def stats(self) -> dict:
+        return {"ip": self.ip_limiter.stats(), "username": self.user_limiter.stats()}
+
+
+_settings = get_settings()
+login_throttle = LoginThrottle(
+    ip_limiter=build_limiter("login:ip", _settings.LOGIN_RATE_LIMIT_IP_CAPACITY,
+                             _settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE),
+    user_limiter=build_limiter("login:user", _settings.LOGIN_RATE_LIMIT_USER_CAPACITY,
+                               _settings.LOGIN_RATE_LIMIT_USER_PER_MINUTE),
+)
+metrics.register("login_throttle", login_throttle.stats)
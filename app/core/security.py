@@ -1,4 +1,8 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
+from app.core.config import get_settings
+from app.core import metrics
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -7,3 +11,61 @@ def verify_password(plain_password, hashed_password):
 
 def get_password_hash(password):
     return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop on a bounded thread pool (bcrypt releases the GIL).
+    At most `max_workers` hashes run at once; the rest wait in the executor queue.
+    """
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pwd-hash")
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.in_flight - self.max_workers)
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def verify(self, plain_password, hashed_password) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password) -> str:
+        return await self._run(get_password_hash, password)
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+        }
+
+
+password_hasher = PasswordHasher(max_workers=get_settings().PASSWORD_HASH_WORKERS)
+metrics.register("password_hasher", password_hasher.stats)
+# Bulk onboarding hashes thousands of passwords; it gets its own pool instead of the login one
+bulk_password_hasher = PasswordHasher(max_workers=get_settings().BULK_PASSWORD_HASH_WORKERS)
+metrics.register("bulk_password_hasher", bulk_password_hasher.stats)
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def get_password_hash_async(password) -> str:
+    return await password_hasher.hash(password)
+
+async def get_password_hash_bulk_async(password) -> str:
+    return await bulk_password_hasher.hash(password)
@@ -0,0 +1,148 @@
+# app/core/single_flight.py
+import asyncio
+import hashlib
+from typing import Dict, List, Optional, Sequence, Tuple
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core import metrics
+
+# Headers that define who is asking and in which format; requests only coalesce when all match.
+# Add the deadline header through key_headers so only requests with the same time budget share a leader.
+KEY_HEADERS = ("authorization", "x-api-key", "cookie", "accept", "if-none-match")
+# Streamed formats go straight through: followers would only get bytes once the whole stream ended
+STREAMING_MEDIA_TYPES = ("application/x-ndjson",)
+
+class _Flight:
+    __slots__ = ("result", "waiters")
+
+    def __init__(self):
+        self.result: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.waiters = 0
+
+class SingleFlightMiddleware:
+    """
+    Coalesces concurrent identical GETs (same path, query string, credentials and Accept): the first
+    request runs, the others wait for it and receive a copy of its response. Only 2xx responses
+    are shared: non-2xx statuses (a 504 from the leader's own deadline, a 503, a 500), responses
+    larger than max_body_bytes, streamed responses (more_body), failed leaders, or keys with
+    max_waiters already waiting fall back to running the request normally; waiters are released
+    as soon as the leader's response turns out not to be shareable. Requests accepting a
+    streaming media type are never coalesced.
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: Sequence[str] = ("/api/",),
+        max_waiters: int = 100,
+        max_body_bytes: int = 8 * 1024 * 1024,
+        key_headers: Sequence[str] = KEY_HEADERS,
+        streaming_media_types: Sequence[str] = STREAMING_MEDIA_TYPES,
+    ):
+        self.app = app
+        self.key_headers = tuple(name.lower() for name in key_headers)
+        self.path_prefixes = tuple(path_prefixes)
+        self.max_waiters = max_waiters
+        self.max_body_bytes = max_body_bytes
+        self.streaming_media_types = tuple(streaming_media_types)
+        self._flights: Dict[Tuple, _Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.overflow = 0
+        self.fallbacks = 0
+        self.streaming_bypassed = 0
+        metrics.register("single_flight", self.stats)
+
+    def key_for(self, scope: Scope) -> Tuple:
+        headers = Headers(scope=scope)
+        variant = hashlib.sha256(
+            b"\0".join(headers.get(name, "").encode("latin-1") for name in self.key_headers)
+        ).digest()
+        return (scope["path"], scope.get("query_string", b""), variant)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+        accept = Headers(scope=scope).get("accept", "")
+        if any(media_type in accept for media_type in self.streaming_media_types):
+            self.streaming_bypassed += 1
+            await self.app(scope, receive, send)
+            return
+
+        key = self.key_for(scope)
+        flight = self._flights.get(key)
+        if flight is None:
+            await self._lead(key, scope, receive, send)
+            return
+        if flight.waiters >= self.max_waiters:
+            self.overflow += 1
+            await self.app(scope, receive, send)
+            return
+
+        flight.waiters += 1
+        try:
+            messages = await asyncio.shield(flight.result)
+        finally:
+            flight.waiters -= 1
+        if messages is None:
+            self.fallbacks += 1
+            await self.app(scope, receive, send)
+            return
+        self.coalesced += 1
+        for message in messages:
+            # Outer middlewares mutate headers in place, so every follower gets its own copy
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message["headers"])}
+            await send(message)
+
+    async def _lead(self, key: Tuple, scope: Scope, receive: Receive, send: Send) -> None:
+        flight = self._flights[key] = _Flight()
+        self.leaders += 1
+        captured: Optional[List[Message]] = []
+        size = 0
+
+        def release(result: Optional[List[Message]]) -> None:
+            # Waiters get the result (None: run it yourselves); later arrivals start a new flight
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if not flight.result.done():
+                flight.result.set_result(result)
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal captured, size
+            if captured is not None:
+                if message["type"] == "http.response.start":
+                    if 200 <= message["status"] < 300:
+                        captured.append({**message, "headers": list(message["headers"])})
+                    else:
+                        captured = None
+                elif message["type"] == "http.response.body":
+                    size += len(message.get("body", b""))
+                    if size > self.max_body_bytes or message.get("more_body", False):
+                        captured = None
+                    else:
+                        captured.append(dict(message))
+                if captured is None:
+                    release(None)
+            await send(message)
+
+        completed = False
+        try:
+            await self.app(scope, receive, send_and_capture)
+            completed = True
+        finally:
+            release(captured if completed else None)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight_keys": len(self._flights),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "overflow": self.overflow,
+            "fallbacks": self.fallbacks,
+            "streaming_bypassed": self.streaming_bypassed,
+        }
@@ -0,0 +1,105 @@
+# app/core/timing.py
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SERVER_TIMING_HEADER = "server-timing"
+
+class RequestTimings:
+    """Phase durations (seconds) collected while one request is handled."""
+    __slots__ = ("phases", "counts", "handler_end")
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.handler_end: Optional[float] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def header(self) -> str:
+        parts = []
+        for phase, seconds in self.phases.items():
+            part = f"{phase};dur={seconds * 1000:.2f}"
+            if phase == "db":
+                part += f';desc="{self.counts[phase]} queries"'
+            parts.append(part)
+        return ", ".join(parts)
+
+# None outside a request (or when the middleware is not installed): recording is then a no-op
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("server_timing", default=None)
+
+def current() -> Optional[RequestTimings]:
+    return _current.get()
+
+def record(phase: str, seconds: float) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+@contextmanager
+def measure(phase: str):
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - start)
+
+def mark_handler_end() -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.handler_end = time.perf_counter()
+
+def instrument_engine(sync_engine) -> None:
+    """Sum the time spent in cursor executions into the "db" phase."""
+    from sqlalchemy import event
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None and _current.get() is not None:
+            context._server_timing_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_server_timing_start", None)
+        if start is not None:
+            record("db", time.perf_counter() - start)
+
+class ServerTimingMiddleware:
+    """
+    Emits a Server-Timing header with the phases recorded during the request:
+    auth, db, handler, serialize (handler return -> response start) and total.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                if timings.handler_end is not None:
+                    timings.add("serialize", now - timings.handler_end)
+                timings.add("total", now - start)
+                MutableHeaders(scope=message).append(SERVER_TIMING_HEADER, timings.header())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
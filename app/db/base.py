@@ -1,4 +1,10 @@
+import uuid
 from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
-    pass
\ No newline at end of file
+    pass
+
+def next_version(current) -> str:
+    """version_id_generator: a fresh random token on every ORM insert and update.
+    Random rather than incremented because SQLite can reuse the id of a deleted row."""
+    return uuid.uuid4().hex
@@ -1,18 +1,35 @@
 from sqlalchemy.orm import Mapped, mapped_column, declarative_base, relationship
-from sqlalchemy import Integer, String, ForeignKey
-from app.db.base import Base
+from sqlalchemy import Integer, String, ForeignKey, Index, DateTime, func
+from app.db.base import Base, next_version
+from app.utils.dates import utcnow_naive
+from datetime import datetime
 from typing import Optional
 from app.db.models.claim_model import Claim
 from app.db.models.owner_model import Owner
 
 class Car(Base):
     __tablename__ = "car"
+    __table_args__ = (
+        # Listing filters and sort keys (see CarRepository / migration bbbb3b032ef1)
+        Index("ix_car_make_model_year", "make", "model", "year_of_manufacture"),
+        Index("ix_car_year_of_manufacture_id", "year_of_manufacture", "id"),
+        Index("ix_car_owner_id_id", "owner_id", "id"),
+        # updatedSince delta listings
+        Index("ix_car_updated_at_id", "updated_at", "id"),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     vin: Mapped[str] = mapped_column(String, nullable=False, unique=True)
     make: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     model: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     year_of_manufacture: Mapped[Optional[int]] = mapped_column(Integer)
     owner_id: Mapped[int] = mapped_column(ForeignKey("owner.id"), nullable=False)
+    # Set by the ORM on insert and update; drives ?updatedSince= listings
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utcnow_naive, onupdate=utcnow_naive, server_default=func.now()
+    )
+    # Row version for ETags, changed by the ORM on every insert and update
+    version: Mapped[str] = mapped_column(String(32), nullable=False, server_default="0")
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": next_version}
 
     policies = relationship("InsurancePolicy", cascade="all, delete-orphan", back_populates="car")
     claims = relationship("Claim", cascade="all, delete-orphan", back_populates="car")
@@ -1,14 +1,21 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, ForeignKey, Date, Text, Numeric, DateTime, func
+from sqlalchemy import Integer, ForeignKey, Date, Text, Numeric, DateTime, String, Index, func
 from datetime import date, datetime
-from app.db.base import Base
+from app.db.base import Base, next_version
+from app.utils.dates import utcnow_naive
 
 class Claim(Base):
     __tablename__ = "claim"
+    __table_args__ = (Index("ix_claim_updated_at_id", "updated_at", "id"),)
     id: Mapped[int] = mapped_column(primary_key=True)
     car_id: Mapped[int] = mapped_column(ForeignKey("car.id"), nullable=False)
     claim_date: Mapped[date] = mapped_column(Date, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     amount: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utcnow_naive, onupdate=utcnow_naive, server_default=func.now()
+    )
+    version: Mapped[str] = mapped_column(String(32), nullable=False, server_default="0")
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": next_version}
     car = relationship("Car", back_populates="claims")
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String
-from app.db.base import Base
+from sqlalchemy import Integer, String, Index, DateTime, func
+from app.db.base import Base, next_version
+from app.utils.dates import utcnow_naive
+from datetime import datetime
 from typing import Optional
 
 class Owner(Base):
@@ -8,5 +10,17 @@ class Owner(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     email: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utcnow_naive, onupdate=utcnow_naive, server_default=func.now()
+    )
+    version: Mapped[str] = mapped_column(String(32), nullable=False, server_default="0")
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": next_version}
+
+    __table_args__ = (
+        # Case-insensitive search (/api/owners/search); on Postgres the migration builds them with text_pattern_ops
+        Index("ix_owner_lower_name", func.lower(name)),
+        Index("ix_owner_lower_email", func.lower(email)),
+        Index("ix_owner_updated_at_id", "updated_at", "id"),
+    )
 
     cars = relationship("Car", cascade="all, delete-orphan", back_populates="owner")
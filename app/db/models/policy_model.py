@@ -1,17 +1,28 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, ForeignKey, Date
-from datetime import date
+from sqlalchemy import Integer, String, ForeignKey, Date, DateTime, Index, func
+from datetime import date, datetime
 from typing import Optional
-from app.db.base import Base
+from app.db.base import Base, next_version
+from app.utils.dates import utcnow_naive
 from app.db.models.car_model import Car
 
 class InsurancePolicy(Base):
     __tablename__ = "insurance_policy"
+    __table_args__ = (
+        # Created by migration 0e36c848a80e; serves the validity EXISTS probe
+        Index("ix_insurance_policy_car_id_start_date_end_date", "car_id", "start_date", "end_date"),
+        Index("ix_insurance_policy_updated_at_id", "updated_at", "id"),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     car_id: Mapped[int] = mapped_column(ForeignKey("car.id"), nullable=False)
     provider: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
     end_date: Mapped[date] = mapped_column(Date, nullable=False)
     logged_expiry_at: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utcnow_naive, onupdate=utcnow_naive, server_default=func.now()
+    )
+    version: Mapped[str] = mapped_column(String(32), nullable=False, server_default="0")
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": next_version}
 
     car = relationship("Car", back_populates="policies")
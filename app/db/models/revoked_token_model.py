@@ -0,0 +1,10 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, DateTime, func
+from datetime import datetime
+from app.db.base import Base
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_token"
+    jti: Mapped[str] = mapped_column(String, primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
@@ -0,0 +1,13 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, SmallInteger, String
+from app.db.base import Base
+
+class RowCount(Base):
+    """
+    Row totals kept up to date by app.db.row_counts, so exact counts need no table scan.
+    Each table's total is spread over ROW_COUNT_SLOTS rows and read back with SUM.
+    """
+    __tablename__ = "row_count"
+    table_name: Mapped[str] = mapped_column(String, primary_key=True)
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
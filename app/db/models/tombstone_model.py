@@ -0,0 +1,14 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Index, Integer, String
+from datetime import datetime
+from app.db.base import Base
+from app.utils.dates import utcnow_naive
+
+class Tombstone(Base):
+    """One row per deleted entity, so mirrors syncing with ?updatedSince= also learn about deletes."""
+    __tablename__ = "tombstone"
+    __table_args__ = (Index("ix_tombstone_table_name_deleted_at_id", "table_name", "deleted_at", "id"),)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    table_name: Mapped[str] = mapped_column(String, nullable=False)
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow_naive, index=True)
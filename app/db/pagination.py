@@ -0,0 +1,129 @@
+# app/db/pagination.py
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import orjson
+from sqlalchemy import Select, and_, or_, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+@dataclass
+class PageRequest:
+    limit: int
+    cursor: Optional[str] = None
+    sort: str = "id"
+    # Inclusive lower bound on the sort column (?updatedSince= style delta listings)
+    since: Optional[Any] = None
+    # Exclusive upper bound on the sort column: the sync horizon, see app.api.deps.sync_horizon
+    until: Optional[Any] = None
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    payload = orjson.dumps({"s": sort, "v": list(values)})
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str, sort: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = orjson.loads(base64.urlsafe_b64decode(padded))
+        values = payload["v"]
+        matches = payload["s"] == sort and isinstance(values, list)
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not matches:
+        raise ValueError("Cursor does not match the requested sort")
+    return values
+
+def _restore(value: Any, column) -> Any:
+    # Cursor values went through JSON; bring dates back to the column's python type
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return value
+
+def nulls_sort_first(session) -> bool:
+    """SQLite and MySQL put NULLs first in ascending order, Postgres puts them last."""
+    bind = getattr(session, "bind", None)
+    return bind is not None and bind.dialect.name != "postgresql"
+
+class Keyset:
+    """
+    Keyset (seek) pagination over (sort column, primary key): every page is a range scan
+    starting right after the last row of the previous page, so deep pages cost the same as
+    the first one, and rows inserted meanwhile neither shift nor repeat items.
+    """
+    def __init__(self, id_column, sort_columns: Optional[Dict[str, Any]] = None):
+        self.id_column = id_column
+        self.sort_columns = {"id": id_column, **(sort_columns or {})}
+
+    def apply(self, stmt: Select, page: PageRequest, nulls_first: bool = False) -> Select:
+        """
+        nulls_first tells where the database puts NULLs of a nullable sort column in
+        ascending order (see nulls_sort_first); the ORDER BY itself stays the native one,
+        so an index on (sort column, id) can return rows already in order.
+        """
+        column = self.sort_columns[page.sort]
+        if page.since is not None:
+            stmt = stmt.where(column >= page.since)
+        if page.until is not None:
+            stmt = stmt.where(column < page.until)
+        if page.cursor:
+            values = decode_cursor(page.cursor, page.sort)
+            if column is self.id_column:
+                if len(values) != 1:
+                    raise ValueError("Invalid cursor")
+                stmt = stmt.where(column > values[0])
+            else:
+                if len(values) != 2:
+                    raise ValueError("Invalid cursor")
+                last, last_id = _restore(values[0], column), values[1]
+                stmt = stmt.where(self._seek(column, last, last_id, nulls_first))
+        order = [column] if column is self.id_column else [column, self.id_column]
+        # One extra row tells whether there is a next page
+        return stmt.order_by(*order).limit(page.limit + 1)
+
+    def _seek(self, column, last: Any, last_id: Any, nulls_first: bool):
+        after_id = self.id_column > last_id
+        if last is None:
+            # NULLs form one block, ordered by id; non-NULL values follow it only when NULLs sort first
+            tail = and_(column.is_(None), after_id)
+            return or_(tail, column.is_not(None)) if nulls_first else tail
+        # Row-value comparison: a single range condition on the (sort column, id) index; the
+        # expanded col > x OR (col = x AND id > y) form makes Postgres scan the index from its start
+        after = tuple_(column, self.id_column) > tuple_(last, last_id)
+        if nulls_first or not getattr(column, "nullable", True):
+            return after
+        return or_(after, column.is_(None))
+
+    def with_key_columns(self, stmt: Select, page: PageRequest) -> Select:
+        """For column-only selects (fields=): adds the keyset values under fixed labels."""
+        return stmt.add_columns(
+            self.sort_columns[page.sort].label("_keyset_sort"),
+            self.id_column.label("_keyset_id"),
+        )
+
+    def page(
+        self,
+        rows: Sequence[Any],
+        page: PageRequest,
+        key: Optional[Callable[[Any], Tuple[Any, Any]]] = None,
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Trims the extra row and builds the next cursor; key(row) -> (sort value, id)."""
+        rows = list(rows)
+        if len(rows) <= page.limit:
+            return rows, None
+        rows = rows[:page.limit]
+        column = self.sort_columns[page.sort]
+        if key is None:
+            key = lambda row: (getattr(row, column.key), getattr(row, self.id_column.key))
+        sort_value, id_value = key(rows[-1])
+        values = [id_value] if column is self.id_column else [sort_value, id_value]
+        return rows, encode_cursor(page.sort, values)
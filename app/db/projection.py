@@ -0,0 +1,70 @@
+# app/db/projection.py
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel
+from sqlalchemy import select, Select
+
+# alias -> None for a column, or the list of nested aliases for a relation
+Selection = Dict[str, Optional[List[str]]]
+
+class Projection:
+    """
+    Sparse fieldsets (fields=id,vin,owner.name) for a response schema: maps the schema's
+    camelCase aliases to columns and builds a column-only SELECT, joining a relation only
+    when one of its fields is requested.
+    """
+    def __init__(self, model, schema: type[BaseModel], relations: Optional[Dict[str, Tuple[Any, "Projection"]]] = None):
+        self.model = model
+        self.columns = {
+            field.alias or name: getattr(model, name)
+            for name, field in schema.model_fields.items()
+            if name in model.__table__.c
+        }
+        self.relations = relations or {}
+
+    def parse(self, fields: str) -> Selection:
+        selection: Selection = {}
+        for item in fields.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            name, _, sub = item.partition(".")
+            if name in self.relations:
+                nested = self.relations[name][1]
+                if sub and sub not in nested.columns:
+                    raise ValueError(f"Unknown field: {item}")
+                wanted = selection.setdefault(name, [])
+                for field in ([sub] if sub else nested.columns):
+                    if field not in wanted:
+                        wanted.append(field)
+            elif name in self.columns and not sub:
+                selection[name] = None
+            else:
+                raise ValueError(f"Unknown field: {item}")
+        if not selection:
+            raise ValueError("fields must name at least one field")
+        return selection
+
+    def statement(self, selection: Selection) -> Select:
+        columns = []
+        joins = []
+        for name, nested_fields in selection.items():
+            if nested_fields is None:
+                columns.append(self.columns[name].label(name))
+            else:
+                relationship, nested = self.relations[name]
+                joins.append(relationship)
+                columns.extend(nested.columns[field].label(f"{name}.{field}") for field in nested_fields)
+        stmt = select(*columns).select_from(self.model)
+        for relationship in joins:
+            stmt = stmt.join(relationship)
+        return stmt
+
+    def to_dict(self, row, selection: Selection) -> dict:
+        values = row._mapping
+        out = {}
+        for name, nested_fields in selection.items():
+            if nested_fields is None:
+                out[name] = values[name]
+            else:
+                out[name] = {field: values[f"{name}.{field}"] for field in nested_fields}
+        return out
@@ -0,0 +1,40 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import Optional
+from app.db.models.api_key_model import ApiKey
+from app.db.models.user_model import User
+
+class ApiKeyRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, id: int) -> Optional[ApiKey]:
+        result = await self.session.execute(select(ApiKey).where(ApiKey.id == id))
+        return result.scalars().first()
+
+    async def get_active_user_by_hash(self, key_hash: str) -> Optional[User]:
+        # Single probe on the unique key_hash index, joined to the owning user
+        result = await self.session.execute(
+            select(User)
+            .join(ApiKey, ApiKey.user_id == User.id)
+            .where(ApiKey.key_hash == key_hash, ApiKey.is_active == True)
+        )
+        return result.scalars().first()
+
+    async def list_for_user(self, user_id: int) -> list[ApiKey]:
+        result = await self.session.execute(select(ApiKey).where(ApiKey.user_id == user_id))
+        return result.scalars().all()
+
+    async def add(self, entity: ApiKey) -> ApiKey:
+        self.session.add(entity)
+        await self.session.commit()
+        await self.session.refresh(entity)
+        return entity
+
+    async def deactivate(self, id: int) -> Optional[ApiKey]:
+        api_key = await self.get(id)
+        if api_key:
+            api_key.is_active = False
+            await self.session.commit()
+            await self.session.refresh(api_key)
+        return api_key
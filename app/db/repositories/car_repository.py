@@ -1,9 +1,35 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Optional, Iterable
+from typing import Optional, Iterable, List, AsyncIterator, Tuple
 from app.db.models.car_model import Car
 from app.db.repositories.base_repository import BaseRepository
 from sqlalchemy.orm import joinedload
+from sqlalchemy import func
+from app.db.projection import Projection, Selection
+from app.db.pagination import Keyset, PageRequest, nulls_sort_first
+from app.db.search import prefix_range
+from app.db.row_counts import TotalCount, count_rows
+from app.schemas.car_schema import CarFilter
+
+# Sort keys exposed on /api/cars/; each has an index on (key, id) or is unique
+CAR_KEYSET = Keyset(
+    Car.id, {"vin": Car.vin, "yearOfManufacture": Car.year_of_manufacture, "updatedAt": Car.updated_at}
+)
+
+def apply_filters(stmt, filters: Optional[CarFilter]):
+    if filters is None:
+        return stmt
+    if filters.make is not None:
+        stmt = stmt.where(Car.make == filters.make)
+    if filters.model is not None:
+        stmt = stmt.where(Car.model == filters.model)
+    if filters.year_from is not None:
+        stmt = stmt.where(Car.year_of_manufacture >= filters.year_from)
+    if filters.year_to is not None:
+        stmt = stmt.where(Car.year_of_manufacture <= filters.year_to)
+    if filters.owner_id is not None:
+        stmt = stmt.where(Car.owner_id == filters.owner_id)
+    return stmt
 
 class CarRepository(BaseRepository[Car, int]):
     def __init__(self, session: AsyncSession):
@@ -14,11 +40,45 @@ class CarRepository(BaseRepository[Car, int]):
         scalars_result = result.scalars()
         return scalars_result.first()
     
+    async def get_version(self, id: int) -> Optional[str]:
+        # Primary-key probe for conditional GETs; the row is neither loaded nor serialized
+        return await self.session.scalar(select(Car.version).where(Car.id == id))
+
     async def get_car_by_vin(self, vin: str) -> Optional[Car]:
         result = await self.session.execute(select(Car).where(Car.vin == vin))
         scalars_result = result.scalars()
         return scalars_result.first()
 
+    async def search_by_vin(self, fragment: str, limit: int) -> List[Car]:
+        """
+        Cars whose VIN contains fragment: prefix matches first, then other substring matches.
+        Postgres serves both from the pg_trgm GIN index (ix_car_vin_trgm) and ranks
+        substring matches by similarity; elsewhere the prefix is a range scan on ix_car_vin.
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            is_prefix = Car.vin.startswith(fragment, autoescape=True)
+            result = await self.session.execute(
+                select(Car)
+                .where(Car.vin.contains(fragment, autoescape=True))
+                .order_by(is_prefix.desc(), func.similarity(Car.vin, fragment).desc(), Car.vin)
+                .limit(limit)
+            )
+            return list(result.scalars().all())
+        result = await self.session.execute(
+            select(Car).where(prefix_range(Car.vin, fragment)).order_by(Car.vin).limit(limit)
+        )
+        cars = list(result.scalars().all())
+        if len(cars) < limit:
+            # No substring index here: a scan, acceptable for the development database
+            result = await self.session.execute(
+                select(Car)
+                .where(func.instr(Car.vin, fragment) > 1)
+                .order_by(Car.vin)
+                .limit(limit - len(cars))
+            )
+            cars.extend(result.scalars().all())
+        return cars
+
     async def add(self, entity: Car) -> Car:
         self.session.add(entity)
         await self.session.commit()
@@ -30,11 +90,59 @@ class CarRepository(BaseRepository[Car, int]):
         scalars_result = result.scalars()
         return scalars_result.all()
     
-    async def list_with_owner(self) -> Iterable[Car]:
-        result = await self.session.execute(select(Car).options(joinedload(Car.owner)))
+    async def list_with_owner(self, filters: Optional[CarFilter] = None, sort: str = "id") -> Iterable[Car]:
+        stmt = apply_filters(select(Car).options(joinedload(Car.owner)), filters)
+        result = await self.session.execute(self._order(stmt, sort))
         scalars_result = result.scalars()
         return scalars_result.all()
 
+    async def list_page_with_owner(
+        self, page: PageRequest, filters: Optional[CarFilter] = None
+    ) -> Tuple[List[Car], Optional[str]]:
+        stmt = apply_filters(select(Car).options(joinedload(Car.owner)), filters)
+        result = await self.session.execute(CAR_KEYSET.apply(stmt, page, nulls_sort_first(self.session)))
+        return CAR_KEYSET.page(result.scalars().all(), page)
+
+    async def stream_with_owner(
+        self, batch_size: int = 500, filters: Optional[CarFilter] = None, sort: str = "id"
+    ) -> AsyncIterator[List[Car]]:
+        # Server-side cursor: rows are fetched batch_size at a time instead of all at once
+        stmt = apply_filters(select(Car).options(joinedload(Car.owner)), filters)
+        result = await self.session.stream_scalars(
+            self._order(stmt, sort).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
+    async def list_projected(
+        self, projection: Projection, selection: Selection, filters: Optional[CarFilter] = None, sort: str = "id"
+    ) -> List[dict]:
+        stmt = apply_filters(projection.statement(selection), filters)
+        result = await self.session.execute(self._order(stmt, sort))
+        return [projection.to_dict(row, selection) for row in result]
+
+    async def list_projected_page(
+        self, projection: Projection, selection: Selection, page: PageRequest, filters: Optional[CarFilter] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        stmt = apply_filters(CAR_KEYSET.with_key_columns(projection.statement(selection), page), filters)
+        stmt = CAR_KEYSET.apply(stmt, page, nulls_sort_first(self.session))
+        result = await self.session.execute(stmt)
+        rows, next_cursor = CAR_KEYSET.page(result.all(), page, key=lambda row: (row._keyset_sort, row._keyset_id))
+        return [projection.to_dict(row, selection) for row in rows], next_cursor
+
+    async def count(self, estimate: bool = False, filters: Optional[CarFilter] = None) -> TotalCount:
+        filtered = filters is not None and filters.model_dump(exclude_none=True)
+        return await count_rows(self.session, Car, estimate, apply_filters(select(Car), filters) if filtered else None)
+
+    def _order(self, stmt, sort: str):
+        column = CAR_KEYSET.sort_columns[sort]
+        return stmt.order_by(column) if column is Car.id else stmt.order_by(column, Car.id)
+
+    async def get_projected(self, projection: Projection, selection: Selection, id: int) -> Optional[dict]:
+        result = await self.session.execute(projection.statement(selection).where(Car.id == id))
+        row = result.first()
+        return projection.to_dict(row, selection) if row else None
+
     async def delete(self, id: int) -> None:
         result = await self.session.execute(select(Car).where(Car.id == id))
         scalars_result = result.scalars()
@@ -1,8 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Optional, Iterable
+from typing import Optional, Iterable, List, AsyncIterator, Tuple
 from app.db.models.claim_model import Claim
 from app.db.repositories.base_repository import BaseRepository
+from app.db.pagination import Keyset, PageRequest
+from app.db.row_counts import TotalCount, count_rows
+
+CLAIM_KEYSET = Keyset(Claim.id, {"updatedAt": Claim.updated_at})
 
 class ClaimRepository(BaseRepository[Claim, int]):
     def __init__(self, session: AsyncSession):
@@ -30,6 +34,21 @@ class ClaimRepository(BaseRepository[Claim, int]):
         result = await self.session.execute(select(Claim))
         return result.scalars().all()
 
+    async def count(self, estimate: bool = False) -> TotalCount:
+        return await count_rows(self.session, Claim, estimate)
+
+    async def list_page(self, page: PageRequest) -> Tuple[List[Claim], Optional[str]]:
+        result = await self.session.execute(CLAIM_KEYSET.apply(select(Claim), page))
+        return CLAIM_KEYSET.page(result.scalars().all(), page)
+
+    async def stream(self, batch_size: int = 500) -> AsyncIterator[List[Claim]]:
+        # Server-side cursor: rows are fetched batch_size at a time instead of all at once
+        result = await self.session.stream_scalars(
+            select(Claim).order_by(Claim.id).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
     async def delete(self, id: int) -> None:
         result = await self.session.execute(select(Claim).where(Claim.id == id))
         claim = result.scalars().first()
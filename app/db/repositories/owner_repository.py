@@ -1,8 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Optional, Iterable
+from sqlalchemy import func
+from typing import Optional, Iterable, List, AsyncIterator, Tuple
 from app.db.models.owner_model import Owner
 from app.db.repositories.base_repository import BaseRepository
+from app.db.projection import Projection, Selection
+from app.db.pagination import Keyset, PageRequest
+from app.db.row_counts import TotalCount, count_rows
+from app.db.search import prefix_match
+
+OWNER_KEYSET = Keyset(Owner.id, {"updatedAt": Owner.updated_at})
 
 class OwnerRepository(BaseRepository[Owner, int]):
     def __init__(self, session: AsyncSession):
@@ -13,6 +20,9 @@ class OwnerRepository(BaseRepository[Owner, int]):
         scalars_result = result.scalars()
         return scalars_result.first()
 
+    async def get_version(self, id: int) -> Optional[str]:
+        return await self.session.scalar(select(Owner.version).where(Owner.id == id))
+
     async def add(self, entity: Owner) -> Owner:
         self.session.add(entity)
         await self.session.commit()
@@ -24,6 +34,58 @@ class OwnerRepository(BaseRepository[Owner, int]):
         scalars_result = result.scalars()
         return scalars_result.all()
 
+    async def search(self, name: Optional[str], email: Optional[str], limit: int) -> List[Owner]:
+        """
+        Owners whose lower(name) starts with name and lower(email) starts with email (both
+        already lower-cased), probed through ix_owner_lower_name / ix_owner_lower_email.
+        Exact email matches come first.
+        """
+        dialect = self.session.bind.dialect.name
+        stmt = select(Owner)
+        order = []
+        if email:
+            lower_email = func.lower(Owner.email)
+            stmt = stmt.where(prefix_match(lower_email, email, dialect))
+            order += [(lower_email == email).desc(), lower_email]
+        if name:
+            lower_name = func.lower(Owner.name)
+            stmt = stmt.where(prefix_match(lower_name, name, dialect))
+            order.append(lower_name)
+        result = await self.session.execute(stmt.order_by(*order, Owner.id).limit(limit))
+        return list(result.scalars().all())
+
+    async def count(self, estimate: bool = False) -> TotalCount:
+        return await count_rows(self.session, Owner, estimate)
+
+    async def list_page(self, page: PageRequest) -> Tuple[List[Owner], Optional[str]]:
+        result = await self.session.execute(OWNER_KEYSET.apply(select(Owner), page))
+        return OWNER_KEYSET.page(result.scalars().all(), page)
+
+    async def stream(self, batch_size: int = 500) -> AsyncIterator[List[Owner]]:
+        # Server-side cursor: rows are fetched batch_size at a time instead of all at once
+        result = await self.session.stream_scalars(
+            select(Owner).order_by(Owner.id).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
+    async def list_projected(self, projection: Projection, selection: Selection) -> List[dict]:
+        result = await self.session.execute(projection.statement(selection))
+        return [projection.to_dict(row, selection) for row in result]
+
+    async def list_projected_page(
+        self, projection: Projection, selection: Selection, page: PageRequest
+    ) -> Tuple[List[dict], Optional[str]]:
+        stmt = OWNER_KEYSET.apply(OWNER_KEYSET.with_key_columns(projection.statement(selection), page), page)
+        result = await self.session.execute(stmt)
+        rows, next_cursor = OWNER_KEYSET.page(result.all(), page, key=lambda row: (row._keyset_sort, row._keyset_id))
+        return [projection.to_dict(row, selection) for row in rows], next_cursor
+
+    async def get_projected(self, projection: Projection, selection: Selection, id: int) -> Optional[dict]:
+        result = await self.session.execute(projection.statement(selection).where(Owner.id == id))
+        row = result.first()
+        return projection.to_dict(row, selection) if row else None
+
     async def delete(self, id: int) -> None:
         result = await self.session.execute(select(Owner).where(Owner.id == id))
         scalars_result = result.scalars()
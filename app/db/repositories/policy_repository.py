@@ -1,9 +1,29 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Optional, Iterable
+from sqlalchemy import exists, Select
+from app.db.models.car_model import Car
+from typing import Optional, Iterable, List, AsyncIterator, Tuple
 from app.db.models.policy_model import InsurancePolicy
 from app.db.repositories.base_repository import BaseRepository
 from datetime import date
+from app.db.pagination import Keyset, PageRequest
+from app.db.row_counts import TotalCount, count_rows
+
+POLICY_KEYSET = Keyset(InsurancePolicy.id, {"updatedAt": InsurancePolicy.updated_at})
+
+def validity_query(car_id: int, on_date: date) -> Select:
+    """
+    One row (car exists) holding EXISTS(an unexpired policy covering on_date), or no row
+    when the car does not exist: a primary-key lookup plus a probe on
+    ix_insurance_policy_car_id_start_date_end_date.
+    """
+    active_policy = exists().where(
+        InsurancePolicy.car_id == car_id,
+        InsurancePolicy.start_date <= on_date,
+        InsurancePolicy.end_date >= on_date,
+        InsurancePolicy.logged_expiry_at.is_(None),
+    )
+    return select(active_policy.label("valid")).select_from(Car).where(Car.id == car_id)
 
 class PolicyRepository(BaseRepository[InsurancePolicy, int]):
     def __init__(self, session: AsyncSession):
@@ -17,17 +37,16 @@ class PolicyRepository(BaseRepository[InsurancePolicy, int]):
         result = await self.session.execute(select(InsurancePolicy).where(InsurancePolicy.car_id == car_id))
         return result.scalars().all()
     
-    async def is_active_policy_exists_for_car(self, car_id: int, on_date: date) -> bool:
+    async def get_versions_by_car_id(self, car_id: int) -> List[Tuple[int, str]]:
         result = await self.session.execute(
-            select(InsurancePolicy).where(
-                InsurancePolicy.car_id == car_id,
-                InsurancePolicy.start_date <= on_date,
-                InsurancePolicy.end_date >= on_date,
-                InsurancePolicy.logged_expiry_at == None
-            )
+            select(InsurancePolicy.id, InsurancePolicy.version).where(InsurancePolicy.car_id == car_id)
         )
-        policy = result.scalars().first()
-        return policy is not None
+        return [tuple(row) for row in result]
+
+    async def get_validity(self, car_id: int, on_date: date) -> Optional[bool]:
+        """True/False whether the car is insured on on_date, None when the car does not exist."""
+        valid = await self.session.scalar(validity_query(car_id, on_date))
+        return None if valid is None else bool(valid)
 
     async def get_policies_not_logged_expiry(self, before_date) -> list[InsurancePolicy]:
         result = await self.session.execute(
@@ -59,6 +78,21 @@ class PolicyRepository(BaseRepository[InsurancePolicy, int]):
         result = await self.session.execute(select(InsurancePolicy))
         return result.scalars().all()
     
+    async def count(self, estimate: bool = False) -> TotalCount:
+        return await count_rows(self.session, InsurancePolicy, estimate)
+
+    async def list_page(self, page: PageRequest) -> Tuple[List[InsurancePolicy], Optional[str]]:
+        result = await self.session.execute(POLICY_KEYSET.apply(select(InsurancePolicy), page))
+        return POLICY_KEYSET.page(result.scalars().all(), page)
+
+    async def stream(self, batch_size: int = 500) -> AsyncIterator[List[InsurancePolicy]]:
+        # Server-side cursor: rows are fetched batch_size at a time instead of all at once
+        result = await self.session.stream_scalars(
+            select(InsurancePolicy).order_by(InsurancePolicy.id).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
     async def delete(self, id: int) -> None:
         result = await self.session.execute(select(InsurancePolicy).where(InsurancePolicy.id == id))
         policy = result.scalars().first()
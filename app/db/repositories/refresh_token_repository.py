@@ -0,0 +1,48 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+from sqlalchemy.orm import joinedload
+from datetime import datetime
+from typing import Optional
+from app.db.models.refresh_token_model import RefreshToken
+
+class RefreshTokenRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        result = await self.session.execute(
+            select(RefreshToken).options(joinedload(RefreshToken.user)).where(RefreshToken.token_hash == token_hash)
+        )
+        return result.scalars().first()
+
+    async def add(self, entity: RefreshToken, commit: bool = True) -> RefreshToken:
+        self.session.add(entity)
+        if commit:
+            await self.session.commit()
+        return entity
+
+    async def mark_used(self, id: int, now: datetime) -> bool:
+        # Conditional update: of two concurrent refreshes with the same token only one wins
+        result = await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == id, RefreshToken.revoked_at == None)
+            .values(revoked_at=now)
+        )
+        return result.rowcount == 1
+
+    async def revoke_family(self, family_id: str, now: datetime) -> None:
+        await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at == None)
+            .values(revoked_at=now)
+        )
+        await self.session.commit()
+
+    async def purge_expired(self, now: datetime) -> int:
+        # Expired tokens are rejected anyway; rotated and revoked rows only matter until then
+        result = await self.session.execute(delete(RefreshToken).where(RefreshToken.expires_at <= now))
+        await self.session.commit()
+        return result.rowcount
+
+    async def commit(self) -> None:
+        await self.session.commit()
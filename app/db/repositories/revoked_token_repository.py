@@ -0,0 +1,23 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+from datetime import datetime
+from app.db.models.revoked_token_model import RevokedToken
+
+class RevokedTokenRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, jti: str, expires_at: datetime) -> RevokedToken:
+        revoked = RevokedToken(jti=jti, expires_at=expires_at)
+        await self.session.merge(revoked)
+        await self.session.commit()
+        return revoked
+
+    async def list_active_jtis(self, now: datetime) -> list[str]:
+        result = await self.session.execute(select(RevokedToken.jti).where(RevokedToken.expires_at > now))
+        return list(result.scalars().all())
+
+    async def purge_expired(self, now: datetime) -> int:
+        result = await self.session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        await self.session.commit()
+        return result.rowcount
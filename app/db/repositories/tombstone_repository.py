@@ -0,0 +1,18 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from typing import Optional, List, Tuple
+from app.db.models.tombstone_model import Tombstone
+from app.db.pagination import Keyset, PageRequest
+
+TOMBSTONE_KEYSET = Keyset(Tombstone.id, {"deletedAt": Tombstone.deleted_at})
+
+class TombstoneRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_page(self, page: PageRequest, table_name: Optional[str] = None) -> Tuple[List[Tombstone], Optional[str]]:
+        stmt = select(Tombstone)
+        if table_name is not None:
+            stmt = stmt.where(Tombstone.table_name == table_name)
+        result = await self.session.execute(TOMBSTONE_KEYSET.apply(stmt, page))
+        return TOMBSTONE_KEYSET.page(result.scalars().all(), page)
@@ -1,8 +1,12 @@
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
+from sqlalchemy.exc import IntegrityError
 from app.db.models.user_model import User
 from app.schemas.user_schema import UserCreate
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async, get_password_hash_bulk_async
+from app.auth.principal_cache import invalidate_principal, invalidate_principal_id
+from app.auth.api_keys import invalidate_user_api_keys
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
@@ -21,9 +25,50 @@ class UserRepository:
         return result.scalars().first()
 
     async def create_user(self, user: UserCreate):
-        hashed_password = get_password_hash(user.password)
-        db_user = User(username=user.username, email=user.email, hashed_password=hashed_password)
-        self.session.add(db_user)
+        # One INSERT ... RETURNING; uniqueness is enforced by the username/email constraints
+        hashed_password = await get_password_hash_async(user.password)
+        try:
+            db_user = await self.session.scalar(
+                insert(User)
+                .values(username=user.username, email=user.email, hashed_password=hashed_password)
+                .returning(User)
+            )
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            raise
+        return db_user
+
+    async def create_users(self, users: list[UserCreate]) -> int:
+        # Hashes queue on the bulk password pool, never in front of logins; rows go out as multi-row INSERTs
+        hashed_passwords = await asyncio.gather(*(get_password_hash_bulk_async(u.password) for u in users))
+        rows = [
+            {"username": u.username, "email": u.email, "hashed_password": h, "is_active": True, "is_superuser": False}
+            for u, h in zip(users, hashed_passwords)
+        ]
+        try:
+            await self.session.execute(insert(User), rows)
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            raise
+        return len(rows)
+
+    async def update_user(self, user: User):
+        merged = await self.session.merge(user)
         await self.session.commit()
-        await self.session.refresh(db_user)
-        return db_user
\ No newline at end of file
+        # Invalidate as soon as the change is committed, whatever happens next
+        invalidate_principal_id(merged.id)
+        invalidate_user_api_keys(merged.id)
+        await self.session.refresh(merged)
+        return merged
+
+    async def set_active(self, username: str, is_active: bool):
+        user = await self.get_user_by_username(username)
+        if user:
+            user.is_active = is_active
+            await self.session.commit()
+            await self.session.refresh(user)
+            invalidate_principal(username)
+            invalidate_user_api_keys(user.id)
+        return user
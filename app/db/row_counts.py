@@ -0,0 +1,94 @@
+# app/db/row_counts.py
+import json
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from sqlalchemy import Select, event, func, select, text, update
+from sqlalchemy.orm import Session
+from app.db.models.row_count_model import RowCount
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_ESTIMATED_HEADER = "X-Total-Count-Estimated"
+
+# Tables with counter rows in row_count (seeded by migrations 14bbf5526c43 and 110d7b11604d)
+COUNTED_TABLES = ("car", "owner", "claim", "insurance_policy")
+# Counter rows per table: each flush bumps a random one, so concurrent writers to a table
+# rarely wait on the same row lock until commit. Keep in step with migration 110d7b11604d.
+ROW_COUNT_SLOTS = 8
+
+@dataclass
+class TotalCount:
+    value: int
+    estimated: bool = False
+
+    def headers(self) -> Dict[str, str]:
+        return {
+            TOTAL_COUNT_HEADER: str(self.value),
+            TOTAL_COUNT_ESTIMATED_HEADER: "true" if self.estimated else "false",
+        }
+
+def _count_changes(session: Session, flush_context) -> None:
+    deltas = Counter()
+    for obj in session.new:
+        deltas[getattr(obj, "__tablename__", None)] += 1
+    for obj in session.deleted:
+        deltas[getattr(obj, "__tablename__", None)] -= 1
+    changes = {table: delta for table, delta in deltas.items() if table in COUNTED_TABLES and delta}
+    if not changes:
+        return
+    # Same transaction as the flush, so a rollback undoes the counter change too
+    connection = session.connection()
+    for table, delta in changes.items():
+        slot = random.randrange(ROW_COUNT_SLOTS)
+        connection.execute(
+            update(RowCount)
+            .where(RowCount.table_name == table, RowCount.slot == slot)
+            .values(count=RowCount.count + delta)
+        )
+
+def counter_rows(table_name: str, count: int = 0) -> List[RowCount]:
+    """The ROW_COUNT_SLOTS rows a table needs in row_count, holding count in total."""
+    return [RowCount(table_name=table_name, slot=slot, count=count if slot == 0 else 0) for slot in range(ROW_COUNT_SLOTS)]
+
+def install(session_class=Session) -> None:
+    """
+    Keeps row_count in step with ORM inserts and deletes (session.add / session.delete).
+    Core statements bypass the hook: insert()/update()/delete() executed directly, such as
+    UserRepository.create_users, bulk operations and raw SQL. Tables without counter rows
+    fall back to count(*).
+    """
+    if not event.contains(session_class, "after_flush", _count_changes):
+        event.listen(session_class, "after_flush", _count_changes)
+
+async def _planner_estimate(session, model, stmt: Optional[Select]) -> Optional[int]:
+    if stmt is None:
+        value = await session.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": model.__tablename__},
+        )
+        # -1 until the table has been vacuumed or analyzed
+        return value if value is not None and value >= 0 else None
+    sql = stmt.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})
+    plan = await session.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+async def count_rows(session, model, estimate: bool = False, stmt: Optional[Select] = None) -> TotalCount:
+    """
+    Total rows of model, or of stmt (a filtered SELECT over it) when given.
+    estimate=True uses planner statistics on Postgres; otherwise the maintained counter,
+    falling back to count(*) for filtered selects or tables without a counter.
+    """
+    if estimate and session.bind.dialect.name == "postgresql":
+        value = await _planner_estimate(session, model, stmt)
+        if value is not None:
+            return TotalCount(value, estimated=True)
+    if stmt is None:
+        value = await session.scalar(select(func.sum(RowCount.count)).where(RowCount.table_name == model.__tablename__))
+        if value is not None:
+            return TotalCount(value)
+        stmt = select(model)
+    value = await session.scalar(select(func.count()).select_from(stmt.order_by(None).subquery()))
+    return TotalCount(value)
@@ -0,0 +1,22 @@
+# app/db/search.py
+from sqlalchemy import and_, literal
+
+def escape_like(value: str, escape: str = "\\") -> str:
+    return value.replace(escape, escape * 2).replace("%", escape + "%").replace("_", escape + "_")
+
+def prefix_range(column, prefix: str):
+    """column starts with prefix, as a range: [prefix, prefix with its last character incremented)."""
+    upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return and_(column >= prefix, column < upper_bound)
+
+def prefix_match(column, prefix: str, dialect: str):
+    """
+    Index-friendly "starts with". Postgres gets a LIKE with a literal pattern, which a
+    text_pattern_ops index serves whatever the collation; elsewhere a plain range scan.
+    The pattern is rendered inline (literal_execute): a bound parameter in a generic
+    prepared plan hides the constant prefix from the planner, which then cannot use the index.
+    """
+    if dialect == "postgresql":
+        pattern = literal(escape_like(prefix) + "%", literal_execute=True)
+        return column.like(pattern, escape="\\")
+    return prefix_range(column, prefix)
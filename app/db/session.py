@@ -3,6 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 # app/db/session.py
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from app.core.config import get_settings
+from app.core import timing, deadline
+from app.db import row_counts, tombstones
 
 cfg = get_settings()
 engine = create_async_engine(
@@ -11,4 +13,10 @@ engine = create_async_engine(
     pool_pre_ping=True,
     echo=(cfg.LOG_LEVEL=="DEBUG"),
 )
-AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
\ No newline at end of file
+AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+if cfg.SERVER_TIMING_ENABLED:
+    timing.instrument_engine(engine.sync_engine)
+deadline.instrument_engine(engine.sync_engine)
+row_counts.install()
+tombstones.install()
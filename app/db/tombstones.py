@@ -0,0 +1,22 @@
+# app/db/tombstones.py
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+from app.db.models.tombstone_model import Tombstone
+from app.utils.dates import utcnow_naive
+
+# Entities exposed through /api/tombstones; deletes cascaded by the ORM (a car's policies and claims) are recorded too
+TRACKED_TABLES = ("car", "owner", "insurance_policy", "claim")
+
+def _record_deletes(session: Session, flush_context) -> None:
+    now = utcnow_naive()
+    rows = [
+        {"table_name": obj.__tablename__, "row_id": obj.id, "deleted_at": now}
+        for obj in session.deleted
+        if getattr(obj, "__tablename__", None) in TRACKED_TABLES
+    ]
+    if rows:
+        session.connection().execute(insert(Tombstone), rows)
+
+def install(session_class=Session) -> None:
+    if not event.contains(session_class, "after_flush", _record_deletes):
+        event.listen(session_class, "after_flush", _record_deletes)
@@ -1,12 +1,48 @@
 from fastapi import FastAPI
 import logging
 from app.core.config import get_settings
-from app.core import middleware
-from app.api.routers import cars, owners, claims, health, policies, auth, history
+from app.core import middleware, timing
+from app.core.compression import CompressionMiddleware
+from app.core.single_flight import SingleFlightMiddleware, KEY_HEADERS
+from app.core.admission import AdmissionControlMiddleware, build_limiters
+from app.core.deadline import DeadlineMiddleware
+from app.api.errors import register_exception_handlers
+from app.api.routers import cars, owners, claims, health, policies, auth, history, tombstones
 from fastapi.middleware.cors import CORSMiddleware
+from app.db.pagination import NEXT_CURSOR_HEADER
+from app.db.row_counts import TOTAL_COUNT_HEADER, TOTAL_COUNT_ESTIMATED_HEADER
 
 cfg = get_settings()
 app = FastAPI(title=cfg.APP_NAME, debug=(cfg.ENV == "development"))
+if cfg.SINGLE_FLIGHT_ENABLED:
+    app.add_middleware(
+        SingleFlightMiddleware,
+        path_prefixes=cfg.SINGLE_FLIGHT_PATH_PREFIXES,
+        max_waiters=cfg.SINGLE_FLIGHT_MAX_WAITERS,
+        max_body_bytes=cfg.SINGLE_FLIGHT_MAX_BODY_BYTES,
+        # The leader runs under its own deadline, so only requests with the same budget coalesce
+        key_headers=(*KEY_HEADERS, cfg.REQUEST_TIMEOUT_HEADER),
+    )
+if cfg.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=cfg.COMPRESSION_MIN_SIZE,
+        gzip_level=cfg.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=cfg.COMPRESSION_BROTLI_QUALITY,
+        thread_threshold=cfg.COMPRESSION_THREAD_THRESHOLD,
+    )
+if cfg.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limiters=build_limiters(),
+        retry_after=cfg.ADMISSION_RETRY_AFTER_SECONDS,
+    )
+app.add_middleware(
+    DeadlineMiddleware,
+    default_timeout=cfg.REQUEST_TIMEOUT_SECONDS,
+    max_timeout=cfg.REQUEST_TIMEOUT_MAX_SECONDS,
+    header=cfg.REQUEST_TIMEOUT_HEADER,
+)
 app.add_middleware(middleware.RequestIdMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -14,7 +50,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the paging headers
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_ESTIMATED_HEADER],
 )
+if cfg.SERVER_TIMING_ENABLED:
+    app.add_middleware(timing.ServerTimingMiddleware)
+register_exception_handlers(app)
 app.include_router(cars.router)
 app.include_router(owners.router)
 app.include_router(health.router)
@@ -22,6 +63,7 @@ app.include_router(claims.router)
 app.include_router(policies.router)
 app.include_router(history.router)
 app.include_router(auth.router)
+app.include_router(tombstones.router)
 
 logging.basicConfig(level=getattr(logging, cfg.LOG_LEVEL),
                     format="%(asctime)s %(levelname)s %(name)s: %(message)s")
\ No newline at end of file
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+class ApiKeyCreate(BaseModel):
+    name: str = Field(alias="name")
+
+class ApiKeyResponse(BaseModel):
+    id: int = Field(alias="id")
+    name: str = Field(alias="name")
+    prefix: str = Field(alias="prefix")
+    is_active: bool = Field(alias="isActive")
+    created_at: datetime = Field(alias="createdAt")
+
+    model_config = {"from_attributes": True, "populate_by_name": True}
+
+class ApiKeyCreated(ApiKeyResponse):
+    # Returned only once, at creation; only its hash is stored
+    api_key: str = Field(alias="apiKey")
@@ -1,9 +1,13 @@
 from pydantic import BaseModel, field_validator, Field
 from typing import Optional
+from datetime import datetime
 from app.utils.dates import validate_year_of_manufacture
 
 from app.schemas.owner_schema import OwnerResponse
 
+def normalize_vin(value: str) -> str:
+    return value.strip().upper()
+
 class CarBase(BaseModel):
     vin: str = Field(alias="vin")
     make: Optional[str] = Field(default=None, alias="make")
@@ -17,7 +21,7 @@ class CarCreate(CarBase):
     @field_validator('vin')
     @classmethod
     def normalize_vin(cls, v: str) -> str:
-        v = v.strip().upper()
+        v = normalize_vin(v)
         if len(v) != 17:
             raise ValueError("VIN must be exactly 17 characters long")
         return v
@@ -46,6 +50,16 @@ class CarUpdate(BaseModel):
 
 class CarResponse(CarBase):
     id: int = Field(alias="id")
+    updated_at: Optional[datetime] = Field(default=None, alias="updatedAt")
 
 class CarWithOwnerResponse(CarResponse):
     owner: 'OwnerResponse' = Field(alias="owner")
+
+class CarFilter(BaseModel):
+    """Query filters for the car listing; each one is backed by an index on car."""
+    make: Optional[str] = Field(default=None, alias="make")
+    model: Optional[str] = Field(default=None, alias="model")
+    year_from: Optional[int] = Field(default=None, alias="yearFrom", description="Minimum yearOfManufacture, inclusive")
+    year_to: Optional[int] = Field(default=None, alias="yearTo", description="Maximum yearOfManufacture, inclusive")
+    owner_id: Optional[int] = Field(default=None, alias="ownerId")
+    model_config = { "populate_by_name": True }
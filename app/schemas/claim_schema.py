@@ -19,6 +19,7 @@ class ClaimCreate(ClaimBase):
 
 class ClaimResponse(ClaimBase):
     id: int
+    updated_at: Optional[datetime] = Field(default=None, alias="updatedAt")
 
 class ClaimUpdate(BaseModel):
     claim_date: Optional[date] = Field(default=None, alias="claimDate")
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, field_validator, Field, EmailStr
 from typing import Optional
+from datetime import datetime
 
 class OwnerBase(BaseModel):
     name: str = Field(alias="name")
@@ -12,6 +13,7 @@ class OwnerCreate(OwnerBase):
 
 class OwnerResponse(OwnerBase):
     id: int = Field(alias="id")
+    updated_at: Optional[datetime] = Field(default=None, alias="updatedAt")
 
 
 class OwnerUpdate(BaseModel):
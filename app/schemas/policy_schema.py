@@ -1,7 +1,7 @@
 from pydantic import BaseModel, field_validator, Field
 from typing import Optional
 from app.utils.dates import validate_start_end_dates, validate_start_end_dates_optional
-from datetime import date
+from datetime import date, datetime
 
 class InsurancePolicyBase(BaseModel):
     car_id: int = Field(alias="carId")
@@ -21,6 +21,7 @@ class InsurancePolicyCreate(InsurancePolicyBase):
 
 class InsurancePolicyResponse(InsurancePolicyBase):
     id: int = Field(alias="id")
+    updated_at: Optional[datetime] = Field(default=None, alias="updatedAt")
 
 class InsurancePolicyUpdate(BaseModel):
     provider: Optional[str] = Field(default=None, alias="provider")
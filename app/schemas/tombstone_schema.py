@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+class TombstoneResponse(BaseModel):
+    table_name: str = Field(alias="entity")
+    row_id: int = Field(alias="id")
+    deleted_at: datetime = Field(alias="deletedAt")
+    model_config = { "from_attributes": True,
+                     "populate_by_name": True }
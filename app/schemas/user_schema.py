@@ -1,5 +1,6 @@
 
 from pydantic import BaseModel, Field, EmailStr
+from datetime import datetime
 
 class UserBase(BaseModel):
     username: str = Field(alias="username")
@@ -10,7 +11,7 @@ class UserCreate(UserBase):
 
 class User(UserBase):
     id: int = Field(alias="id")
-    full_name: str = Field(alias="fullName")
+    full_name: str | None = Field(default=None, alias="fullName")
     is_active: bool = Field(alias="isActive")
     is_superuser: bool = Field(alias="isSuperuser")
 
@@ -26,3 +27,10 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     username: str | None = Field(default=None, alias="username")
+    user_id: int | None = Field(default=None, alias="userId")
+    is_active: bool | None = Field(default=None, alias="isActive")
+    is_superuser: bool | None = Field(default=None, alias="isSuperuser")
+    jti: str | None = Field(default=None, alias="jti")
+    expires_at: datetime | None = Field(default=None, alias="expiresAt")
+
+    model_config = {"populate_by_name": True}
@@ -0,0 +1,23 @@
+from app.db.repositories.api_key_repository import ApiKeyRepository
+from app.db.models.api_key_model import ApiKey
+from app.auth.api_keys import generate_api_key, hash_api_key, invalidate_api_key
+
+class ApiKeyService:
+    def __init__(self, api_key_repository: ApiKeyRepository):
+        self.api_key_repository = api_key_repository
+
+    async def create_api_key(self, user_id: int, name: str) -> tuple[ApiKey, str]:
+        raw_key = generate_api_key()
+        api_key = ApiKey(key_hash=hash_api_key(raw_key), prefix=raw_key[:12], name=name, user_id=user_id)
+        return await self.api_key_repository.add(api_key), raw_key
+
+    async def list_api_keys(self, user_id: int) -> list[ApiKey]:
+        return list(await self.api_key_repository.list_for_user(user_id))
+
+    async def revoke_api_key(self, user_id: int, api_key_id: int) -> ApiKey:
+        api_key = await self.api_key_repository.get(api_key_id)
+        if not api_key or api_key.user_id != user_id:
+            raise ValueError(f"API key with ID {api_key_id} does not exist.")
+        api_key = await self.api_key_repository.deactivate(api_key_id)
+        invalidate_api_key(api_key.key_hash)
+        return api_key
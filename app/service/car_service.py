@@ -2,6 +2,15 @@ from app.db.repositories.car_repository import CarRepository
 from app.db.models.car_model import Car
 from app.db.repositories.policy_repository import PolicyRepository
 from app.db.repositories.claim_repository import ClaimRepository
+from app.db.models.owner_model import Owner
+from app.db.projection import Projection
+from app.schemas.car_schema import CarWithOwnerResponse, CarFilter, normalize_vin
+from app.core.config import get_settings
+from app.schemas.owner_schema import OwnerResponse
+
+settings = get_settings()
+
+CAR_FIELDS = Projection(Car, CarWithOwnerResponse, {"owner": (Car.owner, Projection(Owner, OwnerResponse))})
 
 class CarService:
     def __init__(self, car_repository: CarRepository):
@@ -10,9 +19,19 @@ class CarService:
     async def get_car(self, id: int) -> Car | None:
         return await self.car_repository.get(id)
     
+    async def get_car_version(self, id: int) -> str | None:
+        return await self.car_repository.get_version(id)
+
     async def get_car_by_vin(self, vin: str) -> Car | None:
         return await self.car_repository.get_car_by_vin(vin)
     
+    async def search_cars_by_vin(self, vin: str, limit: int) -> list[Car]:
+        fragment = normalize_vin(vin)
+        min_length = settings.VIN_SEARCH_MIN_LENGTH
+        if len(fragment) < min_length:
+            raise ValueError(f"VIN search needs at least {min_length} characters")
+        return await self.car_repository.search_by_vin(fragment, limit)
+
     async def add_car(self, car: Car) -> Car:
         existing_car = await self.car_repository.get_car_by_vin(car.vin)
         if existing_car:
@@ -33,10 +52,32 @@ class CarService:
     async def list_cars(self) -> list[Car]:
         return list(await self.car_repository.list())
     
-    async def list_cars_with_owner(self) -> list[Car]:
-        return list(await self.car_repository.list_with_owner())
+    async def list_cars_with_owner(self, filters: CarFilter | None = None, sort: str = "id") -> list[Car]:
+        return list(await self.car_repository.list_with_owner(filters, sort))
+
+    async def count_cars(self, estimate: bool = False, filters: CarFilter | None = None):
+        return await self.car_repository.count(estimate, filters)
+
+    async def list_cars_page(self, page, filters: CarFilter | None = None):
+        return await self.car_repository.list_page_with_owner(page, filters)
+
+    def stream_cars_with_owner(self, batch_size: int, filters: CarFilter | None = None, sort: str = "id"):
+        return self.car_repository.stream_with_owner(batch_size, filters, sort)
 
     
+    async def list_cars_projected(self, fields: str, filters: CarFilter | None = None, sort: str = "id") -> list[dict]:
+        # Raises ValueError for unknown field names
+        selection = CAR_FIELDS.parse(fields)
+        return await self.car_repository.list_projected(CAR_FIELDS, selection, filters, sort)
+
+    async def list_cars_projected_page(self, fields: str, page, filters: CarFilter | None = None):
+        selection = CAR_FIELDS.parse(fields)
+        return await self.car_repository.list_projected_page(CAR_FIELDS, selection, page, filters)
+
+    async def get_car_projected(self, id: int, fields: str) -> dict | None:
+        selection = CAR_FIELDS.parse(fields)
+        return await self.car_repository.get_projected(CAR_FIELDS, selection, id)
+
     async def delete_car(self, id: int) -> None:
         car = await self.car_repository.get(id)
         if not car:
@@ -24,4 +24,13 @@ class ClaimService:
         return await self.claim_repository.update(claim)
     
     async def list_claims(self) -> list[Claim]:
-        return list(await self.claim_repository.list())
\ No newline at end of file
+        return list(await self.claim_repository.list())
+
+    async def count_claims(self, estimate: bool = False):
+        return await self.claim_repository.count(estimate)
+
+    async def list_claims_page(self, page):
+        return await self.claim_repository.list_page(page)
+
+    def stream_claims(self, batch_size: int):
+        return self.claim_repository.stream(batch_size)
\ No newline at end of file
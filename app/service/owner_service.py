@@ -1,5 +1,9 @@
 from app.db.repositories.owner_repository import OwnerRepository
 from app.db.models.owner_model import Owner
+from app.db.projection import Projection
+from app.schemas.owner_schema import OwnerResponse
+
+OWNER_FIELDS = Projection(Owner, OwnerResponse)
 
 class OwnerService:
     def __init__(self, owner_repository: OwnerRepository):
@@ -8,6 +12,9 @@ class OwnerService:
     async def get_owner(self, id: int) -> Owner | None:
         return await self.owner_repository.get(id)
     
+    async def get_owner_version(self, id: int) -> str | None:
+        return await self.owner_repository.get_version(id)
+
     async def add_owner(self, owner: Owner) -> Owner:
         return await self.owner_repository.add(owner)
     
@@ -18,4 +25,32 @@ class OwnerService:
         return await self.owner_repository.update(owner)
     
     async def list_owners(self) -> list[Owner]:
-        return list(await self.owner_repository.list())
\ No newline at end of file
+        return list(await self.owner_repository.list())
+
+    async def search_owners(self, name: str | None, email: str | None, limit: int) -> list[Owner]:
+        name = (name or "").strip().lower()
+        email = (email or "").strip().lower()
+        if not name and not email:
+            raise ValueError("Provide name or email to search owners")
+        return await self.owner_repository.search(name or None, email or None, limit)
+
+    async def count_owners(self, estimate: bool = False):
+        return await self.owner_repository.count(estimate)
+
+    async def list_owners_page(self, page):
+        return await self.owner_repository.list_page(page)
+
+    def stream_owners(self, batch_size: int):
+        return self.owner_repository.stream(batch_size)
+
+    async def list_owners_projected(self, fields: str) -> list[dict]:
+        selection = OWNER_FIELDS.parse(fields)
+        return await self.owner_repository.list_projected(OWNER_FIELDS, selection)
+
+    async def list_owners_projected_page(self, fields: str, page):
+        selection = OWNER_FIELDS.parse(fields)
+        return await self.owner_repository.list_projected_page(OWNER_FIELDS, selection, page)
+
+    async def get_owner_projected(self, id: int, fields: str) -> dict | None:
+        selection = OWNER_FIELDS.parse(fields)
+        return await self.owner_repository.get_projected(OWNER_FIELDS, selection, id)
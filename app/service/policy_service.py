@@ -11,6 +11,9 @@ class PolicyService:
     async def get_policies_by_car_id(self, car_id: int) -> list[InsurancePolicy]:
         return await self.policy_repository.get_policies_by_car_id(car_id)
 
+    async def get_policy_versions_by_car_id(self, car_id: int) -> list[tuple[int, str]]:
+        return await self.policy_repository.get_versions_by_car_id(car_id)
+
     async def add_policy(self, policy: InsurancePolicy) -> InsurancePolicy:
         return await self.policy_repository.add(policy)
     
@@ -31,3 +34,12 @@ class PolicyService:
 
     async def list_policies(self) -> list[InsurancePolicy]:
         return list(await self.policy_repository.list())
+
+    async def count_policies(self, estimate: bool = False):
+        return await self.policy_repository.count(estimate)
+
+    async def list_policies_page(self, page):
+        return await self.policy_repository.list_page(page)
+
+    def stream_policies(self, batch_size: int):
+        return self.policy_repository.stream(batch_size)
@@ -0,0 +1,57 @@
+import hashlib
+import secrets
+import uuid
+from datetime import timedelta
+from app.core.config import get_settings
+from app.auth.jwt import create_access_token, build_token_claims
+from app.db.models.refresh_token_model import RefreshToken
+from app.db.repositories.refresh_token_repository import RefreshTokenRepository
+from app.utils.dates import utcnow_naive
+
+settings = get_settings()
+
+def hash_refresh_token(raw_token: str) -> str:
+    # Refresh tokens are 256-bit random strings; a plain SHA-256 is enough to store them
+    return hashlib.sha256(raw_token.encode()).hexdigest()
+
+class TokenService:
+    def __init__(self, refresh_token_repository: RefreshTokenRepository):
+        self.refresh_token_repository = refresh_token_repository
+
+    def _token_response(self, user, refresh_token: str) -> dict:
+        return {
+            "access_token": create_access_token(data=build_token_claims(user)),
+            "token_type": "bearer",
+            "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+            "refresh_token": refresh_token,
+        }
+
+    async def _new_refresh_token(self, user_id: int, family_id: str, commit: bool) -> str:
+        raw_token = secrets.token_urlsafe(32)
+        await self.refresh_token_repository.add(
+            RefreshToken(
+                token_hash=hash_refresh_token(raw_token),
+                family_id=family_id,
+                user_id=user_id,
+                expires_at=utcnow_naive() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            ),
+            commit=commit,
+        )
+        return raw_token
+
+    async def issue_tokens(self, user) -> dict:
+        refresh_token = await self._new_refresh_token(user.id, uuid.uuid4().hex, commit=True)
+        return self._token_response(user, refresh_token)
+
+    async def refresh_tokens(self, raw_token: str) -> dict:
+        now = utcnow_naive()
+        stored = await self.refresh_token_repository.get_by_hash(hash_refresh_token(raw_token))
+        if not stored or stored.expires_at <= now or not stored.user or not stored.user.is_active:
+            raise ValueError("Invalid refresh token")
+        if stored.revoked_at is not None or not await self.refresh_token_repository.mark_used(stored.id, now):
+            # A rotated token was presented again: assume it leaked and kill the whole chain
+            await self.refresh_token_repository.revoke_family(stored.family_id, now)
+            raise ValueError("Refresh token reuse detected")
+        refresh_token = await self._new_refresh_token(stored.user_id, stored.family_id, commit=False)
+        await self.refresh_token_repository.commit()
+        return self._token_response(stored.user, refresh_token)
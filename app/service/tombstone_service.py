@@ -0,0 +1,8 @@
+from app.db.repositories.tombstone_repository import TombstoneRepository
+
+class TombstoneService:
+    def __init__(self, tombstone_repository: TombstoneRepository):
+        self.tombstone_repository = tombstone_repository
+
+    async def list_tombstones_page(self, page, entity: str | None = None):
+        return await self.tombstone_repository.list_page(page, entity)
@@ -1,7 +1,17 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 from app.schemas.user_schema import UserCreate
 from app.db.repositories.user_repository import UserRepository
 
+def _duplicate_field(exc: IntegrityError) -> str | None:
+    # SQLite: "UNIQUE constraint failed: user.username"
+    # Postgres: 'unique constraint "user_username_key" ... Key (username)=(...)'
+    message = str(exc.orig).lower()
+    for field in ("username", "email"):
+        if f"user.{field}" in message or f"user_{field}" in message or f"({field})" in message:
+            return field
+    return None
+
 class UserService:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
@@ -16,8 +26,46 @@ class UserService:
         return await self.user_repository.get_user_by_email(email)
 
     async def create_user(self, user: UserCreate):
-        if await self.get_user_by_username(user.username):
-            raise ValueError(f"Username {user.username} is already taken.")
-        if await self.get_user_by_email(user.email):
-            raise ValueError(f"Email {user.email} is already registered.")
-        return await self.user_repository.create_user(user)
+        try:
+            return await self.user_repository.create_user(user)
+        except IntegrityError as e:
+            field = _duplicate_field(e)
+            # Error path only: keep reporting the username first when both collide
+            if field != "username" and await self.user_repository.get_user_by_username(user.username):
+                field = "username"
+            if field == "username":
+                raise ValueError(f"Username {user.username} is already taken.") from e
+            if field == "email":
+                raise ValueError(f"Email {user.email} is already registered.") from e
+            raise ValueError("User could not be created.") from e
+
+    async def create_users(self, users: list[UserCreate]) -> int:
+        seen_usernames, seen_emails = set(), set()
+        for user in users:
+            if user.username in seen_usernames:
+                raise ValueError(f"Username {user.username} appears more than once.")
+            if user.email in seen_emails:
+                raise ValueError(f"Email {user.email} appears more than once.")
+            seen_usernames.add(user.username)
+            seen_emails.add(user.email)
+        try:
+            return await self.user_repository.create_users(users)
+        except IntegrityError as e:
+            field = _duplicate_field(e)
+            if field == "username":
+                raise ValueError("One or more usernames are already taken.") from e
+            if field == "email":
+                raise ValueError("One or more emails are already registered.") from e
+            raise ValueError("Users could not be created.") from e
+
+    async def update_user(self, user):
+        existing_user = await self.user_repository.get_user(user.id)
+        if not existing_user:
+            raise ValueError(f"User with ID {user.id} does not exist.")
+        return await self.user_repository.update_user(user)
+
+    async def deactivate_user(self, username: str):
+        user = await self.user_repository.set_active(username, False)
+        if not user:
+            raise ValueError(f"User {username} does not exist.")
+        return user
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime, timezone
 
 def validate_date_range(d: date, field_name: str = "date") -> date:
     if not (1900 <= d.year <= 2100):
@@ -29,4 +29,14 @@ def validate_year_of_manufacture(year: int) -> int:
     current_year = date.today().year
     if not (1886 <= year <= current_year):  # First car invented in 1886
         raise ValueError(f"year_of_manufacture must be between 1886 and {current_year}")
-    return year
\ No newline at end of file
+    return year
+
+def utcnow_naive() -> datetime:
+    # DB timestamps (DateTime without timezone) are stored as naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Client timestamps: aware ones are converted to UTC, naive ones are taken as UTC."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,41 @@
+# app/utils/etag.py
+import hashlib
+from typing import Any, Iterable, Optional, Tuple
+from fastapi import Request, Response
+
+# CompressionMiddleware marks compressed representations as "<tag>-<encoding>"
+_ENCODING_SUFFIXES = ("-gzip", "-br")
+
+def entity_etag(version: str) -> str:
+    return f'"{version}"'
+
+def collection_etag(versions: Iterable[Tuple[Any, str]]) -> str:
+    """Strong ETag over (id, version) pairs: changes when a member is added, removed or updated."""
+    digest = hashlib.sha256()
+    for id, version in sorted(versions):
+        digest.update(f"{id}:{version};".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+def _base_tag(tag: str) -> str:
+    if tag.startswith("W/"):
+        tag = tag[2:]  # If-None-Match uses the weak comparison
+    for suffix in _ENCODING_SUFFIXES:
+        if tag.endswith(suffix + '"'):
+            return tag[: -len(suffix) - 1] + '"'
+    return tag
+
+def matching_etag(request: Request, etag: Optional[str]) -> Optional[str]:
+    """The If-None-Match entry (as the client sent it) that still matches etag, else None."""
+    header = request.headers.get("if-none-match")
+    if not header or etag is None:
+        return None
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return etag
+        if _base_tag(candidate) == etag:
+            return candidate
+    return None
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
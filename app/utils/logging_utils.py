@@ -4,6 +4,7 @@ import functools
 import inspect
 import structlog
 from app.core.logging import logger
+from app.core import timing
 
 log = logger
 
@@ -16,15 +17,20 @@ def log_event(event: str, level: str = "info", include_args: bool = False):
         if inspect.iscoroutinefunction(func):
             @functools.wraps(func)
             async def aw(*args, **kwargs):
+                with timing.measure("log"):
+                    if include_args:
+                        log.info(f"{event}_started", args=args, kwargs=kwargs)
+                    else:
+                        log.info(f"{event}_started")
                 start = time.perf_counter()
-                if include_args:
-                    log.info(f"{event}_started", args=args, kwargs=kwargs)
-                else:
-                    log.info(f"{event}_started")
                 try:
                     result = await func(*args, **kwargs)
-                    dur = round(time.perf_counter() - start, 3)
-                    getattr(log, level.lower())(f"{event}_completed", duration=dur)
+                    elapsed = time.perf_counter() - start
+                    timing.record("handler", elapsed)
+                    dur = round(elapsed, 3)
+                    with timing.measure("log"):
+                        getattr(log, level.lower())(f"{event}_completed", duration=dur)
+                    timing.mark_handler_end()
                     return result
                 except Exception as exc:
                     dur = round(time.perf_counter() - start, 3)
@@ -34,15 +40,20 @@ def log_event(event: str, level: str = "info", include_args: bool = False):
         else:
             @functools.wraps(func)
             def w(*args, **kwargs):
+                with timing.measure("log"):
+                    if include_args:
+                        log.info(f"{event}_started", args=args, kwargs=kwargs)
+                    else:
+                        log.info(f"{event}_started")
                 start = time.perf_counter()
-                if include_args:
-                    log.info(f"{event}_started", args=args, kwargs=kwargs)
-                else:
-                    log.info(f"{event}_started")
                 try:
                     result = func(*args, **kwargs)
-                    dur = round(time.perf_counter() - start, 3)
-                    getattr(log, level.lower())(f"{event}_completed", duration=dur)
+                    elapsed = time.perf_counter() - start
+                    timing.record("handler", elapsed)
+                    dur = round(elapsed, 3)
+                    with timing.measure("log"):
+                        getattr(log, level.lower())(f"{event}_completed", duration=dur)
+                    timing.mark_handler_end()
                     return result
                 except Exception as exc:
                     dur = round(time.perf_counter() - start, 3)
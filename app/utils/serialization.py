@@ -0,0 +1,114 @@
+# app/utils/serialization.py
+import functools
+import types
+from decimal import Decimal
+from typing import Any, AsyncIterable, Callable, Iterable, Mapping, Optional, Union, get_args, get_origin
+import orjson
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
+from app.core.config import get_settings
+
+settings = get_settings()
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def _converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Conversion needed for a non-None value of this annotation; None means pass it through."""
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _converter(args[0]) if len(args) == 1 else None
+    if origin in (list, tuple, set):
+        args = get_args(annotation)
+        inner = _converter(args[0]) if args else None
+        if inner is None:
+            return list
+        return lambda values: [None if v is None else inner(v) for v in values]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return orm_serializer(annotation)
+    if annotation is float:
+        return float  # Numeric columns come back as Decimal
+    return None
+
+@functools.lru_cache(maxsize=None)
+def orm_serializer(schema: type[BaseModel]) -> Callable[[Any], dict]:
+    """
+    Compiles a schema into a function mapping an ORM row straight to a dict keyed by the
+    schema's aliases, without building (and validating) a Pydantic model per row.
+    Dicts and models go through the schema as before.
+    """
+    plan = [
+        (name, field.alias or name, _converter(field.annotation))
+        for name, field in schema.model_fields.items()
+    ]
+
+    def serialize(obj: Any) -> dict:
+        if isinstance(obj, dict):
+            obj = schema.model_validate(obj)
+        if isinstance(obj, BaseModel):
+            return obj.model_dump(mode="json", by_alias=True)
+        out = {}
+        for attr, key, convert in plan:
+            value = getattr(obj, attr)
+            out[key] = value if convert is None or value is None else convert(value)
+        return out
+
+    return serialize
+
+def dumps(schema: type[BaseModel], content: Any, many: bool = True) -> bytes:
+    serialize = orm_serializer(schema)
+    data = [serialize(row) for row in content] if many else serialize(content)
+    return orjson.dumps(data, default=_orjson_default)
+
+def orm_json_response(
+    schema: type[BaseModel],
+    content: Any,
+    many: bool = True,
+    status_code: int = 200,
+    response: Optional[Response] = None,
+):
+    """
+    Returns a ready JSON response for ORM rows, so FastAPI skips response_model validation
+    and jsonable_encoder. Keep response_model on the route for the OpenAPI schema.
+    With FAST_JSON_ENABLED off, the rows are returned unchanged (regular FastAPI path).
+    Pass the route's injected `response` to keep headers set on it.
+    """
+    if not settings.FAST_JSON_ENABLED:
+        return content
+    return json_bytes_response(dumps(schema, content, many), status_code, response.headers if response else None)
+
+def _copy_headers(out: Response, headers: Optional[Mapping[str, str]]) -> Response:
+    for key, value in (headers or {}).items():
+        if key not in ("content-length", "content-type"):
+            out.headers[key] = value
+    return out
+
+def json_bytes_response(body: bytes, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> Response:
+    return _copy_headers(Response(body, status_code=status_code, media_type="application/json"), headers)
+
+def json_response(data: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """Plain data (dicts, lists, dates, Decimals) encoded with orjson."""
+    return json_bytes_response(orjson.dumps(data, default=_orjson_default), status_code, headers)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def accepts_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+def ndjson_response(
+    schema: type[BaseModel],
+    partitions: AsyncIterable[Iterable[Any]],
+    headers: Optional[Mapping[str, str]] = None,
+) -> StreamingResponse:
+    """One JSON document per line, written out batch by batch as the cursor yields rows."""
+    serialize = orm_serializer(schema)
+
+    async def lines():
+        async for rows in partitions:
+            yield b"".join(orjson.dumps(serialize(row), default=_orjson_default) + b"\n" for row in rows)
+
+    return _copy_headers(StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE), headers)
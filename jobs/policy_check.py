@@ -7,6 +7,9 @@ from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import get_settings
 from app.db.repositories.policy_repository import PolicyRepository
+from app.db.repositories.revoked_token_repository import RevokedTokenRepository
+from app.db.repositories.refresh_token_repository import RefreshTokenRepository
+from app.utils.dates import utcnow_naive
 from app.service import policy_service
 from app.utils.logging_utils import log_info, log_event
 from app.db.session import AsyncSessionLocal # dacă e greu de folosit în worker, instanțiază repo direct
@@ -49,6 +52,18 @@ async def check_policy_expiry():
             await repo.update_policy_logged_expiry(p.id, p.logged_expiry_at)
             log_info("policy_expiry_logged", policy_id=p.id, logged_at=now.isoformat())
 
+async def purge_revoked_tokens():
+    # Expired tokens fail validation anyway; their revocations only grow the table and the in-memory set
+    async with AsyncSessionLocal() as session:
+        purged = await RevokedTokenRepository(session).purge_expired(utcnow_naive())
+    log_info("revoked_tokens_purged", count=purged)
+
+async def purge_refresh_tokens():
+    # Every login and refresh adds a row; expired ones (rotated, revoked or not) are dead weight
+    async with AsyncSessionLocal() as session:
+        purged = await RefreshTokenRepository(session).purge_expired(utcnow_naive())
+    log_info("refresh_tokens_purged", count=purged)
+
 async def main():
     log_info("policy_expiry_worker_starting", tz=TIMEZONE, interval_min=JOB_INTERVAL_MINUTES)
 
@@ -62,6 +77,24 @@ async def main():
         coalesce=True,
         misfire_grace_time=60,
     )
+    scheduler.add_job(
+        purge_revoked_tokens,
+        trigger=IntervalTrigger(minutes=settings.TOKEN_REVOCATION_PURGE_MINUTES),
+        id="revoked_token_purge_job",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=60,
+    )
+    scheduler.add_job(
+        purge_refresh_tokens,
+        trigger=IntervalTrigger(minutes=settings.REFRESH_TOKEN_PURGE_MINUTES),
+        id="refresh_token_purge_job",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=60,
+    )
     scheduler.start()
     log_info("policy_expiry_worker_started")
 
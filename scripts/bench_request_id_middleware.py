@@ -0,0 +1,59 @@
+"""
+Per-request overhead of RequestIdMiddleware: the old BaseHTTPMiddleware version
+against the pure ASGI one, on a trivial endpoint (no DB).
+
+    python -m scripts.bench_request_id_middleware [requests]
+"""
+import asyncio
+import sys
+import time
+import uuid
+from fastapi import FastAPI, Request
+from httpx import AsyncClient, ASGITransport
+from starlette.middleware.base import BaseHTTPMiddleware
+from structlog.contextvars import bind_contextvars, clear_contextvars
+from app.core.middleware import REQUEST_ID_HEADER, RequestIdMiddleware
+
+class LegacyRequestIdMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        rid = request.headers.get(REQUEST_ID_HEADER, str(uuid.uuid4()))
+        bind_contextvars(request_id=rid, path=str(request.url.path), method=request.method)
+        try:
+            response = await call_next(request)
+            response.headers[REQUEST_ID_HEADER] = rid
+            return response
+        finally:
+            clear_contextvars()
+
+def build_app(middleware_class=None) -> FastAPI:
+    app = FastAPI()
+    if middleware_class:
+        app.add_middleware(middleware_class)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+async def run(app: FastAPI, requests: int) -> float:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(200):
+            await client.get("/ping")
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/ping")
+        return (time.perf_counter() - start) / requests * 1e6
+
+async def main(requests: int) -> None:
+    baseline = await run(build_app(), requests)
+    print(f"{'no middleware':<22}{baseline:9.1f} us/request")
+    for name, middleware_class in (
+        ("BaseHTTPMiddleware", LegacyRequestIdMiddleware),
+        ("pure ASGI", RequestIdMiddleware),
+    ):
+        per_request = await run(build_app(middleware_class), requests)
+        print(f"{name:<22}{per_request:9.1f} us/request  (+{per_request - baseline:.1f} us overhead)")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,61 @@
+"""
+Serializing a large GET /api/cars/ payload: the regular FastAPI path (response_model
+validation from ORM attributes, serialization to JSON-able python, json.dumps in
+JSONResponse) against the orjson fast path.
+
+    python -m scripts.bench_serialization [rows]
+"""
+import json
+import sys
+import time
+from typing import List
+from pydantic import TypeAdapter
+from app.db.models.car_model import Car
+from app.db.models.owner_model import Owner
+from app.db.models import claim_model, policy_model  # registers the mappers Car relates to
+from app.schemas.car_schema import CarWithOwnerResponse
+from app.utils.serialization import dumps
+
+def build_rows(count: int) -> list:
+    owners = [Owner(id=i, name=f"Owner {i}", email=f"owner{i}@example.com") for i in range(1, 1001)]
+    return [
+        Car(
+            id=i,
+            vin=f"VIN{i:014d}",
+            make="Dacia",
+            model="Logan",
+            year_of_manufacture=2000 + i % 25,
+            owner_id=owners[i % 1000].id,
+            owner=owners[i % 1000],
+        )
+        for i in range(1, count + 1)
+    ]
+
+def fastapi_path(rows: list) -> bytes:
+    adapter = TypeAdapter(List[CarWithOwnerResponse])
+    validated = adapter.validate_python(rows, from_attributes=True)
+    content = adapter.dump_python(validated, mode="json", by_alias=True)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+def fast_path(rows: list) -> bytes:
+    return dumps(CarWithOwnerResponse, rows)
+
+def measure(fn, rows: list, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(count: int) -> None:
+    rows = build_rows(count)
+    assert json.loads(fastapi_path(rows)) == json.loads(fast_path(rows))
+    baseline = measure(fastapi_path, rows)
+    fast = measure(fast_path, rows)
+    for name, seconds in (("response_model + json", baseline), ("orjson fast path", fast)):
+        print(f"{name:<24}{seconds * 1000:9.1f} ms  {count / seconds:12,.0f} rows/s")
+    print(f"speedup: {baseline / fast:.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,196 @@
+import uuid
+from types import SimpleNamespace
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.auth import oauth2
+from app.api.deps import get_async_session
+from app.db.repositories.user_repository import UserRepository
+from app.schemas.user_schema import UserCreate
+
+@pytest.fixture
+async def credentials():
+    username = f"auth_{uuid.uuid4().hex[:8]}"
+    password = "testpassword"
+    async for session in get_async_session():
+        await UserRepository(session).create_user(
+            UserCreate(username=username, email=f"{username}@example.com", password=password)
+        )
+    return username, password
+
+@pytest.mark.asyncio
+async def test_login_success(credentials):
+    username, password = credentials
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.post("/token", data={"username": username, "password": password})
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+    assert response.json()["access_token"]
+
+@pytest.mark.asyncio
+async def test_login_wrong_password(credentials):
+    username, _ = credentials
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.post("/token", data={"username": username, "password": "wrong"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Incorrect username or password"
+
+@pytest.mark.asyncio
+async def test_refresh_token_rotation(credentials):
+    username, password = credentials
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        login = (await ac.post("/token", data={"username": username, "password": password})).json()
+        assert login["refresh_token"]
+        assert login["expires_in"] > 0
+        response = await ac.post("/token", data={"grant_type": "refresh_token", "refresh_token": login["refresh_token"]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["refresh_token"] != login["refresh_token"]
+    user = await oauth2.get_current_user(body["access_token"], None)
+    assert user.username == username
+
+@pytest.mark.asyncio
+async def test_refresh_token_reuse_revokes_family(credentials):
+    username, password = credentials
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = (await ac.post("/token", data={"username": username, "password": password})).json()["refresh_token"]
+        second = (await ac.post("/token", data={"grant_type": "refresh_token", "refresh_token": first})).json()["refresh_token"]
+        reuse = await ac.post("/token", data={"grant_type": "refresh_token", "refresh_token": first})
+        after_reuse = await ac.post("/token", data={"grant_type": "refresh_token", "refresh_token": second})
+        unknown = await ac.post("/token", data={"grant_type": "refresh_token", "refresh_token": "nope"})
+    assert reuse.status_code == 400
+    assert reuse.json()["detail"] == "Refresh token reuse detected"
+    assert after_reuse.status_code == 400
+    assert unknown.status_code == 400
+    assert unknown.json()["detail"] == "Invalid refresh token"
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_rejected(credentials):
+    username, password = credentials
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        token = (await ac.post("/token", data={"username": username, "password": password})).json()["access_token"]
+        user = await oauth2.get_current_user(token, None)
+        assert user.username == username
+        response = await ac.post("/token/revoke", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 204
+    with pytest.raises(HTTPException) as exc:
+        await oauth2.get_current_user(token, None)
+    assert exc.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_api_key_lifecycle(credentials):
+    username, password = credentials
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        token = (await ac.post("/token", data={"username": username, "password": password})).json()["access_token"]
+        user = await oauth2.get_current_user(token, None)
+        previous = app.dependency_overrides.get(oauth2.get_current_user)
+        app.dependency_overrides[oauth2.get_current_user] = lambda: user
+        try:
+            created = await ac.post("/api-keys/", json={"name": "billing-sync"})
+            assert created.status_code == 201
+            raw_key = created.json()["apiKey"]
+            assert created.json()["name"] == "billing-sync"
+            principal = await oauth2.get_current_user(None, raw_key)
+            assert principal.username == username
+            listed = await ac.get("/api-keys/")
+            assert [k["id"] for k in listed.json()] == [created.json()["id"]]
+            revoked = await ac.delete(f"/api-keys/{created.json()['id']}")
+            assert revoked.status_code == 204
+            missing = await ac.delete("/api-keys/999999")
+            assert missing.status_code == 404
+        finally:
+            if previous is None:
+                app.dependency_overrides.pop(oauth2.get_current_user, None)
+            else:
+                app.dependency_overrides[oauth2.get_current_user] = previous
+    with pytest.raises(HTTPException):
+        await oauth2.get_current_user(None, raw_key)
+
+@pytest.mark.asyncio
+async def test_get_current_user_requires_credentials():
+    with pytest.raises(HTTPException) as exc:
+        await oauth2.get_current_user(None, None)
+    assert exc.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_login_throttled_before_password_check():
+    from unittest.mock import AsyncMock, patch
+    from app.core.rate_limit import TokenBucketLimiter, LoginThrottle
+    throttle = LoginThrottle(
+        ip_limiter=TokenBucketLimiter(capacity=100, refill_per_second=1, max_keys=10),
+        user_limiter=TokenBucketLimiter(capacity=2, refill_per_second=0.01, max_keys=10),
+    )
+    verify = AsyncMock(return_value=False)
+    transport = ASGITransport(app=app)
+    with patch("app.api.routers.auth.login_throttle", throttle), \
+         patch("app.api.routers.auth.verify_password_async", verify):
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            statuses = [
+                (await ac.post("/token", data={"username": "string", "password": "wrong"})).status_code
+                for _ in range(3)
+            ]
+            throttled = await ac.post("/token", data={"username": "string", "password": "wrong"})
+    assert statuses[:2] == [400, 400]
+    assert statuses[2] == 429
+    assert int(throttled.headers["Retry-After"]) > 0
+    assert verify.await_count <= 2
+
+@pytest.mark.asyncio
+async def test_create_user_and_duplicate():
+    username = f"new_{uuid.uuid4().hex[:8]}"
+    payload = {"username": username, "email": f"{username}@example.com", "password": "pw"}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        created = await ac.post("/users/", json=payload)
+        duplicate = await ac.post("/users/", json=payload)
+        other_email = await ac.post("/users/", json={**payload, "username": username + "x"})
+    assert created.status_code == 201
+    assert created.json()["username"] == username
+    assert duplicate.status_code == 400
+    assert duplicate.json()["detail"] == f"Username {username} is already taken."
+    assert other_email.json()["detail"] == f"Email {username}@example.com is already registered."
+
+@pytest.mark.asyncio
+async def test_bulk_user_creation():
+    prefix = uuid.uuid4().hex[:8]
+    users = [{"username": f"bulk_{prefix}_{i}", "email": f"bulk_{prefix}_{i}@example.com", "password": "pw"} for i in range(10)]
+    transport = ASGITransport(app=app)
+    previous = app.dependency_overrides.get(oauth2.get_current_user)
+    app.dependency_overrides[oauth2.get_current_user] = lambda: SimpleNamespace(id=1, username="admin", is_superuser=True)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            response = await ac.post("/users/bulk", json=users)
+            again = await ac.post("/users/bulk", json=users[:1])
+    finally:
+        if previous is None:
+            app.dependency_overrides.pop(oauth2.get_current_user, None)
+        else:
+            app.dependency_overrides[oauth2.get_current_user] = previous
+    assert response.status_code == 201
+    assert response.json() == {"created": 10}
+    assert again.status_code == 400
+    async for session in get_async_session():
+        user = await UserRepository(session).get_user_by_username(f"bulk_{prefix}_9")
+        assert user is not None and user.is_active
+
+@pytest.mark.asyncio
+async def test_bulk_user_creation_requires_superuser():
+    transport = ASGITransport(app=app)
+    previous = app.dependency_overrides.get(oauth2.get_current_user)
+    app.dependency_overrides[oauth2.get_current_user] = lambda: SimpleNamespace(id=2, username="clerk", is_superuser=False)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            response = await ac.post("/users/bulk", json=[{"username": "x", "email": "x@example.com", "password": "pw"}])
+    finally:
+        if previous is None:
+            app.dependency_overrides.pop(oauth2.get_current_user, None)
+        else:
+            app.dependency_overrides[oauth2.get_current_user] = previous
+    assert response.status_code == 403
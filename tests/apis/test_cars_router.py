@@ -9,6 +9,7 @@ from app.db.models.user_model import User
 from app.db.repositories.user_repository import UserRepository
 from app.schemas.user_schema import UserCreate
 import uuid
+import json
 
 from unittest.mock import AsyncMock, patch
 
@@ -149,6 +150,226 @@ async def test_get_car_success(owner_id):
     assert resp_json["yearOfManufacture"] == car_data["yearOfManufacture"]
     assert resp_json["ownerId"] == car_data["ownerId"]
 
+@pytest.mark.asyncio
+async def test_sparse_fieldsets(owner_id):
+    transport = ASGITransport(app=app)
+    car_data = {
+        "vin": str(uuid.uuid4()).replace("-", "")[:17],
+        "make": "Skoda",
+        "model": "Octavia",
+        "yearOfManufacture": 2021,
+        "ownerId": owner_id
+    }
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        car_id = (await ac.post("/api/cars/", json=car_data)).json()["id"]
+        listed = await ac.get("/api/cars/", params={"fields": "id,vin"})
+        detail = await ac.get(f"/api/cars/{car_id}", params={"fields": "vin,owner.name"})
+        missing = await ac.get("/api/cars/999999", params={"fields": "vin"})
+        invalid = await ac.get("/api/cars/", params={"fields": "id,secret"})
+    assert listed.status_code == 200
+    assert {"id": car_id, "vin": car_data["vin"].upper()} in listed.json()
+    assert all(set(car) == {"id", "vin"} for car in listed.json())
+    assert detail.json() == {"vin": car_data["vin"].upper(), "owner": {"name": "Test Owner"}}
+    assert missing.status_code == 404
+    assert invalid.status_code == 400
+    assert invalid.json()["detail"] == "Unknown field: secret"
+
+@pytest.mark.asyncio
+async def test_list_cars_ndjson_stream(owner_id):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        await ac.post("/api/cars/", json={"vin": str(uuid.uuid4()).replace("-", "")[:17], "ownerId": owner_id})
+        as_json = await ac.get("/api/cars/")
+        response = await ac.get("/api/cars/", headers={"Accept": "application/x-ndjson"})
+        owners = await ac.get("/api/owners/", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == sorted(as_json.json(), key=lambda car: car["id"])
+    assert all("owner" in row and "ownerId" in row for row in rows)
+    assert owners.headers["content-type"] == "application/x-ndjson"
+    assert all(set(json.loads(line)) == {"id", "name", "email", "updatedAt"} for line in owners.text.splitlines())
+
+@pytest.mark.asyncio
+async def test_keyset_pagination(owner_id):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for _ in range(3):
+            await ac.post("/api/cars/", json={"vin": str(uuid.uuid4()).replace("-", "")[:17], "ownerId": owner_id})
+        everything = (await ac.get("/api/cars/")).json()
+        for sort, key in (("id", "id"), ("vin", "vin")):
+            seen, params = [], {"limit": 2, "sort": sort}
+            while True:
+                response = await ac.get("/api/cars/", params=params)
+                assert response.status_code == 200
+                assert len(response.json()) <= 2
+                seen.extend(response.json())
+                cursor = response.headers.get("x-next-cursor")
+                if not cursor:
+                    break
+                params = {"limit": 2, "sort": sort, "cursor": cursor}
+            assert seen == sorted(everything, key=lambda car: (car[key], car["id"]))
+        projected = await ac.get("/api/cars/", params={"limit": 1, "fields": "vin"})
+        bad_cursor = await ac.get("/api/cars/", params={"cursor": "garbage"})
+        too_big = await ac.get("/api/cars/", params={"limit": 100000})
+    assert list(projected.json()[0]) == ["vin"]
+    assert projected.headers["x-next-cursor"]
+    assert bad_cursor.status_code == 400
+    assert too_big.status_code == 422
+
+@pytest.mark.asyncio
+async def test_list_cars_filters_and_sort(owner_id):
+    make = f"Make-{uuid.uuid4().hex[:8]}"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for model, year in (("A", 2001), ("A", 2005), ("B", 2010), ("B", None), ("A", None)):
+            await ac.post("/api/cars/", json={
+                "vin": str(uuid.uuid4()).replace("-", "")[:17], "make": make, "model": model,
+                "yearOfManufacture": year, "ownerId": owner_id,
+            })
+        ranged = await ac.get("/api/cars/", params={"make": make, "yearFrom": 2002, "yearTo": 2010})
+        by_model = await ac.get("/api/cars/", params={"make": make, "model": "A", "ownerId": owner_id})
+        other_owner = await ac.get("/api/cars/", params={"make": make, "ownerId": owner_id + 1000})
+        everything = (await ac.get("/api/cars/", params={"make": make, "sort": "yearOfManufacture"})).json()
+        seen, params = [], {"make": make, "sort": "yearOfManufacture", "limit": 2}
+        while True:
+            response = await ac.get("/api/cars/", params=params)
+            seen.extend(response.json())
+            cursor = response.headers.get("x-next-cursor")
+            if not cursor:
+                break
+            params = {**params, "cursor": cursor}
+        bad_range = await ac.get("/api/cars/", params={"yearFrom": 2010, "yearTo": 2000})
+        bad_sort = await ac.get("/api/cars/", params={"sort": "model"})
+    assert sorted(car["yearOfManufacture"] for car in ranged.json()) == [2005, 2010]
+    assert {(car["model"], car["yearOfManufacture"]) for car in by_model.json()} == {("A", 2001), ("A", 2005), ("A", None)}
+    assert other_owner.json() == []
+    assert len(everything) == 5
+    assert [car["id"] for car in seen] == [car["id"] for car in everything]
+    assert bad_range.status_code == 400
+    assert bad_sort.status_code == 422
+
+@pytest.mark.asyncio
+async def test_list_cars_total_count(owner_id):
+    make = f"Make-{uuid.uuid4().hex[:8]}"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for _ in range(3):
+            await ac.post("/api/cars/", json={"vin": str(uuid.uuid4()).replace("-", "")[:17], "make": make, "ownerId": owner_id})
+        paged = await ac.get("/api/cars/", params={"make": make, "limit": 2, "count": "exact"})
+        streamed = await ac.get("/api/cars/", params={"make": make, "count": "estimate"}, headers={"accept": "application/x-ndjson"})
+        everything = await ac.get("/api/cars/", params={"count": "exact"})
+        plain = await ac.get("/api/cars/", params={"make": make})
+    assert len(paged.json()) == 2
+    assert paged.headers["x-total-count"] == "3"
+    assert paged.headers["x-total-count-estimated"] == "false"
+    assert streamed.headers["x-total-count"] == "3"
+    assert everything.headers["x-total-count"] == str(len(everything.json()))
+    assert "x-total-count" not in plain.headers
+
+@pytest.mark.asyncio
+async def test_search_cars_by_vin(owner_id):
+    stem = uuid.uuid4().hex[:8].upper()
+    vins = [stem + "A" * 9, stem + "B" * 9, "X" + stem + "C" * 8]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for vin in vins:
+            await ac.post("/api/cars/", json={"vin": vin, "ownerId": owner_id})
+        found = await ac.get("/api/cars/search", params={"vin": f" {stem.lower()} "})
+        limited = await ac.get("/api/cars/search", params={"vin": stem, "limit": 1})
+        too_short = await ac.get("/api/cars/search", params={"vin": "ab"})
+    assert found.status_code == 200
+    assert [car["vin"] for car in found.json()] == vins
+    assert [car["vin"] for car in limited.json()] == vins[:1]
+    assert too_short.status_code == 400
+
+@pytest.mark.asyncio
+async def test_conditional_get_car_and_policies(owner_id):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        created = await ac.post("/api/cars/", json={"vin": str(uuid.uuid4()).replace("-", "")[:17], "ownerId": owner_id})
+        car_id = created.json()["id"]
+        first = await ac.get(f"/api/cars/{car_id}")
+        etag = first.headers["etag"]
+        unchanged = await ac.get(f"/api/cars/{car_id}", headers={"If-None-Match": etag})
+        stale = await ac.get(f"/api/cars/{car_id}", headers={"If-None-Match": '"something-else"'})
+        missing = await ac.get("/api/cars/99999999", headers={"If-None-Match": "*"})
+
+        policies = await ac.get(f"/api/cars/{car_id}/policies")
+        policies_etag = policies.headers["etag"]
+        still = await ac.get(f"/api/cars/{car_id}/policies", headers={"If-None-Match": policies_etag})
+        await ac.post(f"/api/cars/{car_id}/policies/", json={"carId": car_id, "provider": "Allianz", "startDate": "2024-01-01", "endDate": "2024-12-31"})
+        changed = await ac.get(f"/api/cars/{car_id}/policies", headers={"If-None-Match": policies_etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert stale.status_code == 200 and stale.headers["etag"] == etag
+    assert missing.status_code == 404
+    assert still.status_code == 304
+    assert changed.status_code == 200
+    assert len(changed.json()) == 1
+    assert changed.headers["etag"] != policies_etag
+
+@pytest.mark.asyncio
+async def test_updated_since_and_tombstones(owner_id, monkeypatch):
+    from datetime import datetime, timezone
+    from app.api import deps
+    monkeypatch.setattr(deps.settings, "SYNC_SAFETY_LAG_SECONDS", 0)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        await ac.post("/api/cars/", json={"vin": str(uuid.uuid4()).replace("-", "")[:17], "ownerId": owner_id})
+        since = datetime.now(timezone.utc).isoformat()
+        created = []
+        for _ in range(3):
+            response = await ac.post("/api/cars/", json={"vin": str(uuid.uuid4()).replace("-", "")[:17], "ownerId": owner_id})
+            created.append(response.json()["id"])
+        await ac.post(f"/api/cars/{created[0]}/policies/", json={"carId": created[0], "provider": "Allianz", "startDate": "2024-01-01", "endDate": "2024-12-31"})
+        seen, params = [], {"updatedSince": since, "limit": 2}
+        while True:
+            response = await ac.get("/api/cars/", params=params)
+            assert response.status_code == 200
+            seen.extend(response.json())
+            cursor = response.headers.get("x-next-cursor")
+            if not cursor:
+                break
+            params = {"updatedSince": since, "limit": 2, "cursor": cursor}
+        unpaged = await ac.get("/api/cars/", params={"updatedSince": since})
+        await ac.delete(f"/api/cars/{created[0]}")
+        deleted = await ac.get("/api/tombstones/", params={"deletedSince": since})
+        deleted_cars = await ac.get("/api/tombstones/", params={"deletedSince": since, "entity": "car"})
+    assert [car["id"] for car in seen] == created
+    assert all(car["updatedAt"] for car in seen)
+    assert [car["id"] for car in unpaged.json()] == created
+    assert {(t["entity"], t["id"]) for t in deleted_cars.json()} == {("car", created[0])}
+    assert {t["entity"] for t in deleted.json()} >= {"car", "insurance_policy"}
+
+@pytest.mark.asyncio
+async def test_updated_since_holds_back_rows_inside_commit_lag(owner_id, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+    from sqlalchemy import update
+    from app.api import deps
+    from app.db.models.car_model import Car
+    from app.utils.dates import utcnow_naive
+    monkeypatch.setattr(deps.settings, "SYNC_SAFETY_LAG_SECONDS", 60)
+    since = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        settled = (await ac.post("/api/cars/", json={"vin": str(uuid.uuid4()).replace("-", "")[:17], "ownerId": owner_id})).json()["id"]
+        late = (await ac.post("/api/cars/", json={"vin": str(uuid.uuid4()).replace("-", "")[:17], "ownerId": owner_id})).json()["id"]
+        # settled was stamped well before the read; late was stamped just before it, as if its
+        # transaction had flushed then and only committed now
+        async for session in get_async_session():
+            await session.execute(update(Car).where(Car.id == settled).values(updated_at=utcnow_naive() - timedelta(minutes=5)))
+            await session.execute(update(Car).where(Car.id == late).values(updated_at=utcnow_naive() - timedelta(seconds=1)))
+            await session.commit()
+        first = await ac.get("/api/cars/", params={"updatedSince": since})
+        ids = [car["id"] for car in first.json()]
+        assert settled in ids and late not in ids
+        # The mirror resumes from the newest updatedAt it saw; once the lag has passed it gets the late row
+        watermark = max(car["updatedAt"] for car in first.json())
+        monkeypatch.setattr(deps, "utcnow_naive", lambda: utcnow_naive() + timedelta(seconds=61))
+        second = await ac.get("/api/cars/", params={"updatedSince": watermark})
+    assert late in [car["id"] for car in second.json()]
+
 @pytest.mark.asyncio
 async def test_get_car_by_vin_success(owner_id):
     transport = ASGITransport(app=app)
@@ -272,7 +493,7 @@ async def test_create_car_invalid():
 @pytest.mark.asyncio
 async def test_list_cars_override():
     class FakeCarService:
-        async def list_cars_with_owner(self):
+        async def list_cars_with_owner(self, filters=None, sort="id"):
             return [{"id": 1, "vin": "VIN1234567890123", "make": "Test", "model": "Test", "yearOfManufacture": 2022, "ownerId": 1, "owner": {"id": 1, "name": "Owner", "email": "owner@example.com"}}]
     from app.api.deps import get_car_service
     app.dependency_overrides[get_car_service] = lambda: FakeCarService()
@@ -301,7 +522,8 @@ async def test_get_car_404_override():
 async def test_get_car_return_override():
     class FakeCarService:
         async def get_car(self, car_id):
-            return {"id": car_id, "vin": "VIN1234567890123", "make": "Test", "model": "Test", "yearOfManufacture": 2022, "ownerId": 1}
+            from app.db.models.car_model import Car
+            return Car(id=car_id, vin="VIN1234567890123", make="Test", model="Test", year_of_manufacture=2022, owner_id=1, version="v1")
     from app.api.deps import get_car_service
     app.dependency_overrides[get_car_service] = lambda: FakeCarService()
     transport = ASGITransport(app=app)
@@ -309,6 +531,7 @@ async def test_get_car_return_override():
         response = await ac.get("/api/cars/1")
     assert response.status_code == 200
     assert response.json()["vin"] == "VIN1234567890123"
+    assert response.headers["etag"] == '"v1"'
     app.dependency_overrides.pop(get_car_service)
 
 @pytest.mark.asyncio
@@ -365,17 +588,17 @@ async def test_create_car_400_override():
 
 @pytest.mark.asyncio
 async def test_insurance_valid_404_override():
-    class FakeCarService:
-        async def get_car(self, car_id):
+    class FakeValidityService:
+        async def is_valid(self, car_id, date):
             return None
-    from app.api.deps import get_car_service, get_validity_service
-    app.dependency_overrides[get_car_service] = lambda: FakeCarService()
+    from app.api.deps import get_validity_service
+    app.dependency_overrides[get_validity_service] = lambda: FakeValidityService()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        response = await ac.get("/api/cars/12345/insurance-valid?date=2025-10-22")
+        response = await ac.get("/api/cars/12345/insurance-valid?date=1800-01-01")
     assert response.status_code == 404
     assert response.json()["detail"] == "Car not found"
-    app.dependency_overrides.pop(get_car_service)
+    app.dependency_overrides.pop(get_validity_service)
 
 @pytest.mark.asyncio
 async def test_insurance_valid_400_override():
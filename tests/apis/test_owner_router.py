@@ -39,7 +39,8 @@ async def test_get_owner_404_override():
 async def test_get_owner_return_override():
     class FakeOwnerService:
         async def get_owner(self, owner_id):
-            return {"id": owner_id, "name": "Test Owner", "email": "testowner@example.com"}
+            from app.db.models.owner_model import Owner
+            return Owner(id=owner_id, name="Test Owner", email="testowner@example.com", version="v1")
     from app.api.deps import get_owner_service
     app.dependency_overrides[get_owner_service] = lambda: FakeOwnerService()
     transport = ASGITransport(app=app)
@@ -142,3 +143,22 @@ async def test_update_owner_success_override():
     assert response.status_code == 200
     assert response.json()["name"] == "Updated Owner"
     app.dependency_overrides.pop(get_owner_service)
+
+@pytest.mark.asyncio
+async def test_search_owners():
+    import uuid
+    tag = uuid.uuid4().hex[:8]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for name, email in ((f"Zed{tag} Pop", f"zed{tag}@example.com"), (f"zed{tag} Ion", f"zed{tag}@example.com.ro"), (f"Ana{tag}", None)):
+            await ac.post("/api/owners/", json={"name": name, "email": email})
+        by_name = await ac.get("/api/owners/search", params={"name": f"ZED{tag}"})
+        by_email = await ac.get("/api/owners/search", params={"email": f"Zed{tag}@example.com"})
+        limited = await ac.get("/api/owners/search", params={"name": f"zed{tag}", "limit": 1})
+        wildcard = await ac.get("/api/owners/search", params={"name": "%"})
+        missing = await ac.get("/api/owners/search")
+    assert sorted(o["name"] for o in by_name.json()) == [f"Zed{tag} Pop", f"zed{tag} Ion"]
+    assert [o["email"] for o in by_email.json()] == [f"zed{tag}@example.com", f"zed{tag}@example.com.ro"]
+    assert len(limited.json()) == 1
+    assert wildcard.json() == []
+    assert missing.status_code == 400
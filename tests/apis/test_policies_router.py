@@ -126,6 +126,8 @@ async def test_list_policies_for_car_override():
             self.start_date = start_date
             self.end_date = end_date
             self.logged_expiry_at = logged_expiry_at
+            self.version = "v1"
+            self.updated_at = None
     class FakePolicyService:
         async def get_policies_by_car_id(self, car_id):
             today = date.today()
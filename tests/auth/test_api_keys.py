@@ -0,0 +1,83 @@
+import uuid
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import HTTPException
+from app.api.deps import get_async_session
+from app.auth.api_keys import (
+    api_key_cache,
+    authenticate_api_key,
+    get_api_key_user,
+    hash_api_key,
+    generate_api_key,
+)
+from app.db.repositories.api_key_repository import ApiKeyRepository
+from app.db.repositories.user_repository import UserRepository
+from app.schemas.user_schema import UserCreate
+from app.service.api_key_service import ApiKeyService
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    api_key_cache.clear()
+    yield
+    api_key_cache.clear()
+
+async def create_user_and_key():
+    username = f"machine_{uuid.uuid4().hex[:8]}"
+    async for session in get_async_session():
+        user = await UserRepository(session).create_user(
+            UserCreate(username=username, email=f"{username}@example.com", password="pw")
+        )
+        service = ApiKeyService(ApiKeyRepository(session))
+        api_key, raw_key = await service.create_api_key(user.id, "ci")
+        return user, api_key, raw_key
+
+def test_hash_is_deterministic_and_keyed():
+    raw_key = generate_api_key()
+    assert hash_api_key(raw_key) == hash_api_key(raw_key)
+    assert hash_api_key(raw_key) != hash_api_key(raw_key + "x")
+    assert len(hash_api_key(raw_key)) == 64
+
+@pytest.mark.asyncio
+async def test_authenticate_api_key_uses_cache():
+    user, api_key, raw_key = await create_user_and_key()
+    assert api_key.key_hash == hash_api_key(raw_key)
+    assert raw_key not in (api_key.key_hash, api_key.prefix)
+    found = await authenticate_api_key(raw_key)
+    assert found.id == user.id
+    with patch("app.auth.api_keys.ApiKeyRepository.get_active_user_by_hash", AsyncMock()) as lookup:
+        again = await authenticate_api_key(raw_key)
+    lookup.assert_not_awaited()
+    assert again.id == user.id
+
+@pytest.mark.asyncio
+async def test_unknown_key_is_negatively_cached():
+    with patch("app.auth.api_keys.ApiKeyRepository.get_active_user_by_hash", AsyncMock(return_value=None)) as lookup:
+        assert await authenticate_api_key("ci_unknown") is None
+        assert await authenticate_api_key("ci_unknown") is None
+    lookup.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_revoked_key_is_rejected():
+    user, api_key, raw_key = await create_user_and_key()
+    assert await authenticate_api_key(raw_key) is not None
+    async for session in get_async_session():
+        await ApiKeyService(ApiKeyRepository(session)).revoke_api_key(user.id, api_key.id)
+    assert await authenticate_api_key(raw_key) is None
+    with pytest.raises(HTTPException) as exc:
+        await get_api_key_user(raw_key)
+    assert exc.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_revoke_other_users_key_fails():
+    user, api_key, _ = await create_user_and_key()
+    async for session in get_async_session():
+        with pytest.raises(ValueError):
+            await ApiKeyService(ApiKeyRepository(session)).revoke_api_key(user.id + 1000, api_key.id)
+
+@pytest.mark.asyncio
+async def test_deactivated_user_key_is_evicted_from_cache():
+    user, _, raw_key = await create_user_and_key()
+    assert await authenticate_api_key(raw_key) is not None
+    async for session in get_async_session():
+        await UserRepository(session).set_active(user.username, False)
+    assert await authenticate_api_key(raw_key) is None
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from jose import jwt as jose_jwt
+from app.auth import jwt
+from app.auth.jwt import create_access_token, verify_token, verified_token_cache
+
+credentials_exception = HTTPException(status_code=401, detail="Could not validate credentials")
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    verified_token_cache.clear()
+    yield
+    verified_token_cache.clear()
+
+def test_verify_token_returns_claims():
+    token = create_access_token(data={"sub": "alice"})
+    token_data = verify_token(token, credentials_exception)
+    assert token_data.username == "alice"
+    assert token_data.jti
+    assert token_data.expires_at is not None
+
+def test_repeat_verification_skips_signature_check():
+    token = create_access_token(data={"sub": "bob"})
+    hits = verified_token_cache.hits
+    with patch("app.auth.jwt.jwt.decode", wraps=jose_jwt.decode) as decode:
+        first = verify_token(token, credentials_exception)
+        second = verify_token(token, credentials_exception)
+    assert decode.call_count == 1
+    assert first is second
+    assert verified_token_cache.hits == hits + 1
+
+def test_cache_entry_expires_with_token():
+    token = create_access_token(data={"sub": "carol"})
+    token_data = verify_token(token, credentials_exception)
+    exp = token_data.expires_at.timestamp()
+    with patch("app.auth.jwt.time.time", return_value=exp - 1):
+        verified_token_cache.clear()
+        verify_token(token, credentials_exception)
+    # stored with a 1 second TTL, measured on the monotonic clock
+    entry_expires_at, _ = next(iter(verified_token_cache._data.values()))
+    assert entry_expires_at - verified_token_cache._clock() <= 1
+
+def test_invalid_token_not_cached():
+    with pytest.raises(HTTPException):
+        verify_token("garbage", credentials_exception)
+    assert len(verified_token_cache) == 0
+
+def test_cache_disabled():
+    token = create_access_token(data={"sub": "dave"})
+    with patch.object(jwt.settings, "TOKEN_CACHE_MAX_SIZE", 0):
+        verify_token(token, credentials_exception)
+    assert len(verified_token_cache) == 0
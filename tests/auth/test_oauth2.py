@@ -0,0 +1,77 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import HTTPException
+from app.auth import oauth2
+from app.auth.jwt import create_access_token
+from app.auth.principal_cache import principal_cache, invalidate_principal, invalidate_principal_id
+from app.db.models.user_model import User
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+@pytest.mark.asyncio
+async def test_get_current_user_caches_principal():
+    user = User(id=7, username="cached", email="cached@example.com", hashed_password="x")
+    token = create_access_token(data={"sub": "cached"})
+    lookup = AsyncMock(return_value=user)
+    with patch("app.auth.oauth2.UserService.get_user_by_username", lookup):
+        first = await oauth2.get_current_user(token, None)
+        second = await oauth2.get_current_user(token, None)
+    assert first is user and second is user
+    lookup.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_get_current_user_unknown_user_not_cached():
+    token = create_access_token(data={"sub": "ghost"})
+    lookup = AsyncMock(return_value=None)
+    with patch("app.auth.oauth2.UserService.get_user_by_username", lookup):
+        with pytest.raises(HTTPException) as exc:
+            await oauth2.get_current_user(token, None)
+    assert exc.value.status_code == 401
+    assert "ghost" not in principal_cache
+
+@pytest.mark.asyncio
+async def test_invalidation_forces_reload():
+    user = User(id=8, username="changed", email="changed@example.com", hashed_password="x")
+    token = create_access_token(data={"sub": "changed"})
+    lookup = AsyncMock(return_value=user)
+    with patch("app.auth.oauth2.UserService.get_user_by_username", lookup):
+        await oauth2.get_current_user(token, None)
+        invalidate_principal("changed")
+        await oauth2.get_current_user(token, None)
+        invalidate_principal_id(8)
+        await oauth2.get_current_user(token, None)
+    assert lookup.await_count == 3
+
+@pytest.mark.asyncio
+async def test_invalid_token_rejected():
+    with pytest.raises(HTTPException) as exc:
+        await oauth2.get_current_user("not-a-token", None)
+    assert exc.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_stateless_token_needs_no_user_lookup():
+    from app.auth.jwt import build_token_claims
+    user = User(id=11, username="stateless", email="s@example.com", hashed_password="x", is_active=True, is_superuser=True)
+    with patch.object(oauth2.settings, "STATELESS_TOKENS", True):
+        token = create_access_token(data=build_token_claims(user))
+        lookup = AsyncMock()
+        with patch("app.auth.oauth2.UserService.get_user_by_username", lookup):
+            principal = await oauth2.get_current_user(token, None)
+    lookup.assert_not_awaited()
+    assert principal.id == 11
+    assert principal.username == "stateless"
+    assert principal.is_superuser is True
+
+@pytest.mark.asyncio
+async def test_stateless_token_inactive_user_rejected():
+    from app.auth.jwt import build_token_claims
+    user = User(id=12, username="inactive", email="i@example.com", hashed_password="x", is_active=False, is_superuser=False)
+    with patch.object(oauth2.settings, "STATELESS_TOKENS", True):
+        token = create_access_token(data=build_token_claims(user))
+        with pytest.raises(HTTPException) as exc:
+            await oauth2.get_current_user(token, None)
+    assert exc.value.status_code == 401
@@ -0,0 +1,62 @@
+import asyncio
+import datetime
+import uuid
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.auth.revocation import RevocationList
+from app.api.deps import get_async_session
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+@pytest.mark.asyncio
+async def test_first_load_is_awaited():
+    revocations = RevocationList(refresh_seconds=30)
+    with patch("app.auth.revocation.RevokedTokenRepository.list_active_jtis", AsyncMock(return_value=["abc"])):
+        await revocations.ensure_fresh()
+    assert revocations.is_revoked("abc")
+    assert not revocations.is_revoked("other")
+
+@pytest.mark.asyncio
+async def test_stale_set_refreshes_in_background():
+    clock = FakeClock()
+    revocations = RevocationList(refresh_seconds=30, clock=clock)
+    with patch("app.auth.revocation.RevokedTokenRepository.list_active_jtis", AsyncMock(return_value=[])):
+        await revocations.ensure_fresh()
+    clock.now = 31
+    loader = AsyncMock(return_value=["late"])
+    with patch("app.auth.revocation.RevokedTokenRepository.list_active_jtis", loader):
+        await revocations.ensure_fresh()
+        # served from the previous set until the background reload finishes
+        assert not revocations.is_revoked("late")
+        await asyncio.sleep(0.05)
+    assert revocations.is_revoked("late")
+    assert revocations.stats()["refreshes"] == 2
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_set():
+    clock = FakeClock()
+    revocations = RevocationList(refresh_seconds=30, clock=clock)
+    with patch("app.auth.revocation.RevokedTokenRepository.list_active_jtis", AsyncMock(return_value=["kept"])):
+        await revocations.ensure_fresh()
+    clock.now = 31
+    with patch("app.auth.revocation.RevokedTokenRepository.list_active_jtis", AsyncMock(side_effect=RuntimeError("db down"))):
+        await revocations.ensure_fresh()
+        await asyncio.sleep(0.05)
+    assert revocations.is_revoked("kept")
+    assert revocations.stats()["refresh_failures"] == 1
+
+@pytest.mark.asyncio
+async def test_revoke_persists_and_is_visible_immediately():
+    revocations = RevocationList(refresh_seconds=30)
+    jti = uuid.uuid4().hex
+    expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=5)
+    async for session in get_async_session():
+        await revocations.revoke(session, jti, expires_at)
+    assert revocations.is_revoked(jti)
+    revocations.clear()
+    await revocations.ensure_fresh()
+    assert revocations.is_revoked(jti)
@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from app.core.admission import AdmissionLimiter, AdmissionControlMiddleware
+
+def make_limiter(**overrides):
+    options = dict(name="test", max_in_flight=2, max_queue=1, queue_timeout=1.0)
+    options.update(overrides)
+    return AdmissionLimiter(**options)
+
+@pytest.mark.asyncio
+async def test_queued_request_gets_released_slot():
+    limiter = make_limiter()
+    assert await limiter.acquire()
+    assert await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    limiter.release()
+    assert await waiting is True
+    assert limiter.in_flight == 2
+    assert limiter.queue_depth == 0
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_immediately():
+    limiter = make_limiter()
+    await limiter.acquire()
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert await limiter.acquire() is False
+    assert limiter.rejected == 1
+    limiter.release()
+    assert await waiting
+
+@pytest.mark.asyncio
+async def test_queue_timeout_rejects():
+    limiter = make_limiter(max_in_flight=1, queue_timeout=0.01)
+    await limiter.acquire()
+    assert await limiter.acquire() is False
+    assert limiter.timeouts == 1
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 1
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    limiter = make_limiter(max_in_flight=1)
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert limiter.queue_depth == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+def test_aimd_limit_adapts_to_latency():
+    now = [0.0]
+    limiter = make_limiter(max_in_flight=10, adaptive=True, target_latency=0.1, min_limit=2, backoff=0.5, clock=lambda: now[0])
+    limiter.in_flight = 1
+    limiter.release(latency=1.0)
+    assert limiter.limit == 5
+    limiter.in_flight = 1
+    limiter.release(latency=1.0)  # within the same window: no second decrease
+    assert limiter.limit == 5
+    for _ in range(20):
+        limiter.in_flight = 1
+        limiter.release(latency=0.01)
+    assert limiter.limit > 5
+    assert limiter.limit <= 10
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_with_503():
+    gate = asyncio.Event()
+    limiter = make_limiter(max_in_flight=1, max_queue=0)
+    app = FastAPI()
+    app.add_middleware(AdmissionControlMiddleware, limiters={"/api/cars": limiter}, retry_after=3)
+
+    @app.get("/api/cars/slow")
+    async def slow():
+        await gate.wait()
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        first = asyncio.create_task(ac.get("/api/cars/slow"))
+        while limiter.in_flight == 0:
+            await asyncio.sleep(0)
+        shed = await ac.get("/api/cars/slow")
+        health = await ac.get("/health")
+        gate.set()
+        assert (await first).status_code == 200
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "3"
+    assert health.status_code == 200
+    assert limiter.in_flight == 0
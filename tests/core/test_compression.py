@@ -0,0 +1,101 @@
+import gzip
+import json
+import pytest
+import brotli
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse, Response
+from httpx import AsyncClient, ASGITransport
+from app.core.compression import CompressionMiddleware, choose_encoding
+
+ROWS = [{"id": i, "make": "Dacia", "model": "Logan", "vin": f"VIN{i:014d}"} for i in range(2000)]
+
+def build_app(**options):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/cars")
+    async def cars():
+        return ROWS
+
+    @app.get("/tagged")
+    async def tagged():
+        return Response(json.dumps(ROWS), media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/png")
+    async def png():
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for row in ROWS:
+                yield json.dumps(row) + "\n"
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app
+
+async def get(app, path, accept_encoding):
+    # httpx would decode transparently; read the raw bytes instead
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        async with ac.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+            return response, raw
+
+def test_choose_encoding():
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("gzip, deflate, br", brotli_available=False) == "gzip"
+    assert choose_encoding("br;q=0.5, gzip") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("*") == "br"
+    assert choose_encoding("") is None
+
+@pytest.mark.asyncio
+async def test_large_json_is_gzipped():
+    response, raw = await get(build_app(), "/cars", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert json.loads(gzip.decompress(raw)) == ROWS
+
+@pytest.mark.asyncio
+async def test_large_json_is_brotli_compressed_in_a_thread():
+    response, raw = await get(build_app(thread_threshold=1), "/cars", "br, gzip")
+    assert response.headers["content-encoding"] == "br"
+    assert json.loads(brotli.decompress(raw)) == ROWS
+
+@pytest.mark.asyncio
+async def test_compressed_variant_gets_its_own_strong_etag():
+    app = build_app()
+    compressed, _ = await get(app, "/tagged", "gzip")
+    identity, _ = await get(app, "/tagged", "identity")
+    assert compressed.headers["etag"] == '"v1-gzip"'
+    assert identity.headers["etag"] == '"v1"'
+
+@pytest.mark.asyncio
+async def test_small_and_binary_responses_are_not_compressed():
+    app = build_app()
+    response, raw = await get(app, "/small", "gzip")
+    assert "content-encoding" not in response.headers
+    assert json.loads(raw) == {"ok": True}
+    response, _ = await get(app, "/png", "gzip")
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+@pytest.mark.asyncio
+async def test_identity_client_gets_vary_header():
+    response, raw = await get(build_app(), "/cars", "identity")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert json.loads(raw) == ROWS
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_incrementally():
+    response, raw = await get(build_app(), "/stream", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    lines = gzip.decompress(raw).decode().splitlines()
+    assert [json.loads(line) for line in lines] == ROWS
@@ -0,0 +1,57 @@
+import time
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.core import deadline
+from app.api.errors import register_exception_handlers
+
+SLOW_QUERY = text("WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT count(*) FROM c")
+
+def build_app():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    deadline.instrument_engine(engine.sync_engine)
+    app = FastAPI()
+    app.add_middleware(deadline.DeadlineMiddleware, default_timeout=5, max_timeout=10)
+    register_exception_handlers(app)
+
+    @app.get("/slow")
+    async def slow():
+        async with engine.connect() as conn:
+            return {"count": await conn.scalar(SLOW_QUERY)}
+
+    @app.get("/fast")
+    async def fast():
+        async with engine.connect() as conn:
+            return {"value": await conn.scalar(text("select 1")), "remaining": deadline.remaining()}
+
+    return app
+
+@pytest.mark.asyncio
+async def test_slow_query_is_interrupted_with_504():
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as ac:
+        response = await ac.get("/slow", headers={"x-request-timeout": "0.1"})
+        follow_up = await ac.get("/fast")
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Request deadline exceeded"}
+    # The interrupted connection went back to the pool in a usable state
+    assert follow_up.status_code == 200
+    assert follow_up.json()["value"] == 1
+
+@pytest.mark.asyncio
+async def test_client_timeout_is_capped():
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as ac:
+        response = await ac.get("/fast", headers={"x-request-timeout": "3600"})
+    assert 9 < response.json()["remaining"] <= 10
+
+def test_check_outside_request_is_noop():
+    assert deadline.remaining() is None
+    deadline.check()
+    token = deadline.set_deadline(0.000001)
+    try:
+        with pytest.raises(deadline.DeadlineExceeded):
+            time.sleep(0.001)
+            deadline.check()
+    finally:
+        deadline.reset_deadline(token)
@@ -0,0 +1,38 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient, ASGITransport
+from structlog.contextvars import get_contextvars
+from app.core.middleware import RequestIdMiddleware, REQUEST_ID_HEADER
+
+def build_app():
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/ctx")
+    async def ctx():
+        return get_contextvars()
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+@pytest.mark.asyncio
+async def test_request_id_is_echoed_and_bound():
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as ac:
+        response = await ac.get("/ctx", headers={REQUEST_ID_HEADER: "abc-123"})
+    assert response.headers[REQUEST_ID_HEADER] == "abc-123"
+    assert response.json() == {"request_id": "abc-123", "path": "/ctx", "method": "GET"}
+    assert get_contextvars() == {}
+
+@pytest.mark.asyncio
+async def test_request_id_is_generated_for_streaming_response():
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as ac:
+        response = await ac.get("/stream")
+    assert len(response.headers[REQUEST_ID_HEADER]) == 36
+    assert response.text == "0\n1\n2\n"
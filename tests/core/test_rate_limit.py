@@ -0,0 +1,75 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.core import rate_limit
+from app.core.rate_limit import LoginThrottle, RedisTokenBucketLimiter, TokenBucketLimiter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_bucket_allows_burst_then_rejects():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(capacity=3, refill_per_second=1, max_keys=10, clock=clock)
+    assert [limiter.acquire_nowait("k") for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire_nowait("k") == pytest.approx(1.0)
+    assert limiter.stats()["rejected"] == 1
+
+def test_bucket_refills_over_time():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(capacity=2, refill_per_second=0.5, max_keys=10, clock=clock)
+    limiter.acquire_nowait("k")
+    limiter.acquire_nowait("k")
+    assert limiter.acquire_nowait("k") > 0
+    clock.now = 2
+    assert limiter.acquire_nowait("k") == 0
+
+def test_buckets_are_per_key():
+    limiter = TokenBucketLimiter(capacity=1, refill_per_second=0.01, max_keys=10)
+    assert limiter.acquire_nowait("a") == 0
+    assert limiter.acquire_nowait("b") == 0
+    assert limiter.acquire_nowait("a") > 0
+
+def test_bucket_storage_is_bounded():
+    limiter = TokenBucketLimiter(capacity=1, refill_per_second=1, max_keys=100)
+    for i in range(1000):
+        limiter.acquire_nowait(f"user{i}")
+    assert limiter.stats()["keys"] == 100
+    assert limiter.stats()["evictions"] == 900
+
+@pytest.mark.asyncio
+async def test_login_throttle_checks_ip_before_username():
+    ip_limiter = TokenBucketLimiter(capacity=1, refill_per_second=0.01, max_keys=10)
+    user_limiter = TokenBucketLimiter(capacity=10, refill_per_second=0.01, max_keys=10)
+    throttle = LoginThrottle(ip_limiter, user_limiter)
+    assert await throttle.check("Alice", "10.0.0.1") == 0
+    assert await throttle.check("alice", "10.0.0.1") > 0
+    # the rejected attempt did not consume the username bucket
+    assert user_limiter.stats()["allowed"] == 1
+
+@pytest.mark.asyncio
+async def test_login_throttle_normalizes_username():
+    ip_limiter = TokenBucketLimiter(capacity=10, refill_per_second=0.01, max_keys=10)
+    user_limiter = TokenBucketLimiter(capacity=1, refill_per_second=0.01, max_keys=10)
+    throttle = LoginThrottle(ip_limiter, user_limiter)
+    assert await throttle.check("Bob", "10.0.0.1") == 0
+    assert await throttle.check(" bob ", "10.0.0.2") > 0
+
+@pytest.mark.asyncio
+async def test_redis_limiter_falls_back_to_local_buckets():
+    fallback = TokenBucketLimiter(capacity=1, refill_per_second=0.01, max_keys=10)
+    limiter = RedisTokenBucketLimiter("redis://127.0.0.1:1/0", "login:test", 1, 0.01, fallback)
+    limiter._script = AsyncMock(side_effect=ConnectionError("refused"))
+    assert await limiter.acquire("k") == 0
+    assert await limiter.acquire("k") > 0
+    assert limiter.stats()["backend_errors"] == 2
+
+@pytest.mark.asyncio
+async def test_redis_limiter_uses_script_result():
+    fallback = TokenBucketLimiter(capacity=1, refill_per_second=0.01, max_keys=10)
+    limiter = RedisTokenBucketLimiter("redis://127.0.0.1:1/0", "login:test", 1, 0.01, fallback)
+    limiter._script = AsyncMock(side_effect=[b"0", b"2.5"])
+    assert await limiter.acquire("k") == 0
+    assert await limiter.acquire("k") == 2.5
+    assert limiter._script.await_args.kwargs["keys"] == ["login:test:k"]
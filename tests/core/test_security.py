@@ -0,0 +1,38 @@
+import asyncio
+import pytest
+from app.core.security import (
+    PasswordHasher,
+    bulk_password_hasher,
+    get_password_hash_async,
+    get_password_hash_bulk_async,
+    password_hasher,
+    verify_password_async,
+    verify_password,
+)
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_roundtrip():
+    hashed = await get_password_hash_async("secret")
+    assert verify_password("secret", hashed)
+    assert await verify_password_async("secret", hashed) is True
+    assert await verify_password_async("wrong", hashed) is False
+
+@pytest.mark.asyncio
+async def test_hasher_caps_concurrency_and_reports_queue_depth():
+    hasher = PasswordHasher(max_workers=1)
+    hashed = await hasher.hash("pw")
+    results = await asyncio.gather(*(hasher.verify("pw", hashed) for _ in range(3)))
+    assert results == [True, True, True]
+    stats = hasher.stats()
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] == 2
+    assert stats["completed"] == 4
+
+@pytest.mark.asyncio
+async def test_bulk_hashes_stay_off_the_login_pool():
+    login_completed = password_hasher.completed
+    hashes = await asyncio.gather(*(get_password_hash_bulk_async("pw") for _ in range(3)))
+    assert all(verify_password("pw", h) for h in hashes)
+    assert password_hasher.completed == login_completed
+    assert bulk_password_hasher.stats()["in_flight"] == 0
@@ -0,0 +1,133 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from app.core.single_flight import SingleFlightMiddleware
+
+def build_app(**options):
+    state = {"calls": 0, "gate": asyncio.Event()}
+    app = FastAPI()
+    app.add_middleware(SingleFlightMiddleware, **options)
+
+    @app.get("/api/cars/{car_id}")
+    async def get_car(car_id: int):
+        state["calls"] += 1
+        await state["gate"].wait()
+        return {"id": car_id, "call": state["calls"]}
+
+    return app, state
+
+async def fire(app, state, requests, opened_calls):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        tasks = [asyncio.create_task(ac.get(path, headers=headers)) for path, headers in requests]
+        while state["calls"] < opened_calls:
+            await asyncio.sleep(0)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        state["gate"].set()
+        return await asyncio.gather(*tasks)
+
+def find_middleware(app):
+    stack = app.middleware_stack
+    while not isinstance(stack, SingleFlightMiddleware):
+        stack = stack.app
+    return stack
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_execution():
+    app, state = build_app()
+    headers = {"Authorization": "Bearer a"}
+    responses = await fire(app, state, [("/api/cars/1", headers)] * 5, opened_calls=1)
+    assert state["calls"] == 1
+    assert all(r.status_code == 200 and r.json() == {"id": 1, "call": 1} for r in responses)
+    assert find_middleware(app).stats()["coalesced"] == 4
+
+@pytest.mark.asyncio
+async def test_different_credentials_or_params_do_not_coalesce():
+    app, state = build_app()
+    responses = await fire(app, state, [
+        ("/api/cars/1", {"Authorization": "Bearer a"}),
+        ("/api/cars/1", {"Authorization": "Bearer b"}),
+        ("/api/cars/1?x=1", {"Authorization": "Bearer a"}),
+    ], opened_calls=3)
+    assert state["calls"] == 3
+    assert sorted(r.json()["call"] for r in responses) == [3, 3, 3]
+
+@pytest.mark.asyncio
+async def test_waiter_limit_runs_extra_requests():
+    app, state = build_app(max_waiters=1)
+    responses = await fire(app, state, [("/api/cars/2", {})] * 3, opened_calls=2)
+    assert state["calls"] == 2
+    assert all(r.status_code == 200 for r in responses)
+    assert find_middleware(app).stats()["overflow"] == 1
+
+@pytest.mark.asyncio
+async def test_non_2xx_leader_response_is_not_shared():
+    from fastapi.responses import JSONResponse
+    state = {"calls": 0, "gate": asyncio.Event()}
+    app = FastAPI()
+    app.add_middleware(SingleFlightMiddleware)
+
+    @app.get("/api/cars/{car_id}")
+    async def get_car(car_id: int):
+        state["calls"] += 1
+        if state["calls"] == 1:
+            await state["gate"].wait()
+            return JSONResponse({"detail": "Request deadline exceeded"}, status_code=504)
+        return {"id": car_id}
+
+    responses = await fire(app, state, [("/api/cars/1", {})] * 3, opened_calls=1)
+    assert state["calls"] == 3
+    assert sorted(r.status_code for r in responses) == [200, 200, 504]
+    assert find_middleware(app).stats()["fallbacks"] == 2
+
+@pytest.mark.asyncio
+async def test_key_headers_split_requests_by_time_budget():
+    app, state = build_app(key_headers=("authorization", "x-request-timeout"))
+    responses = await fire(app, state, [
+        ("/api/cars/1", {"x-request-timeout": "0.1"}),
+        ("/api/cars/1", {"x-request-timeout": "30"}),
+        ("/api/cars/1", {"x-request-timeout": "30"}),
+    ], opened_calls=2)
+    assert state["calls"] == 2
+    assert all(r.status_code == 200 for r in responses)
+
+def build_streaming_app():
+    from fastapi.responses import StreamingResponse
+    state = {"calls": 0, "gate": asyncio.Event()}
+    app = FastAPI()
+    app.add_middleware(SingleFlightMiddleware)
+
+    @app.get("/api/cars/")
+    async def list_cars():
+        state["calls"] += 1
+
+        async def lines():
+            yield b'{"id": 1}\n'
+            await state["gate"].wait()
+            yield b'{"id": 2}\n'
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app, state
+
+@pytest.mark.asyncio
+async def test_ndjson_requests_are_not_coalesced():
+    app, state = build_streaming_app()
+    headers = {"Accept": "application/x-ndjson"}
+    # Both handlers must start while the first stream is still open
+    responses = await asyncio.wait_for(fire(app, state, [("/api/cars/", headers)] * 2, opened_calls=2), timeout=5)
+    assert state["calls"] == 2
+    assert all(r.text == '{"id": 1}\n{"id": 2}\n' for r in responses)
+    stats = find_middleware(app).stats()
+    assert stats["streaming_bypassed"] == 2
+    assert stats["coalesced"] == 0
+
+@pytest.mark.asyncio
+async def test_streamed_leader_releases_waiters_at_first_chunk():
+    app, state = build_streaming_app()
+    # Same stream without the ndjson Accept: the waiter is released once the leader starts streaming
+    responses = await asyncio.wait_for(fire(app, state, [("/api/cars/", {})] * 2, opened_calls=2), timeout=5)
+    assert state["calls"] == 2
+    assert all(r.status_code == 200 for r in responses)
+    assert find_middleware(app).stats()["fallbacks"] == 1
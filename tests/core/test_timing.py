@@ -0,0 +1,52 @@
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.core import timing
+from app.utils.logging_utils import log_event
+
+def parse(header):
+    phases = {}
+    for part in header.split(", "):
+        name, *params = part.split(";")
+        phases[name] = dict(p.split("=", 1) for p in params)
+    return phases
+
+def build_app():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    timing.instrument_engine(engine.sync_engine)
+
+    async def fake_auth():
+        with timing.measure("auth"):
+            return {"username": "tester"}
+
+    app = FastAPI()
+    app.add_middleware(timing.ServerTimingMiddleware)
+
+    @app.get("/items")
+    @log_event("list_items")
+    async def items(user=Depends(fake_auth)):
+        async with engine.connect() as conn:
+            await conn.execute(text("select 1"))
+            await conn.execute(text("select 2"))
+        return [{"id": i} for i in range(10)]
+
+    return app
+
+@pytest.mark.asyncio
+async def test_server_timing_header_has_all_phases():
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as ac:
+        response = await ac.get("/items")
+    assert response.status_code == 200
+    phases = parse(response.headers["server-timing"])
+    assert {"auth", "db", "handler", "serialize", "log", "total"} <= set(phases)
+    assert phases["db"]["desc"] == '"2 queries"'
+    assert float(phases["total"]["dur"]) >= float(phases["handler"]["dur"]) >= float(phases["db"]["dur"])
+
+def test_recording_outside_a_request_is_a_noop():
+    assert timing.current() is None
+    with timing.measure("auth"):
+        pass
+    timing.record("db", 1.0)
+    assert timing.current() is None
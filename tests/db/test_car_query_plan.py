@@ -0,0 +1,50 @@
+import pytest
+from datetime import date
+from sqlalchemy import create_engine, select, text
+from app.db.base import Base
+from app.db.models.car_model import Car
+from app.db.models import claim_model, owner_model, policy_model  # registers the mappers car relates to
+from app.db.pagination import PageRequest, encode_cursor
+from app.db.repositories.car_repository import CAR_KEYSET, apply_filters
+from app.db.repositories.policy_repository import validity_query
+from app.schemas.car_schema import CarFilter
+
+@pytest.fixture(scope="module")
+def connection():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        yield conn
+
+def query_plan(conn, stmt) -> str:
+    sql = str(stmt.compile(conn, compile_kwargs={"literal_binds": True}))
+    return "\n".join(row[-1] for row in conn.execute(text("EXPLAIN QUERY PLAN " + sql)))
+
+@pytest.mark.parametrize("filters, index", [
+    (CarFilter(make="Dacia"), "ix_car_make_model_year"),
+    (CarFilter(make="Dacia", model="Logan", year_from=2010, year_to=2015), "ix_car_make_model_year"),
+    (CarFilter(year_from=2010, year_to=2015), "ix_car_year_of_manufacture_id"),
+    (CarFilter(owner_id=3), "ix_car_owner_id_id"),
+])
+def test_filters_use_index(connection, filters, index):
+    plan = query_plan(connection, apply_filters(select(Car), filters))
+    assert f"USING INDEX {index}" in plan
+    assert "SCAN car" not in plan
+
+def test_owner_filter_pages_in_index_order(connection):
+    page = PageRequest(limit=10, cursor=encode_cursor("id", [42]))
+    plan = query_plan(connection, CAR_KEYSET.apply(apply_filters(select(Car), CarFilter(owner_id=3)), page))
+    assert "USING INDEX ix_car_owner_id_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+def test_year_sort_pages_in_index_order(connection):
+    page = PageRequest(limit=10, cursor=encode_cursor("yearOfManufacture", [2010, 42]), sort="yearOfManufacture")
+    plan = query_plan(connection, CAR_KEYSET.apply(select(Car), page, nulls_first=True))
+    assert "ix_car_year_of_manufacture_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+def test_validity_is_one_lookup_and_one_index_probe(connection):
+    plan = query_plan(connection, validity_query(1, date(2025, 6, 1)))
+    assert "SEARCH car USING INTEGER PRIMARY KEY" in plan
+    assert "USING INDEX ix_insurance_policy_car_id_start_date_end_date" in plan
+    assert "SCAN" not in plan
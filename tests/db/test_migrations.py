@@ -0,0 +1,51 @@
+import os
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+
+ALEMBIC_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "alembic")
+
+@pytest.fixture
+def connection(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    with engine.connect() as conn:
+        yield conn
+    engine.dispose()
+
+def migrate(connection, direction, revision):
+    # No ini file, so env.py leaves the test run's logging alone
+    config = Config()
+    config.set_main_option("script_location", ALEMBIC_DIR)
+    config.attributes["connection"] = connection
+    direction(config, revision)
+    connection.commit()
+
+def index_names(connection, table):
+    rows = connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t"), {"t": table})
+    return {row[0] for row in rows}
+
+@pytest.mark.filterwarnings("ignore:Skipped unsupported reflection")
+def test_updated_at_upgrade_keeps_existing_rows_and_indexes(connection):
+    migrate(connection, command.upgrade, "74dbf4f56647")
+    connection.execute(text("INSERT INTO owner (id, name, email) VALUES (1, 'Ana', 'ana@example.com')"))
+    connection.execute(text("INSERT INTO car (id, vin, owner_id) VALUES (1, 'AAAAAAAAAAAAAAAAA', 1)"))
+    connection.execute(text("INSERT INTO insurance_policy (id, car_id, start_date, end_date) VALUES (1, 1, '2025-01-01', '2025-12-31')"))
+    connection.execute(text(
+        "INSERT INTO claim (id, car_id, claim_date, description, amount, created_at) "
+        "VALUES (1, 1, '2025-02-01', 'Dent', 10, '2025-02-01 00:00:00')"
+    ))
+    connection.commit()
+
+    migrate(connection, command.upgrade, "head")
+
+    for table in ("owner", "car", "insurance_policy", "claim"):
+        assert connection.execute(text(f"SELECT count(*) FROM {table} WHERE updated_at IS NULL")).scalar() == 0
+        assert f"ix_{table}_updated_at_id" in index_names(connection, table)
+    assert {"ix_owner_lower_name", "ix_owner_lower_email"} <= index_names(connection, "owner")
+    # NOT NULL with a database-side default for rows written outside the ORM
+    connection.execute(text("INSERT INTO owner (id, name) VALUES (2, 'Ion')"))
+    assert connection.execute(text("SELECT updated_at FROM owner WHERE id = 2")).scalar() is not None
+
+    migrate(connection, command.downgrade, "74dbf4f56647")
+    assert connection.execute(text("SELECT count(*) FROM car")).scalar() == 1
@@ -0,0 +1,54 @@
+from datetime import date
+from types import SimpleNamespace
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.db.models.policy_model import InsurancePolicy
+from app.db.models.car_model import Car
+from app.db.models import claim_model, owner_model  # registers the mappers policies relate to
+from app.db.pagination import Keyset, PageRequest, encode_cursor, decode_cursor
+
+KEYSET = Keyset(InsurancePolicy.id, {"endDate": InsurancePolicy.end_date})
+
+def test_cursor_roundtrip_is_bound_to_sort():
+    token = encode_cursor("endDate", ["2024-01-01", 7])
+    assert decode_cursor(token, "endDate") == ["2024-01-01", 7]
+    with pytest.raises(ValueError):
+        decode_cursor(token, "id")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", "id")
+
+def test_seek_predicate_instead_of_offset():
+    page = PageRequest(limit=10, cursor=encode_cursor("endDate", ["2024-01-01", 7]), sort="endDate")
+    sql = str(KEYSET.apply(InsurancePolicy.__table__.select(), page).compile(compile_kwargs={"literal_binds": True}))
+    assert "OFFSET" not in sql
+    assert "(insurance_policy.end_date, insurance_policy.id) > ('2024-01-01', 7)" in sql
+    assert "ORDER BY insurance_policy.end_date, insurance_policy.id" in sql
+    assert "LIMIT 11" in sql
+
+def test_since_is_an_inclusive_lower_bound():
+    page = PageRequest(limit=10, sort="endDate", since=date(2024, 1, 1))
+    sql = str(KEYSET.apply(InsurancePolicy.__table__.select(), page).compile(compile_kwargs={"literal_binds": True}))
+    assert "insurance_policy.end_date >= '2024-01-01'" in sql
+
+def test_page_trims_extra_row_and_builds_next_cursor():
+    rows = [SimpleNamespace(id=i, end_date=date(2024, 1, i)) for i in range(1, 4)]
+    page = PageRequest(limit=2, sort="endDate")
+    items, cursor = KEYSET.page(rows, page)
+    assert [r.id for r in items] == [1, 2]
+    assert decode_cursor(cursor, "endDate") == ["2024-01-02", 2]
+    assert KEYSET.page(rows[:2], page) == (rows[:2], None)
+
+def compile_postgres(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.asyncpg.dialect(), compile_kwargs={"literal_binds": True}))
+
+def test_postgres_seek_is_a_row_value_range():
+    page = PageRequest(limit=10, cursor=encode_cursor("endDate", ["2024-01-01", 7]), sort="endDate")
+    sql = compile_postgres(KEYSET.apply(InsurancePolicy.__table__.select(), page))
+    assert "WHERE (insurance_policy.end_date, insurance_policy.id) > ('2024-01-01', 7)" in sql
+    assert " OR " not in sql
+
+def test_postgres_seek_keeps_nulls_block_only_for_nullable_columns():
+    keyset = Keyset(Car.id, {"yearOfManufacture": Car.year_of_manufacture})
+    page = PageRequest(limit=10, cursor=encode_cursor("yearOfManufacture", [2010, 7]), sort="yearOfManufacture")
+    sql = compile_postgres(keyset.apply(Car.__table__.select(), page))
+    assert "(car.year_of_manufacture, car.id) > (2010, 7) OR car.year_of_manufacture IS NULL" in sql
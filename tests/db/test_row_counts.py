@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.db.base import Base
+from app.db.models.car_model import Car
+from app.db.models.owner_model import Owner
+from app.db.models.row_count_model import RowCount
+from app.db.models import claim_model, policy_model  # registers the mappers car relates to
+from app.db import row_counts
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    row_counts.install()
+    yield async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+
+async def test_counter_follows_inserts_deletes_and_rollbacks(session_factory):
+    async with session_factory() as session:
+        session.add_all(row_counts.counter_rows("owner") + row_counts.counter_rows("car"))
+        await session.commit()
+        owner = Owner(name="Ana")
+        session.add_all([owner, Car(vin="A" * 17, owner=owner), Car(vin="B" * 17, owner=owner)])
+        await session.commit()
+        assert await row_counts.count_rows(session, Car) == row_counts.TotalCount(2)
+
+        session.add(Car(vin="C" * 17, owner=owner))
+        await session.flush()
+        await session.rollback()
+        car = (await session.execute(select(Car).where(Car.vin == "A" * 17))).scalar_one()
+        await session.delete(car)
+        await session.commit()
+        assert (await row_counts.count_rows(session, Car)).value == 1
+        assert (await row_counts.count_rows(session, Owner)).value == 1
+
+async def test_falls_back_to_count_without_counter_or_with_filter(session_factory):
+    async with session_factory() as session:
+        owner = Owner(name="Ion")
+        session.add_all([owner, Car(vin="D" * 17, owner=owner, make="Dacia"), Car(vin="E" * 17, owner=owner)])
+        await session.commit()
+        total = await row_counts.count_rows(session, Car, estimate=True)
+        filtered = await row_counts.count_rows(session, Car, stmt=select(Car).where(Car.make == "Dacia"))
+    assert total == row_counts.TotalCount(2)
+    assert filtered == row_counts.TotalCount(1)
+    assert total.headers() == {"X-Total-Count": "2", "X-Total-Count-Estimated": "false"}
+
+async def test_counter_is_spread_over_slots_and_summed(session_factory, monkeypatch):
+    slots = iter(range(row_counts.ROW_COUNT_SLOTS))
+    monkeypatch.setattr(row_counts.random, "randrange", lambda n: next(slots))
+    async with session_factory() as session:
+        session.add_all(row_counts.counter_rows("owner", count=5))
+        await session.commit()
+        for i in range(3):
+            session.add(Owner(name=f"Owner {i}"))
+            await session.commit()
+        rows = (await session.execute(select(RowCount.slot, RowCount.count).where(RowCount.table_name == "owner").order_by(RowCount.slot))).all()
+        assert [tuple(row) for row in rows[:4]] == [(0, 6), (1, 1), (2, 1), (3, 0)]
+        assert (await row_counts.count_rows(session, Owner)).value == 8
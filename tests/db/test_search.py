@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.dialects import postgresql
+from app.db.base import Base
+from app.db.models.owner_model import Owner
+from app.db.models import car_model, claim_model, policy_model  # registers the mappers owner relates to
+from app.db.search import escape_like, prefix_match
+
+@pytest.fixture(scope="module")
+def connection():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        yield conn
+
+def test_escape_like():
+    assert escape_like("50%_a\\b") == "50\\%\\_a\\\\b"
+
+def test_postgres_prefix_is_literal_like():
+    stmt = select(Owner.id).where(prefix_match(func.lower(Owner.name), "a_b", "postgresql"))
+    # What the driver receives: the pattern is inlined, not sent as a parameter
+    compiled = stmt.compile(dialect=postgresql.asyncpg.dialect(), compile_kwargs={"render_postcompile": True})
+    assert "lower(owner.name) LIKE 'a\\_b%' ESCAPE" in str(compiled)
+    assert compiled.params == {}
+
+@pytest.mark.parametrize("column, index", [
+    (Owner.name, "ix_owner_lower_name"),
+    (Owner.email, "ix_owner_lower_email"),
+])
+def test_sqlite_prefix_is_index_range(connection, column, index):
+    stmt = select(Owner).where(prefix_match(func.lower(column), "ana", "sqlite"))
+    sql = str(stmt.compile(connection, compile_kwargs={"literal_binds": True}))
+    plan = "\n".join(row[-1] for row in connection.execute(text("EXPLAIN QUERY PLAN " + sql)))
+    assert f"USING INDEX {index} (<expr>>? AND <expr><?)" in plan
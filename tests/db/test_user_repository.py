@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.db.base import Base
+from app.db.models.user_model import User
+from app.db.repositories.user_repository import UserRepository
+from app.auth.principal_cache import principal_cache
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+    principal_cache.clear()
+
+async def test_update_user_merges_detached_user_and_invalidates_cache(session_factory):
+    async with session_factory() as session:
+        user = User(username="ana", email="ana@example.com", hashed_password="x")
+        session.add(user)
+        await session.commit()
+    principal_cache.set("ana", user)
+
+    # Detached copy, as built by the service layer
+    changed = User(id=user.id, username="ana2", email="ana@example.com", hashed_password="x")
+    async with session_factory() as session:
+        updated = await UserRepository(session).update_user(changed)
+        assert updated.username == "ana2"
+        assert updated in session
+    assert principal_cache.get("ana") is None
+    async with session_factory() as session:
+        assert (await UserRepository(session).get_user(user.id)).username == "ana2"
@@ -87,3 +87,64 @@ async def test_policy_expiry_worker_start_and_stop(mock_update_policy, mock_get_
     mock_log_info.assert_any_call("policy_expiry_worker_starting", tz=pc.TIMEZONE, interval_min=pc.JOB_INTERVAL_MINUTES)
     mock_log_info.assert_any_call("policy_expiry_worker_started")
 
+
+@pytest.mark.asyncio
+async def test_purge_revoked_tokens_deletes_only_expired():
+    from datetime import timedelta
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from app.db.base import Base
+    from app.db.models.revoked_token_model import RevokedToken
+    from app.utils.dates import utcnow_naive
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with session_factory() as session:
+        now = utcnow_naive()
+        session.add_all([
+            RevokedToken(jti="expired", expires_at=now - timedelta(minutes=1)),
+            RevokedToken(jti="active", expires_at=now + timedelta(minutes=30)),
+        ])
+        await session.commit()
+
+    with patch("jobs.policy_check.AsyncSessionLocal", session_factory), patch("jobs.policy_check.log_info") as mock_log_info:
+        await policy_check.purge_revoked_tokens()
+
+    async with session_factory() as session:
+        assert (await session.execute(select(RevokedToken.jti))).scalars().all() == ["active"]
+    mock_log_info.assert_called_once_with("revoked_tokens_purged", count=1)
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_purge_refresh_tokens_deletes_only_expired():
+    from datetime import timedelta
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from app.db.base import Base
+    from app.db.models.refresh_token_model import RefreshToken
+    from app.db.models.user_model import User
+    from app.utils.dates import utcnow_naive
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with session_factory() as session:
+        now = utcnow_naive()
+        user = User(username="ana", email="ana@example.com", hashed_password="x")
+        session.add_all([
+            RefreshToken(token_hash="a" * 64, family_id="f1", user=user, expires_at=now - timedelta(minutes=1), revoked_at=now),
+            RefreshToken(token_hash="b" * 64, family_id="f1", user=user, expires_at=now - timedelta(days=1)),
+            RefreshToken(token_hash="c" * 64, family_id="f2", user=user, expires_at=now + timedelta(days=30)),
+        ])
+        await session.commit()
+
+    with patch("jobs.policy_check.AsyncSessionLocal", session_factory), patch("jobs.policy_check.log_info") as mock_log_info:
+        await policy_check.purge_refresh_tokens()
+
+    async with session_factory() as session:
+        assert (await session.execute(select(RefreshToken.token_hash))).scalars().all() == ["c" * 64]
+    mock_log_info.assert_called_once_with("refresh_tokens_purged", count=2)
+    await engine.dispose()
@@ -127,3 +127,31 @@ async def test_delete_car_not_found():
     with pytest.raises(ValueError, match="Car with ID 11 does not exist."):
         await car_service.delete_car(11)
     car_repository.get.assert_awaited_once_with(11)
+
+def test_projection_selects_only_requested_columns():
+    from app.service.car_service import CAR_FIELDS
+    sql = str(CAR_FIELDS.statement(CAR_FIELDS.parse("id,vin")))
+    assert "JOIN" not in sql
+    assert "car.make" not in sql
+    joined = str(CAR_FIELDS.statement(CAR_FIELDS.parse("id,owner.name")))
+    assert "JOIN owner" in joined
+    assert "owner.email" not in joined
+
+def test_projection_rejects_unknown_fields():
+    from app.service.car_service import CAR_FIELDS
+    with pytest.raises(ValueError):
+        CAR_FIELDS.parse("owner.password")
+    with pytest.raises(ValueError):
+        CAR_FIELDS.parse(" , ")
+    assert CAR_FIELDS.parse("owner,owner.name") == {"owner": ["name", "email", "id", "updatedAt"]}
+
+
+@pytest.mark.asyncio
+async def test_search_cars_by_vin_normalizes_fragment():
+    car_repository = AsyncMock()
+    car_service = CarService(car_repository)
+    car_repository.search_by_vin.return_value = []
+    await car_service.search_cars_by_vin("  wvw1k ", 20)
+    car_repository.search_by_vin.assert_awaited_once_with("WVW1K", 20)
+    with pytest.raises(ValueError):
+        await car_service.search_cars_by_vin(" ab ", 20)
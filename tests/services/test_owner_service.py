@@ -69,3 +69,11 @@ class TestOwnerService:
         owner_repository.list.assert_awaited_once()
 
 
+
+    @pytest.mark.asyncio
+    async def test_search_owners_normalizes_terms(self, owner_service, owner_repository):
+        owner_repository.search.return_value = []
+        await owner_service.search_owners(" Pop ", " ANA@Example.com", 20)
+        owner_repository.search.assert_awaited_once_with("pop", "ana@example.com", 20)
+        with pytest.raises(ValueError):
+            await owner_service.search_owners("  ", None, 20)
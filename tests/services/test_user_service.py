@@ -1,6 +1,7 @@
 
 import pytest
 from unittest.mock import AsyncMock
+from sqlalchemy.exc import IntegrityError
 from app.service.user_service import UserService
 from app.schemas.user_schema import UserCreate
 
@@ -42,12 +43,13 @@ async def test_create_user_success():
     result = await user_service.create_user(user)
     assert result == {"id": 2, "username": "newuser"}
     repo.create_user.assert_awaited_once_with(user)
+    repo.get_user_by_username.assert_not_awaited()
+    repo.get_user_by_email.assert_not_awaited()
 
 @pytest.mark.asyncio
 async def test_create_user_username_taken():
     repo = AsyncMock()
-    repo.get_user_by_username = AsyncMock(return_value={"id": 1, "username": "existinguser"})
-    repo.get_user_by_email = AsyncMock(return_value=None)
+    repo.create_user = AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed: user.username")))
     user_service = UserService(repo)
     user = UserCreate(username="existinguser", email="new@example.com", password="pass")
     with pytest.raises(ValueError) as exc:
@@ -57,10 +59,87 @@ async def test_create_user_username_taken():
 @pytest.mark.asyncio
 async def test_create_user_email_taken():
     repo = AsyncMock()
+    repo.create_user = AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception('duplicate key value violates unique constraint "user_email_key"')))
     repo.get_user_by_username = AsyncMock(return_value=None)
-    repo.get_user_by_email = AsyncMock(return_value={"id": 1, "email": "existing@example.com"})
     user_service = UserService(repo)
     user = UserCreate(username="newuser", email="existing@example.com", password="pass")
     with pytest.raises(ValueError) as exc:
         await user_service.create_user(user)
-    assert "Email existing@example.com is already registered." in str(exc.value)
\ No newline at end of file
+    assert "Email existing@example.com is already registered." in str(exc.value)
+@pytest.mark.asyncio
+async def test_update_user_success():
+    repo = AsyncMock()
+    user = type("UserObj", (), {"id": 1, "username": "testuser"})()
+    repo.get_user = AsyncMock(return_value=user)
+    repo.update_user = AsyncMock(return_value=user)
+    user_service = UserService(repo)
+    result = await user_service.update_user(user)
+    assert result is user
+    repo.update_user.assert_awaited_once_with(user)
+
+@pytest.mark.asyncio
+async def test_update_user_not_found():
+    repo = AsyncMock()
+    repo.get_user = AsyncMock(return_value=None)
+    user_service = UserService(repo)
+    user = type("UserObj", (), {"id": 99, "username": "missing"})()
+    with pytest.raises(ValueError) as exc:
+        await user_service.update_user(user)
+    assert "User with ID 99 does not exist." in str(exc.value)
+
+@pytest.mark.asyncio
+async def test_deactivate_user():
+    repo = AsyncMock()
+    repo.set_active = AsyncMock(return_value={"id": 1, "username": "testuser"})
+    user_service = UserService(repo)
+    await user_service.deactivate_user("testuser")
+    repo.set_active.assert_awaited_once_with("testuser", False)
+
+@pytest.mark.asyncio
+async def test_deactivate_user_not_found():
+    repo = AsyncMock()
+    repo.set_active = AsyncMock(return_value=None)
+    user_service = UserService(repo)
+    with pytest.raises(ValueError):
+        await user_service.deactivate_user("missing")
+
+
+@pytest.mark.asyncio
+async def test_create_users_bulk():
+    repo = AsyncMock()
+    repo.create_users = AsyncMock(return_value=2)
+    user_service = UserService(repo)
+    users = [UserCreate(username=f"u{i}", email=f"u{i}@example.com", password="pass") for i in range(2)]
+    assert await user_service.create_users(users) == 2
+    repo.create_users.assert_awaited_once_with(users)
+
+@pytest.mark.asyncio
+async def test_create_users_bulk_duplicate_in_batch():
+    repo = AsyncMock()
+    user_service = UserService(repo)
+    users = [UserCreate(username="same", email=f"u{i}@example.com", password="pass") for i in range(2)]
+    with pytest.raises(ValueError) as exc:
+        await user_service.create_users(users)
+    assert "appears more than once" in str(exc.value)
+    repo.create_users.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_create_users_bulk_existing_email():
+    repo = AsyncMock()
+    repo.create_users = AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed: user.email")))
+    user_service = UserService(repo)
+    users = [UserCreate(username="a", email="a@example.com", password="pass")]
+    with pytest.raises(ValueError) as exc:
+        await user_service.create_users(users)
+    assert "emails are already registered" in str(exc.value)
+
+@pytest.mark.asyncio
+async def test_create_user_both_taken_reports_username():
+    repo = AsyncMock()
+    repo.create_user = AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed: user.email")))
+    repo.get_user_by_username = AsyncMock(return_value={"id": 1, "username": "existinguser"})
+    user_service = UserService(repo)
+    user = UserCreate(username="existinguser", email="existing@example.com", password="pass")
+    with pytest.raises(ValueError) as exc:
+        await user_service.create_user(user)
+    assert "Username existinguser is already taken." in str(exc.value)
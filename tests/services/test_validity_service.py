@@ -1,48 +1,59 @@
 import pytest
 import pytest_asyncio
-from unittest.mock import AsyncMock, patch
 from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.db.base import Base
+from app.db.models.car_model import Car
+from app.db.models.owner_model import Owner
+from app.db.models.policy_model import InsurancePolicy
+from app.db.models import claim_model  # registers the mappers car relates to
 from app.service.validity_service import ValidityService
 
-class DummyPolicy:
-    def __init__(self, start_date, end_date, logged_expiry_at=None):
-        self.start_date = start_date
-        self.end_date = end_date
-        self.logged_expiry_at = logged_expiry_at
-
 @pytest.mark.asyncio
 class TestValidityService:
     @pytest_asyncio.fixture
-    def session(self):
-        return AsyncMock()
+    async def session(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as session:
+            owner = Owner(name="Ana")
+            session.add(Car(id=1, vin="A" * 17, owner=owner))
+            await session.commit()
+            yield session
+        await engine.dispose()
 
     @pytest_asyncio.fixture
     def validity_service(self, session):
         return ValidityService(session)
 
+    async def add_policy(self, session, start_date, end_date, logged_expiry_at=None):
+        session.add(InsurancePolicy(car_id=1, provider="Allianz", start_date=start_date, end_date=end_date, logged_expiry_at=logged_expiry_at))
+        await session.commit()
+
     @pytest.mark.asyncio
     async def test_is_valid_true(self, validity_service, session):
-        valid_policy = DummyPolicy(date(2025, 1, 1), date(2025, 12, 31))
-        with patch("app.db.repositories.policy_repository.PolicyRepository.get_policies_by_car_id", AsyncMock(return_value=[valid_policy])):
-            result = await validity_service.is_valid(1, date(2025, 6, 1))
-            assert result is True
+        await self.add_policy(session, date(2025, 1, 1), date(2025, 12, 31))
+        assert await validity_service.is_valid(1, date(2025, 6, 1)) is True
+        assert await validity_service.is_valid(1, date(2025, 12, 31)) is True
 
     @pytest.mark.asyncio
     async def test_is_valid_false_no_policies(self, validity_service, session):
-        with patch("app.db.repositories.policy_repository.PolicyRepository.get_policies_by_car_id", AsyncMock(return_value=[])):
-            result = await validity_service.is_valid(1, date(2025, 6, 1))
-            assert result is False
+        result = await validity_service.is_valid(1, date(2025, 6, 1))
+        assert result is False
 
     @pytest.mark.asyncio
     async def test_is_valid_false_expired_policies(self, validity_service, session):
-        expired_policy = DummyPolicy(date(2024, 1, 1), date(2024, 12, 31), logged_expiry_at=date(2024, 12, 31))
-        with patch("app.db.repositories.policy_repository.PolicyRepository.get_policies_by_car_id", AsyncMock(return_value=[expired_policy])):
-            result = await validity_service.is_valid(1, date(2025, 6, 1))
-            assert result is False
+        await self.add_policy(session, date(2025, 1, 1), date(2025, 12, 31), logged_expiry_at=date(2025, 3, 1))
+        result = await validity_service.is_valid(1, date(2025, 6, 1))
+        assert result is False
 
     @pytest.mark.asyncio
     async def test_is_valid_false_outside_interval(self, validity_service, session):
-        policy = DummyPolicy(date(2025, 1, 1), date(2025, 3, 31))
-        with patch("app.db.repositories.policy_repository.PolicyRepository.get_policies_by_car_id", AsyncMock(return_value=[policy])):
-            result = await validity_service.is_valid(1, date(2025, 6, 1))
-            assert result is False
+        await self.add_policy(session, date(2025, 1, 1), date(2025, 3, 31))
+        result = await validity_service.is_valid(1, date(2025, 6, 1))
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_is_valid_none_for_missing_car(self, validity_service, session):
+        assert await validity_service.is_valid(999, date(2025, 6, 1)) is None
@@ -0,0 +1,73 @@
+import pytest
+from app.utils.cache import TTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_get_set_hit_miss():
+    cache = TTLCache(maxsize=10, ttl=5)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+def test_entry_expires_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+def test_per_entry_ttl_override():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=100, clock=clock)
+    cache.set("a", 1, ttl=1)
+    clock.now = 2
+    assert cache.get("a") is None
+
+def test_non_positive_ttl_is_not_stored():
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("a", 1, ttl=0)
+    assert "a" not in cache
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.evictions == 1
+
+def test_invalidate_and_invalidate_where():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+    assert cache.invalidate_where(lambda k, v: v["id"] == 2) == 1
+    assert len(cache) == 0
+
+def test_stats():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["size"] == 1
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0, ttl=1)
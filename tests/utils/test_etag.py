@@ -0,0 +1,29 @@
+from starlette.requests import Request
+from app.utils.etag import collection_etag, entity_etag, matching_etag, not_modified
+
+def request_with(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+def test_matching_etag():
+    etag = entity_etag("abc")
+    assert matching_etag(request_with(), etag) is None
+    assert matching_etag(request_with('"abc"'), etag) == '"abc"'
+    assert matching_etag(request_with('"old", W/"abc"'), etag) == 'W/"abc"'
+    assert matching_etag(request_with('"abc-gzip"'), etag) == '"abc-gzip"'
+    assert matching_etag(request_with("*"), etag) == etag
+    assert matching_etag(request_with('"abcd"'), etag) is None
+    assert matching_etag(request_with("*"), None) is None
+
+def test_collection_etag_tracks_membership_not_order():
+    base = collection_etag([(1, "a"), (2, "b")])
+    assert collection_etag([(2, "b"), (1, "a")]) == base
+    assert collection_etag([(1, "a"), (2, "c")]) != base
+    assert collection_etag([(1, "a")]) != base
+    assert base.startswith('"') and base.endswith('"')
+
+def test_not_modified_has_no_body():
+    response = not_modified('"abc"')
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"abc"'
+    assert response.body == b""
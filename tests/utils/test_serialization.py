@@ -0,0 +1,39 @@
+import json
+from datetime import date
+from decimal import Decimal
+from typing import List
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from app.db.models.car_model import Car
+from app.db.models.owner_model import Owner
+from app.db.models.claim_model import Claim
+from app.db.models import policy_model  # registers the mappers Car relates to
+from app.schemas.car_schema import CarWithOwnerResponse
+from app.schemas.claim_schema import ClaimResponse
+from app.utils.serialization import dumps, orm_serializer
+
+def pydantic_path(schema, rows):
+    adapter = TypeAdapter(List[schema])
+    return jsonable_encoder(adapter.validate_python(rows, from_attributes=True), by_alias=True)
+
+def test_orm_rows_match_response_model_output():
+    owner = Owner(id=1, name="Ana", email="ana@example.com")
+    cars = [
+        Car(id=1, vin="VIN00000000000001", make="Dacia", model=None, year_of_manufacture=2020, owner_id=1, owner=owner),
+        Car(id=2, vin="VIN00000000000002", make=None, model="X", year_of_manufacture=None, owner_id=1, owner=owner),
+    ]
+    assert json.loads(dumps(CarWithOwnerResponse, cars)) == pydantic_path(CarWithOwnerResponse, cars)
+
+def test_decimal_amounts_and_dates():
+    claims = [Claim(id=3, car_id=1, claim_date=date(2024, 5, 1), description="dent", amount=Decimal("1250.50"))]
+    assert json.loads(dumps(ClaimResponse, claims)) == [
+        {"carId": 1, "claimDate": "2024-05-01", "description": "dent", "amount": 1250.5, "id": 3, "updatedAt": None}
+    ]
+    assert json.loads(dumps(ClaimResponse, claims)) == pydantic_path(ClaimResponse, claims)
+
+def test_dicts_go_through_the_schema():
+    row = {"id": 1, "vin": "V", "ownerId": 2, "owner": {"id": 2, "name": "Ion"}}
+    assert orm_serializer(CarWithOwnerResponse)(row) == {
+        "vin": "V", "make": None, "model": None, "yearOfManufacture": None,
+        "ownerId": 2, "id": 1, "updatedAt": None, "owner": {"name": "Ion", "email": None, "id": 2, "updatedAt": None},
+    }